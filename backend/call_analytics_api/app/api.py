@@ -30,7 +30,7 @@ from backend.call_analytics_api.app.repos.tasks import (
     get_tasks_for_person,
 )
 from backend.call_analytics_api.app.repos.offers import get_offers_for_person
-from backend.common.db import get_session
+from backend.call_analytics_api.app.db import get_api_session
 from backend.common.models_db import Call, DialogueTurn, CallSummary
 
 # Create router with API key protection for all endpoints except health checks
@@ -94,7 +94,7 @@ async def list_calls_endpoint(
     direction: str | None = Query(None, description="Filter by call direction"),
     limit: int = Query(50, le=100, description="Number of records to return"),
     offset: int = Query(0, description="Offset for pagination"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """List calls with optional filtering - optimized for dashboard queries."""
     return await list_calls(db, agent_id, direction, limit, offset)
@@ -103,7 +103,7 @@ async def list_calls_endpoint(
 @router.get("/calls/{call_id}", response_model=CallDetailsOut)
 async def get_call_endpoint(
     call_id: int,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get detailed call information with dialogue turns and summaries."""
     call_details = await get_call_details(db, call_id)
@@ -118,7 +118,7 @@ async def list_customers_endpoint(
     query: str | None = Query(None, description="Search by name"),
     limit: int = Query(50, le=100, description="Number of records to return"),
     offset: int = Query(0, description="Offset for pagination"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """List customers/people with optional search."""
     return await list_customers(db, query, limit, offset)
@@ -127,7 +127,7 @@ async def list_customers_endpoint(
 @router.get("/customers/{person_id}", response_model=PersonDetailsOut)
 async def get_customer_endpoint(
     person_id: int,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get detailed customer/person information."""
     customer = await get_customer_details(db, person_id)
@@ -141,7 +141,7 @@ async def get_customer_tasks_endpoint(
     person_id: int,
     limit: int = Query(50, le=100),
     offset: int = Query(0),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get tasks for a specific customer."""
     return await get_tasks_for_person(db, person_id, limit, offset)
@@ -152,7 +152,7 @@ async def get_customer_offers_endpoint(
     person_id: int,
     limit: int = Query(50, le=100),
     offset: int = Query(0),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get offers for a specific customer."""
     return await get_offers_for_person(db, person_id, limit, offset)
@@ -166,7 +166,7 @@ async def list_tasks_endpoint(
     owner_agent_id: int | None = Query(None, description="Filter by owner agent ID"),
     limit: int = Query(50, le=100, description="Number of records to return"),
     offset: int = Query(0, description="Offset for pagination"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """List tasks with optional filtering."""
     return await list_tasks(db, status, person_id, owner_agent_id, limit, offset)
@@ -175,7 +175,7 @@ async def list_tasks_endpoint(
 @router.get("/tasks/{task_id}", response_model=TaskOut)
 async def get_task_endpoint(
     task_id: int,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get detailed task information."""
     task = await get_task_details(db, task_id)
@@ -188,7 +188,7 @@ async def get_task_endpoint(
 async def update_task_endpoint(
     task_id: int,
     update_data: TaskUpdateIn,
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Update task fields (status, due_at, owner, etc)."""
     task = await update_task(db, task_id, update_data)
@@ -200,7 +200,7 @@ async def update_task_endpoint(
 @router.get("/analytics/dashboard")
 async def get_analytics_dashboard(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get complete analytics dashboard data."""
     # Get all analytics data in parallel
@@ -232,7 +232,7 @@ async def get_analytics_dashboard(
 @router.get("/analytics/kpi")
 async def get_kpi_metrics(
     days_back: int = Query(7, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get key performance indicators."""
     return await AnalyticsRepository.get_kpi_metrics(db, days_back)
@@ -241,7 +241,7 @@ async def get_kpi_metrics(
 @router.get("/analytics/call-volume")
 async def get_call_volume_trend(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get daily call volume trend data."""
     return await AnalyticsRepository.get_daily_call_volume(db, days_back)
@@ -250,7 +250,7 @@ async def get_call_volume_trend(
 @router.get("/analytics/hourly-distribution")
 async def get_hourly_distribution(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get hourly call distribution (peak hours)."""
     return await AnalyticsRepository.get_hourly_call_distribution(db, days_back)
@@ -259,7 +259,7 @@ async def get_hourly_distribution(
 @router.get("/analytics/sentiment")
 async def get_sentiment_analysis(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get sentiment distribution analysis."""
     return await AnalyticsRepository.get_sentiment_distribution(db, days_back)
@@ -268,7 +268,7 @@ async def get_sentiment_analysis(
 @router.get("/analytics/categories")
 async def get_call_categories(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get call category/topic distribution."""
     return await AnalyticsRepository.get_call_categories(db, days_back)
@@ -277,7 +277,7 @@ async def get_call_categories(
 @router.get("/analytics/resolution-time")
 async def get_resolution_time_buckets(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get call resolution time distribution buckets."""
     return await AnalyticsRepository.get_resolution_time_buckets(db, days_back)
@@ -287,7 +287,7 @@ async def get_resolution_time_buckets(
 async def get_top_agents(
     limit: int = Query(10, description="Number of top agents to return"),
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get top performing agents."""
     return await AnalyticsRepository.get_top_performing_agents(db, limit, days_back)
@@ -296,7 +296,7 @@ async def get_top_agents(
 @router.get("/analytics/topics")
 async def get_common_topics(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get common call topics/categories."""
     return await AnalyticsRepository.get_common_topics(db, days_back)
@@ -305,7 +305,7 @@ async def get_common_topics(
 @router.get("/analytics/ratings")
 async def get_customer_ratings(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get customer satisfaction ratings distribution."""
     return await AnalyticsRepository.get_customer_ratings_distribution(db, days_back)
@@ -314,7 +314,7 @@ async def get_customer_ratings(
 @router.get("/analytics/operational")
 async def get_operational_metrics(
     days_back: int = Query(30, description="Number of days to look back"),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_api_session)
 ):
     """Get operational metrics (service level, occupancy, abandonment)."""
     return await AnalyticsRepository.get_operational_metrics(db, days_back)
@@ -0,0 +1,59 @@
+"""Database session factory for the call analytics API.
+
+API reads only ever show calls that are done or in flight, so that filter
+is attached once to the API's sessions instead of to every query. The
+postprocess worker keeps using the unfiltered sessions from
+``backend.common.db``.
+"""
+
+from typing import AsyncGenerator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from backend.common.db import engine
+from backend.common.models_db import Call
+
+# Call statuses visible through the API
+VISIBLE_CALL_STATUSES = ("completed", "processing")
+
+# Execution option that disables the status filter for a single statement,
+# e.g. ``select(...).execution_options(include_all_calls=True)``
+INCLUDE_ALL_CALLS = "include_all_calls"
+
+
+class ApiSession(Session):
+    """Sync session class behind the API's AsyncSessions."""
+
+
+@event.listens_for(ApiSession, "do_orm_execute")
+def _filter_visible_calls(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_ALL_CALLS, False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                Call,
+                Call.status.in_(VISIBLE_CALL_STATUSES),
+                include_aliases=True,
+            )
+        )
+
+
+ApiSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=ApiSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+
+async def get_api_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for FastAPI to get a status-filtered database session."""
+    async with ApiSessionLocal() as session:
+        yield session
@@ -4,9 +4,10 @@ import logging
 import asyncio
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from backend.call_analytics_api.app.api import router as jobs_router
-from backend.common.db import db_settings
+from backend.common.db import db_settings, health_check as db_health_check, pool_status
 from backend.common.logging_utils import configure_logging
 from backend.common.config import get_settings
 
@@ -63,4 +64,13 @@ def health_check():
 
 @app.get("/v1/health")
 def v1_health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/v1/health/db")
+async def v1_db_health_check():
+    healthy = await db_health_check()
+    return JSONResponse(
+        status_code=200 if healthy else 503,
+        content={"status": "healthy" if healthy else "unhealthy", "pool": pool_status()},
+    )
@@ -14,6 +14,7 @@ from backend.common.models_db import (
     Agent,
     DialogueTurn,
     CallSummary,
+    CallInsights,
 )
 
 
@@ -31,7 +32,9 @@ class AnalyticsRepository:
             func.count(Call.id).label('total_calls'),
             func.avg(Call.duration_sec).label('avg_duration_sec'),
             func.avg(Call.sentiment_score).label('avg_sentiment_score'),
-            func.count(case((Call.resolution.isnot(None), 1))).label('resolved_calls'),
+            func.count(case((CallInsights.resolution.isnot(None), 1))).label('resolved_calls'),
+        ).select_from(Call).outerjoin(
+            CallInsights, CallInsights.call_id == Call.id
         ).where(Call.created_at >= cutoff_date)
         
         # Previous period query for comparison
@@ -376,7 +379,10 @@ class AnalyticsRepository:
         abandonment_query = select(
             func.count(case((Call.status == 'failed', 1))).label('abandoned'),
             func.count(Call.id).label('total')
-        ).where(Call.created_at >= cutoff_date)
+        ).where(Call.created_at >= cutoff_date).execution_options(
+            # Failed calls are hidden from API sessions by default
+            include_all_calls=True
+        )
         
         abandon_result = await db.execute(abandonment_query)
         abandon_row = abandon_result.fetchone()
@@ -1,7 +1,7 @@
 """Repository layer for call-related database operations."""
 
 from typing import List, Optional
-from sqlalchemy import select, desc, func
+from sqlalchemy import desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -128,6 +128,65 @@ async def list_calls(
     return CallListResponse(items=items, total_count=total_count)
 
 
+async def paginate_calls_for_agent(
+    db: AsyncSession,
+    agent_id: int,
+    before_id: Optional[int] = None,
+    limit: int = 50,
+) -> Optional[List[Call]]:
+    """Page through an agent's calls, newest first.
+
+    Keyset pagination on (started_at DESC NULLS LAST, id DESC), matching
+    idx_calls_agent_started: pass the id of the last call on the previous
+    page as ``before_id``. Calls without started_at come after all dated
+    calls. Returns None if ``before_id`` is not one of this agent's calls.
+    """
+    base = select(Call).where(Call.agent_fk == agent_id)
+    
+    cursor_started_at = None
+    if before_id is not None:
+        cursor_result = await db.execute(
+            select(Call.started_at).where(
+                Call.id == before_id,
+                Call.agent_fk == agent_id,
+            )
+        )
+        cursor_row = cursor_result.one_or_none()
+        if cursor_row is None:
+            return None
+        cursor_started_at = cursor_row.started_at
+    
+    calls: List[Call] = []
+    
+    # Dated calls first; a row-value comparison keeps this a single index range
+    if before_id is None or cursor_started_at is not None:
+        dated_query = (
+            base.where(Call.started_at.is_not(None))
+            .order_by(Call.started_at.desc(), Call.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            dated_query = dated_query.where(
+                tuple_(Call.started_at, Call.id) < tuple_(cursor_started_at, before_id)
+            )
+        dated_result = await db.execute(dated_query)
+        calls.extend(dated_result.scalars().all())
+    
+    # Top the page up with undated calls once the dated ones run out
+    if len(calls) < limit:
+        undated_query = (
+            base.where(Call.started_at.is_(None))
+            .order_by(Call.id.desc())
+            .limit(limit - len(calls))
+        )
+        if before_id is not None and cursor_started_at is None:
+            undated_query = undated_query.where(Call.id < before_id)
+        undated_result = await db.execute(undated_query)
+        calls.extend(undated_result.scalars().all())
+    
+    return calls
+
+
 async def get_call_details(db: AsyncSession, call_id: int) -> Optional[CallDetailsOut]:
     """Get detailed call information with dialogue turns, summaries, and business objects."""
     # Fetch the call with relationships
@@ -135,6 +194,7 @@ async def get_call_details(db: AsyncSession, call_id: int) -> Optional[CallDetai
         select(Call)
         .options(
             joinedload(Call.person),
+            joinedload(Call.insights),
             selectinload(Call.dialogue_turns),
             selectinload(Call.summaries),
         )
@@ -179,6 +239,8 @@ async def get_call_details(db: AsyncSession, call_id: int) -> Optional[CallDetai
         ExtractedFactOut.model_validate(ef) for ef in extracted_facts_db
     ]
     
+    insights = call.insights
+    
     # Convert to Pydantic model
     return CallDetailsOut(
         id=call.id,
@@ -206,8 +268,8 @@ async def get_call_details(db: AsyncSession, call_id: int) -> Optional[CallDetai
         offers=offers,
         product_mentions=product_mentions,
         extracted_facts=extracted_facts,
-        entities=call.entities,
-        intent=call.intent,
-        resolution=call.resolution,
-        confidence_score=call.confidence_score,
+        entities=insights.entities if insights else None,
+        intent=insights.intent if insights else None,
+        resolution=insights.resolution if insights else None,
+        confidence_score=insights.confidence_score if insights else None,
     )
\ No newline at end of file
@@ -46,11 +46,12 @@ async def list_customers(
         primary_phone = await _get_primary_identifier(db, person.id, "phone")
         primary_email = await _get_primary_identifier(db, person.id, "email")
         
-        # Get call count
-        call_count_result = await db.execute(
-            select(func.count(Call.id)).where(Call.person_id == person.id)
-        )
-        call_count = call_count_result.scalar() or 0
+        # Get call count and last contact date in one aggregate
+        call_stats = (await db.execute(
+            select(func.count(Call.id), func.max(Call.created_at))
+            .where(Call.person_id == person.id)
+        )).one()
+        call_count, last_contact_at = call_stats[0] or 0, call_stats[1]
         
         # Get open tasks count
         open_tasks_result = await db.execute(
@@ -61,15 +62,6 @@ async def list_customers(
         )
         open_tasks_count = open_tasks_result.scalar() or 0
         
-        # Get last contact date
-        last_call_result = await db.execute(
-            select(Call.created_at)
-            .where(Call.person_id == person.id)
-            .order_by(desc(Call.created_at))
-            .limit(1)
-        )
-        last_contact_at = last_call_result.scalar_one_or_none()
-        
         # Compute display label
         display_label = person.full_name or primary_phone or f"Customer #{person.id}"
         
@@ -156,27 +148,11 @@ async def get_customer_details(
     )
     organization = org_result.scalar_one_or_none()
     
-    # Get call statistics
-    call_count_result = await db.execute(
-        select(func.count(Call.id)).where(Call.person_id == person_id)
-    )
-    call_count = call_count_result.scalar() or 0
-    
-    first_call_result = await db.execute(
-        select(Call.created_at)
+    # Get call statistics in one aggregate (index-only on calls(person_id, created_at))
+    call_count, first_contact_at, last_contact_at = (await db.execute(
+        select(func.count(Call.id), func.min(Call.created_at), func.max(Call.created_at))
         .where(Call.person_id == person_id)
-        .order_by(Call.created_at)
-        .limit(1)
-    )
-    first_contact_at = first_call_result.scalar_one_or_none()
-    
-    last_call_result = await db.execute(
-        select(Call.created_at)
-        .where(Call.person_id == person_id)
-        .order_by(desc(Call.created_at))
-        .limit(1)
-    )
-    last_contact_at = last_call_result.scalar_one_or_none()
+    )).one()
     
     # Get task statistics
     open_tasks_result = await db.execute(
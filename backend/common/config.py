@@ -13,6 +13,11 @@ class Settings(BaseSettings):
         description="Redis connection URL.",
         env="REDIS_URL",
     )
+    redis_pool_size: int = Field(
+        default=50,
+        description="Maximum Redis connections per process; callers block when all are in use.",
+        env="REDIS_POOL_SIZE",
+    )
     job_list_limit: int = Field(
         default=DEFAULT_JOB_LIST_LIMIT,
         description="Maximum number of jobs to return when listing.",
@@ -20,9 +25,19 @@ class Settings(BaseSettings):
     )
     queue_poll_timeout: int = Field(
         default=5,
-        description="Seconds for Redis BLPOP timeout in workers.",
+        description="Seconds a worker blocks waiting for new queue messages.",
         env="QUEUE_POLL_TIMEOUT",
     )
+    queue_read_count: int = Field(
+        default=1,
+        description="Messages a worker claims per read; keep low for long-running jobs.",
+        env="QUEUE_READ_COUNT",
+    )
+    queue_claim_idle_ms: int = Field(
+        default=30 * 60 * 1000,
+        description="Milliseconds before an unacknowledged message is redelivered to another worker.",
+        env="QUEUE_CLAIM_IDLE_MS",
+    )
     service_name: str = Field(
         default="call_analytics_api",
         description="Friendly name of the running service for logging.",
@@ -33,6 +48,11 @@ class Settings(BaseSettings):
         description="Directory for shared audio/storage assets.",
         env="STORAGE_DIR",
     )
+    phone_default_region: str = Field(
+        default="US",
+        description="ISO 3166-1 alpha-2 region for phone numbers written without a country code.",
+        env="PHONE_DEFAULT_REGION",
+    )
     
     # API Key for authentication
     call_api_key: str = Field(
@@ -1,6 +1,7 @@
 QUEUE_STT_JOBS = "queue:stt_jobs"
 QUEUE_SUMMARY_JOBS = "queue:summary_jobs"
 QUEUE_POSTPROCESS_JOBS = "queue:postprocess_jobs"
+QUEUE_CONSUMER_GROUP = "workers"
 JOB_KEY_PREFIX = "job:"
 JOB_LIST_KEY = "jobs:list"
 DEFAULT_JOB_LIST_LIMIT = 50
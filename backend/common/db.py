@@ -1,9 +1,12 @@
 """Database utilities and connection management for PostgreSQL."""
 
-from typing import AsyncGenerator
+from datetime import datetime
+from typing import Any, AsyncGenerator
 
+import orjson
 from pydantic import Field
 from pydantic_settings import BaseSettings
+from sqlalchemy import DateTime, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -16,6 +19,16 @@ class DatabaseSettings(BaseSettings):
         description="PostgreSQL connection URL.",
         validation_alias="POSTGRES_DSN",
     )
+    db_pool_size: int = Field(
+        default=10,
+        description="Persistent connections kept per process; size against Postgres max_connections.",
+        validation_alias="DB_POOL_SIZE",
+    )
+    db_max_overflow: int = Field(
+        default=40,
+        description="Extra connections opened under burst load and closed when returned.",
+        validation_alias="DB_MAX_OVERFLOW",
+    )
     run_db_migrations: bool = Field(
         default=False,
         description="Whether to run database migrations on startup.",
@@ -31,12 +44,21 @@ class DatabaseSettings(BaseSettings):
 db_settings = DatabaseSettings()
 
 
+def json_dumps(value: Any) -> str:
+    """Serialize JSONB values with orjson (asyncpg's codec expects str)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     db_settings.postgres_dsn,
     echo=False,  # Set to True for SQL debugging
+    pool_size=db_settings.db_pool_size,
+    max_overflow=db_settings.db_max_overflow,
     pool_pre_ping=True,
     pool_recycle=300,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
 )
 
 
@@ -52,10 +74,35 @@ SessionLocal = async_sessionmaker(
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
-    pass
+
+    # The migrations create timestamp columns as timestamptz; without this
+    # Mapped[datetime] binds as TIMESTAMP WITHOUT TIME ZONE, which asyncpg
+    # refuses for the aware datetimes the models default to
+    type_annotation_map = {datetime: DateTime(timezone=True)}
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for FastAPI to get database session."""
     async with SessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def health_check() -> bool:
+    """Return True if a pooled connection can run a trivial query."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
+def pool_status() -> dict[str, int]:
+    """Snapshot of the shared connection pool for monitoring."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
@@ -47,6 +47,8 @@ class JobMetadata(BaseModel):
 class QueueMessage(BaseModel):
     job_id: str
     audio_path: Optional[str] = None
+    # Stream entry ID set when the message is read; passed back to ack_message
+    delivery_id: Optional[str] = Field(default=None, exclude=True)
 
 
 class JobCreateRequest(BaseModel):
@@ -1,17 +1,20 @@
 """SQLAlchemy models for PostgreSQL database."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    DateTime,
     Double,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -20,35 +23,44 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.common.db import Base
 
 
+def _utcnow() -> datetime:
+    """Client-side timestamp default.
+
+    Setting created_at/updated_at in Python lets the ORM batch inserts
+    without fetching server-generated values back; server_default is kept
+    for rows written outside the ORM.
+    """
+    return datetime.now(timezone.utc)
+
+
 class Call(Base):
     """Model for storing call information."""
     
     __tablename__ = "calls"
     
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     external_job_id: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     provider_call_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)  # Renamed from call_id
     agent_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     customer_number: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    direction: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    direction: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     audio_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     started_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     ended_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
-    language: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    stt_model: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="completed")
-    
-    # Snapshot-style entities / insights (non-canonical but still stored)
-    entities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-    intent: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    resolution: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    confidence_score: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    language: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    stt_model: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="completed")
     
     # Materialized dashboard fields
     headline: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     sentiment_label: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     sentiment_score: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     duration_sec: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Digest of the job payload last persisted; equal on retries, which are skipped
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     
     # Canonical FK links
     agent_fk: Mapped[Optional[int]] = mapped_column(
@@ -68,10 +80,10 @@ class Call(Base):
     )
     
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
     
     # Relationship to dialogue turns
@@ -90,6 +102,15 @@ class Call(Base):
         lazy="selectin"
     )
     
+    # Rarely-read snapshot insights live in a 1:1 satellite table
+    insights: Mapped[Optional["CallInsights"]] = relationship(
+        "CallInsights",
+        back_populates="call",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="select",
+    )
+    
     # Relationships to canonical entities / business objects
     agent: Mapped[Optional["Agent"]] = relationship(
         "Agent",
@@ -143,6 +164,49 @@ class Call(Base):
         # CHECK constraints for enum-like fields
         # Note: These are enforced at the database level
         # Application code should also validate these values
+
+        # Keyset pagination of an agent's calls (paginate_calls_for_agent)
+        Index(
+            "idx_calls_agent_started",
+            "agent_fk",
+            started_at.desc().nulls_last(),
+            id.desc(),
+        ),
+        # Dashboard "recent calls by status" scans
+        Index("idx_calls_status_started", "status", "started_at"),
+        # Per-customer call count / first / last contact aggregates
+        Index("idx_calls_person_created", "person_id", "created_at"),
+    )
+
+
+class CallInsights(Base):
+    """Snapshot-style entities / insights for a call (non-canonical but still stored).
+
+    Kept out of ``calls`` so the dashboard's list and analytics scans read
+    narrow rows; only the call details view loads these.
+    """
+    
+    __tablename__ = "call_insights"
+    
+    call_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("calls.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    entities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    intent: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    resolution: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    confidence_score: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
+    
+    call: Mapped["Call"] = relationship("Call", back_populates="insights")
+
+    __table_args__ = (
+        Index(
+            "idx_call_insights_entities_gin",
+            "entities",
+            postgresql_using="gin",
+            postgresql_ops={"entities": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -151,7 +215,9 @@ class DialogueTurn(Base):
     
     __tablename__ = "dialogue_turns"
     
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     call_id: Mapped[int] = mapped_column(
         BigInteger, 
         ForeignKey("calls.id", ondelete="CASCADE"), 
@@ -164,8 +230,10 @@ class DialogueTurn(Base):
     end_sec: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     text: Mapped[str] = mapped_column(Text, nullable=False)
     raw_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    # Digest of raw_json; reruns skip rewriting turns whose digest is unchanged
+    content_hash: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     
     # Relationship back to call
@@ -173,8 +241,8 @@ class DialogueTurn(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_dialogue_turns_call_id", "call_id"),
-        Index("idx_dialogue_turns_call_turn", "call_id", "turn_index"),
+        # Merge target for the postprocess worker; also serves call_id lookups
+        Index("uq_dialogue_turns_call_turn", "call_id", "turn_index", unique=True),
     )
 
 
@@ -183,17 +251,19 @@ class CallSummary(Base):
     
     __tablename__ = "call_summaries"
     
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     call_id: Mapped[int] = mapped_column(
         BigInteger, 
         ForeignKey("calls.id", ondelete="CASCADE"), 
         nullable=False
     )
-    summary_type: Mapped[str] = mapped_column(String, nullable=False)
+    summary_type: Mapped[str] = mapped_column(String(32), nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
     model: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     
     # Relationship back to call
@@ -211,20 +281,23 @@ class Agent(Base):
 
     __tablename__ = "agents"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     external_agent_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     display_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
+    # Unbounded: not eager-loaded, page with paginate_calls_for_agent instead
     calls: Mapped[List["Call"]] = relationship(
         "Call",
         back_populates="agent",
-        lazy="selectin",
+        lazy="select",
     )
 
 
@@ -233,23 +306,29 @@ class Person(Base):
 
     __tablename__ = "people"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     full_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     given_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     family_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    date_of_birth: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    date_of_birth: Mapped[Optional[datetime]] = mapped_column(DateTime(), nullable=True)
     id_number: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # Maintained incrementally by update_person_stats as calls are linked
+    call_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    first_call_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    last_call_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     calls: Mapped[List["Call"]] = relationship(
         "Call",
         back_populates="person",
-        lazy="selectin",
+        lazy="select",
     )
     addresses: Mapped[List["EntityAddress"]] = relationship(
         "EntityAddress",
@@ -264,19 +343,25 @@ class Organization(Base):
 
     __tablename__ = "organizations"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     name: Mapped[str] = mapped_column(String, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     calls: Mapped[List["Call"]] = relationship(
         "Call",
         back_populates="organization",
-        lazy="selectin",
+        lazy="select",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("name", name="uq_organizations_name"),
     )
 
 
@@ -285,8 +370,10 @@ class Identifier(Base):
 
     __tablename__ = "identifiers"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    identifier_type: Mapped[str] = mapped_column(String, nullable=False)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
+    identifier_type: Mapped[str] = mapped_column(String(32), nullable=False)
     identifier_value: Mapped[str] = mapped_column(Text, nullable=False)
     normalized_value: Mapped[str] = mapped_column(Text, nullable=False)
 
@@ -302,14 +389,67 @@ class Identifier(Base):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
-    person: Mapped[Optional["Person"]] = relationship("Person", lazy="selectin")
-    organization: Mapped[Optional["Organization"]] = relationship("Organization", lazy="selectin")
+    # Only identity resolution needs these; it loads them explicitly
+    person: Mapped[Optional["Person"]] = relationship("Person", lazy="raise")
+    organization: Mapped[Optional["Organization"]] = relationship("Organization", lazy="raise")
+
+    __table_args__ = (
+        # Upsert target for identity resolution (ON CONFLICT on type + normalized
+        # value); the included columns make the resolver's lookup index-only
+        Index(
+            "uq_identifiers_lookup",
+            "identifier_type",
+            "normalized_value",
+            unique=True,
+            postgresql_include=["id", "person_id", "organization_id"],
+        ),
+        Index("idx_identifiers_person_id", "person_id"),
+        Index("idx_identifiers_organization_id", "organization_id"),
+    )
+
+
+class PersonIdAlias(Base):
+    """Possible duplicate of a person, pending review.
+
+    Written by identity resolution when one call's identifiers point at
+    different people; such calls are left unlinked rather than attached
+    to either person.
+    """
+
+    __tablename__ = "person_id_aliases"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
+    # Pairs are stored lower id first (CHECK person_id < alias_person_id)
+    person_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("people.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    alias_person_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("people.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="needs_review")
+    created_at: Mapped[datetime] = mapped_column(
+        nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
+    )
+
+    __table_args__ = (
+        UniqueConstraint("person_id", "alias_person_id", name="uq_person_id_aliases_pair"),
+        Index("idx_person_id_aliases_alias_person_id", "alias_person_id"),
+    )
 
 
 class Address(Base):
@@ -317,7 +457,9 @@ class Address(Base):
 
     __tablename__ = "addresses"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     line1: Mapped[str] = mapped_column(String, nullable=False)
     line2: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     city: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -325,10 +467,10 @@ class Address(Base):
     postal_code: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     country: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
 
@@ -337,7 +479,9 @@ class EntityAddress(Base):
 
     __tablename__ = "entity_addresses"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     address_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("addresses.id", ondelete="CASCADE"),
@@ -353,12 +497,12 @@ class EntityAddress(Base):
         ForeignKey("organizations.id", ondelete="CASCADE"),
         nullable=True,
     )
-    address_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    address_type: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     is_primary: Mapped[bool] = mapped_column(
         Boolean, nullable=False, server_default=func.false()
     )
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
 
     address: Mapped["Address"] = relationship("Address", lazy="selectin")
@@ -371,7 +515,9 @@ class Extraction(Base):
 
     __tablename__ = "extractions"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     call_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("calls.id", ondelete="CASCADE"),
@@ -379,11 +525,11 @@ class Extraction(Base):
     )
     extractor_name: Mapped[str] = mapped_column(String, nullable=False)
     extractor_version: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    run_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="succeeded")
+    run_type: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="succeeded")
     raw_payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
 
     call: Mapped["Call"] = relationship("Call", back_populates="extractions")
@@ -394,13 +540,24 @@ class Extraction(Base):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index(
+            "idx_extractions_raw_payload_gin",
+            "raw_payload",
+            postgresql_using="gin",
+            postgresql_ops={"raw_payload": "jsonb_path_ops"},
+        ),
+    )
+
 
 class ExtractedFact(Base):
     """Atomic extracted fact/claim with provenance and confidence."""
 
     __tablename__ = "extracted_facts"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     extraction_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("extractions.id", ondelete="CASCADE"),
@@ -411,10 +568,10 @@ class ExtractedFact(Base):
         ForeignKey("calls.id", ondelete="CASCADE"),
         nullable=False,
     )
-    fact_type: Mapped[str] = mapped_column(String, nullable=False)
+    fact_type: Mapped[str] = mapped_column(String(32), nullable=False)
     label: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     value: Mapped[dict] = mapped_column(JSONB, nullable=False)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="proposed")
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="proposed")
     confidence: Mapped[float] = mapped_column(Double, nullable=False)
     turn_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
@@ -425,48 +582,84 @@ class ExtractedFact(Base):
     end_sec: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     raw_span_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    person_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("people.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    organization_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("organizations.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    agent_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("agents.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    task_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("tasks.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    product_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("products.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    offer_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger,
-        ForeignKey("offers.id", ondelete="SET NULL"),
-        nullable=True,
-    )
     stable_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     extraction: Mapped["Extraction"] = relationship("Extraction", back_populates="facts")
     call: Mapped["Call"] = relationship("Call", back_populates="extracted_facts")
     turn: Mapped[Optional["DialogueTurn"]] = relationship("DialogueTurn", lazy="selectin")
+    refs: Mapped[List["ExtractedFactRef"]] = relationship(
+        "ExtractedFactRef",
+        back_populates="fact",
+        cascade="all, delete-orphan",
+    )
+
+    __table_args__ = (
+        # Facts are append-only, so created_at follows physical order and a
+        # BRIN index covers time-range scans at a fraction of a B-tree's size
+        Index(
+            "idx_extracted_facts_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Containment (@>) filters on fact payloads
+        Index(
+            "idx_extracted_facts_value_gin",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "jsonb_path_ops"},
+        ),
+    )
+
+
+# Entity kinds an ExtractedFactRef may point at, keyed to the table ref_id
+# refers to ("product" is the catalog, "product_mention" a per-call mention)
+FACT_REF_TYPES = {
+    "person": "people",
+    "organization": "organizations",
+    "agent": "agents",
+    "task": "tasks",
+    "product": "products",
+    "product_mention": "call_product_mentions",
+    "offer": "offers",
+}
+
+
+class ExtractedFactRef(Base):
+    """Link from a fact to a canonical entity (person, task, offer, ...).
+
+    Facts usually reference one or two entities, so links live here rather
+    than as sparse nullable FK columns on extracted_facts. ref_id is
+    polymorphic and has no FK; instead, delete triggers on each target
+    table (see migration 20261016000001) remove refs to deleted rows.
+    """
+
+    __tablename__ = "extracted_fact_refs"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
+    fact_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("extracted_facts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    ref_type: Mapped[str] = mapped_column(String(32), nullable=False)  # one of FACT_REF_TYPES
+    ref_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    fact: Mapped["ExtractedFact"] = relationship("ExtractedFact", back_populates="refs")
+
+    __table_args__ = (
+        Index("idx_extracted_fact_refs_fact_id", "fact_id"),
+        Index("idx_extracted_fact_refs_ref", "ref_type", "ref_id"),
+    )
 
 
 class Product(Base):
@@ -474,16 +667,18 @@ class Product(Base):
 
     __tablename__ = "products"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     sku: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     category: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     product_metadata: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
 
@@ -492,7 +687,9 @@ class Task(Base):
 
     __tablename__ = "tasks"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     call_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("calls.id", ondelete="CASCADE"),
@@ -510,7 +707,7 @@ class Task(Base):
     )
     title: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="open")
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="open")
     due_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     owner_agent_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
@@ -529,10 +726,10 @@ class Task(Base):
     )
     stable_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     call: Mapped["Call"] = relationship("Call", back_populates="tasks")
@@ -548,7 +745,9 @@ class Offer(Base):
 
     __tablename__ = "offers"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
     call_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("calls.id", ondelete="CASCADE"),
@@ -580,7 +779,7 @@ class Offer(Base):
         nullable=True,
     )
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[str] = mapped_column(String, nullable=False, default="promised")
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="promised")
     discount_amount: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     discount_percent: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     price_amount: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
@@ -590,10 +789,10 @@ class Offer(Base):
     conditions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     stable_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     call: Mapped["Call"] = relationship("Call", back_populates="offers")
@@ -608,12 +807,16 @@ class CallProductMention(Base):
     """Product mention within a specific call."""
 
     __tablename__ = "call_product_mentions"
+    __table_args__ = {"postgresql_partition_by": "HASH (call_id)"}
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False, start=1, cache=1000), primary_key=True
+    )
+    # Partition key; Postgres requires it in the primary key
     call_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("calls.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
     product_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
@@ -650,10 +853,10 @@ class CallProductMention(Base):
     end_sec: Mapped[Optional[float]] = mapped_column(Double, nullable=True)
     stable_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now()
+        nullable=False, default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        nullable=False, server_default=func.now(), onupdate=func.now()
+        nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
     )
 
     call: Mapped["Call"] = relationship("Call", back_populates="product_mentions")
@@ -1,12 +1,22 @@
 """Phone number normalization utilities."""
 
-import re
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import phonenumbers
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on distinct raw inputs memoized by the normalizers below
+_NORMALIZE_CACHE_SIZE = 65536
+
+# Digit count bounds (country code included) for numbers kept as-is
+_E164_MIN_DIGITS = 7
+_E164_MAX_DIGITS = 15
+
+
 def normalize_phone_e164(raw_phone: str, default_country: str = "US") -> Optional[str]:
     """
     Normalize a phone number to E.164 format.
@@ -14,16 +24,18 @@ def normalize_phone_e164(raw_phone: str, default_country: str = "US") -> Optiona
     E.164 format: +[country code][subscriber number]
     Example: +14155552671
     
-    Steps:
-    1. Trim whitespace
-    2. Replace ++ with +
-    3. Remove spaces, dashes, parentheses, dots
-    4. Handle leading zeros and country codes
-    5. Add + prefix if missing
+    Parsing and validation are delegated to libphonenumber, which applies
+    the numbering plan of ``default_country`` to numbers written without
+    an international prefix. Numbers that are not valid there are retried
+    as international numbers missing their leading +. Numbers written
+    with a + that libphonenumber does not know are kept as plain digits
+    if their length fits E.164. Results are memoized, so repeat callers
+    pay a single dict lookup.
     
     Args:
         raw_phone: Raw phone number string
-        default_country: Default country code (default: US = +1)
+        default_country: ISO 3166-1 alpha-2 region used for numbers
+            without a leading + (default: US)
         
     Returns:
         Normalized E.164 phone number or None if invalid
@@ -31,68 +43,46 @@ def normalize_phone_e164(raw_phone: str, default_country: str = "US") -> Optiona
     if not raw_phone:
         return None
     
-    # Step 1: Trim whitespace
+    normalized, rejection = _normalize_phone_e164_cached(raw_phone, default_country)
+    if rejection and logger.isEnabledFor(logging.WARNING):
+        logger.warning("%s phone number: %s", rejection, raw_phone)
+    return normalized
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_phone_e164_cached(
+    raw_phone: str, default_country: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """Pure core of normalize_phone_e164; returns (e164, rejection_reason)."""
     phone = raw_phone.strip()
-    
     if not phone:
+        return None, None
+    
+    parsed = _parse_valid(phone, default_country)
+    if parsed is None and not phone.startswith("+"):
+        # International number written without the leading + (e.g. 79123456789)
+        parsed = _parse_valid("+" + phone, None)
+    if parsed is not None:
+        return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164), None
+    
+    # Explicitly international numbers outside libphonenumber's metadata
+    # (test/placeholder ranges, new allocations) are still usable as
+    # identifiers, so keep them in plain E.164 form if the length fits.
+    if phone.startswith("+"):
+        digits = "".join(c for c in phone if c.isdigit())
+        if _E164_MIN_DIGITS <= len(digits) <= _E164_MAX_DIGITS:
+            return "+" + digits, None
+    return None, "Invalid"
+
+
+def _parse_valid(
+    phone: str, region: Optional[str]
+) -> Optional[phonenumbers.PhoneNumber]:
+    try:
+        parsed = phonenumbers.parse(phone, region)
+    except phonenumbers.NumberParseException:
         return None
-    
-    # Step 2: Replace ++ with +
-    phone = phone.replace("++", "+")
-    
-    # Step 3: Remove spaces, dashes, parentheses, dots
-    phone = re.sub(r'[\s\-\(\)\.]', '', phone)
-    
-    # Extract digits and leading +
-    if phone.startswith('+'):
-        # Keep the + and extract digits
-        digits = ''.join(c for c in phone[1:] if c.isdigit())
-        phone = '+' + digits
-    else:
-        # Extract only digits
-        digits = ''.join(c for c in phone if c.isdigit())
-        phone = digits
-    
-    if not phone or (phone.startswith('+') and len(phone) == 1):
-        return None
-    
-    # Step 4-5: Handle country codes
-    if phone.startswith('+'):
-        # Already has + prefix, validate length
-        if len(phone) < 8:  # Minimum E.164 length (country + area + number)
-            logger.warning("Phone number too short: %s", raw_phone)
-            return None
-        if len(phone) > 16:  # Maximum E.164 length
-            logger.warning("Phone number too long: %s", raw_phone)
-            return None
-        return phone
-    
-    # No + prefix - need to add country code
-    if default_country == "US":
-        # US phone numbers
-        if len(phone) == 10:
-            # Standard US format: 4155552671 -> +14155552671
-            return f"+1{phone}"
-        elif len(phone) == 11 and phone.startswith('1'):
-            # Already has 1 prefix: 14155552671 -> +14155552671
-            return f"+{phone}"
-        elif len(phone) == 11 and not phone.startswith('1'):
-            # Foreign number without +, assume it's complete
-            return f"+{phone}"
-        elif len(phone) > 11:
-            # Likely already has country code
-            return f"+{phone}"
-        else:
-            logger.warning("Invalid US phone number length: %s", raw_phone)
-            return None
-    else:
-        # For other countries, assume the number is complete
-        # and just add the + prefix
-        if 8 <= len(phone) <= 15:
-            return f"+{phone}"
-        else:
-            logger.warning("Invalid phone number length: %s", raw_phone)
-            return None
+    return parsed if phonenumbers.is_valid_number(parsed) else None
 
 
 def normalize_email(raw_email: str) -> Optional[str]:
@@ -113,11 +103,19 @@ def normalize_email(raw_email: str) -> Optional[str]:
     if not raw_email:
         return None
     
+    email = _normalize_email_cached(raw_email)
+    if email is None and logger.isEnabledFor(logging.WARNING):
+        logger.warning("Invalid email format: %s", raw_email)
+    return email
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_email_cached(raw_email: str) -> Optional[str]:
+    """Pure core of normalize_email."""
     email = raw_email.strip().lower()
     
     # Basic email validation
     if '@' not in email or '.' not in email.split('@')[-1]:
-        logger.warning("Invalid email format: %s", raw_email)
         return None
     
     return email
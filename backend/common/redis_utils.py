@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-import json
+import os
+import socket
 from datetime import datetime
-from enum import Enum
-from typing import Any, Iterable
+from functools import lru_cache
+from typing import Any, Callable
 
+import orjson
 import redis
 
 from backend.common.config import get_settings
 from backend.common.constants import (
     JOB_KEY_PREFIX,
     JOB_LIST_KEY,
+    QUEUE_CONSUMER_GROUP,
     QUEUE_POSTPROCESS_JOBS,
     QUEUE_STT_JOBS,
     QUEUE_SUMMARY_JOBS,
@@ -20,17 +23,30 @@ from backend.common.models import JobMetadata, JobStatus, QueueMessage
 _settings = get_settings()
 _redis_client: redis.Redis | None = None
 _JSON_FIELDS = {"dummy_tags", "extra_meta", "stt_segments", "stt_metadata", "entities"}
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+# Seconds to wait for a free pooled connection before raising ConnectionError
+_POOL_TIMEOUT = 20
+_CONSUMER_NAME = f"{socket.gethostname()}-{os.getpid()}"
+_ready_queues: set[str] = set()
 
 
 def get_redis_client() -> redis.Redis:
     global _redis_client
     if _redis_client is None:
-        _redis_client = redis.from_url(_settings.redis_url, decode_responses=True)
+        pool = redis.BlockingConnectionPool.from_url(
+            _settings.redis_url,
+            max_connections=_settings.redis_pool_size,
+            timeout=_POOL_TIMEOUT,
+            decode_responses=True,
+        )
+        _redis_client = redis.Redis(connection_pool=pool)
     return _redis_client
 
 
+@lru_cache(maxsize=_settings.job_list_limit * 2)
 def _job_key(job_id: str) -> str:
-    return f"{JOB_KEY_PREFIX}{job_id}"
+    # Cached: list_jobs rebuilds the same recent keys on every dashboard refresh
+    return JOB_KEY_PREFIX + job_id
 
 
 def enqueue_stt_job(message: QueueMessage) -> None:
@@ -47,100 +63,178 @@ def enqueue_postprocess_job(message: QueueMessage) -> None:
 
 def enqueue_message(queue_name: str, message: QueueMessage) -> None:
     client = get_redis_client()
-    client.rpush(queue_name, message.model_dump_json())
+    _ensure_queue(client, queue_name)
+    # bytes go to the socket as-is; decode_responses only affects replies
+    client.xadd(queue_name, {"m": orjson.dumps(message.model_dump())})
 
 
-def pop_message(queue_name: str, timeout: int | None = None) -> QueueMessage | None:
+def pop_messages(
+    queue_name: str,
+    timeout: int | None = None,
+    count: int | None = None,
+) -> list[QueueMessage]:
+    """Read messages for this consumer; each must be passed to ack_message once handled.
+
+    Messages left unacknowledged by a crashed worker for longer than
+    ``queue_claim_idle_ms`` are redelivered before new ones are read.
+    """
     client = get_redis_client()
-    result = client.blpop(queue_name, timeout=timeout)
-    if result is None:
-        return None
-    _, message_str = result
-    return QueueMessage.model_validate_json(message_str)
+    _ensure_queue(client, queue_name)
+    count = count or _settings.queue_read_count
+
+    _, entries, *_ = client.xautoclaim(
+        queue_name,
+        QUEUE_CONSUMER_GROUP,
+        _CONSUMER_NAME,
+        min_idle_time=_settings.queue_claim_idle_ms,
+        count=count,
+    )
+    if not entries:
+        # Like BLPOP, a timeout of None/0 blocks until a message arrives
+        response = client.xreadgroup(
+            QUEUE_CONSUMER_GROUP,
+            _CONSUMER_NAME,
+            {queue_name: ">"},
+            count=count,
+            block=(timeout or 0) * 1000,
+        )
+        entries = response[0][1] if response else []
+
+    messages = []
+    for entry_id, fields in entries:
+        if not fields:
+            # Entry deleted while pending (Redis < 7 still returns it to XAUTOCLAIM)
+            continue
+        message = QueueMessage.model_validate_json(fields["m"])
+        message.delivery_id = entry_id
+        messages.append(message)
+    return messages
+
+
+def ack_message(queue_name: str, message: QueueMessage) -> None:
+    """Acknowledge a handled message and drop it from the stream."""
+    pipe = get_redis_client().pipeline(transaction=False)
+    pipe.xack(queue_name, QUEUE_CONSUMER_GROUP, message.delivery_id)
+    pipe.xdel(queue_name, message.delivery_id)
+    pipe.execute()
+
+
+def _ensure_queue(client: redis.Redis, queue_name: str) -> None:
+    """Create the consumer group once per process, moving any legacy list entries into the stream."""
+    if queue_name in _ready_queues:
+        return
+    if client.type(queue_name) == "list":
+        pipe = client.pipeline()
+        pipe.lrange(queue_name, 0, -1)
+        pipe.delete(queue_name)
+        legacy_messages, _ = pipe.execute()
+        for message_str in legacy_messages:
+            client.xadd(queue_name, {"m": message_str})
+    try:
+        client.xgroup_create(queue_name, QUEUE_CONSUMER_GROUP, id="0", mkstream=True)
+    except redis.ResponseError as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+    _ready_queues.add(queue_name)
 
 
 def create_job(job: JobMetadata) -> None:
     client = get_redis_client()
-    job_hash = job_dict(job)
-    client.hset(_job_key(job.job_id), mapping=job_hash)
-    client.lpush(JOB_LIST_KEY, job.job_id)
+    pipe = client.pipeline(transaction=False)
+    pipe.set(_job_key(job.job_id), job.model_dump_json())
+    pipe.lpush(JOB_LIST_KEY, job.job_id)
+    pipe.execute()
 
 
-def job_dict(job: JobMetadata) -> dict[str, Any]:
-    data = job.model_dump()
-    _encode_json_fields(data)
-    return {k: _stringify(v) for k, v in data.items() if v is not None}
+def update_job(job_id: str, **fields: Any) -> None:
+    _update_jobs({job_id: fields})
 
 
-def update_job(job_id: str, **fields: Any) -> None:
+def update_and_get_job(job_id: str, **fields: Any) -> JobMetadata | None:
+    """Apply field updates and return the updated job, in the same round-trips as update_job.
+
+    Returns None if the job did not exist before the update.
+    """
+    data = _update_jobs({job_id: fields})[0]
+    return JobMetadata(**data) if data is not None else None
+
+
+def update_jobs_bulk(updates: dict[str, dict[str, Any]]) -> None:
+    """Merge field updates into several jobs in one WATCH/MULTI transaction."""
+    _update_jobs(updates)
+
+
+def _update_jobs(updates: dict[str, dict[str, Any]]) -> list[dict[str, Any] | None]:
+    """Merge updates under WATCH/MULTI; returns each job's merged data, None where it was missing."""
     client = get_redis_client()
-    fields["updated_at"] = datetime.utcnow().isoformat()
-    _encode_json_fields(fields)
-    client.hset(_job_key(job_id), mapping={k: _stringify(v) for k, v in fields.items()})
+    keys = [_job_key(job_id) for job_id in updates]
+    now = datetime.utcnow()
+    merged: list[tuple[str, dict[str, Any], bool]] = []
+
+    def _merge(pipe: redis.client.Pipeline) -> None:
+        # Read-modify-write under WATCH; retried by redis-py if any key changes
+        merged.clear()
+        values = pipe.mget(keys)
+        for key, value, fields in zip(keys, values, updates.values()):
+            data = orjson.loads(value) if value else _load_job_data(pipe, key)
+            existed = data is not None
+            data = data or {}
+            data.update(fields)
+            data["updated_at"] = now
+            merged.append((key, data, existed))
+        pipe.multi()
+        for key, data, _ in merged:
+            pipe.set(key, _json_dumps(data))
+
+    client.transaction(_merge, *keys)
+    return [data if existed else None for _, data, existed in merged]
 
 
 def get_job(job_id: str) -> JobMetadata | None:
-    client = get_redis_client()
-    job_hash = client.hgetall(_job_key(job_id))
-    if not job_hash:
-        return None
-    job_hash = _deserialize_job_hash(job_hash)
-    return JobMetadata(**job_hash)
+    return _get_jobs(get_redis_client(), [job_id])[0]
 
 
 def list_jobs(limit: int | None = None) -> list[JobMetadata]:
     client = get_redis_client()
     job_ids = client.lrange(JOB_LIST_KEY, 0, (limit or _settings.job_list_limit) - 1)
-    jobs: list[JobMetadata] = []
-    for job_id in job_ids:
-        job = get_job(job_id)
-        if job:
-            jobs.append(job)
+    if not job_ids:
+        return []
+    return [job for job in _get_jobs(client, job_ids) if job]
+
+
+def _get_jobs(client: redis.Redis, job_ids: list[str]) -> list[JobMetadata | None]:
+    """Fetch jobs with one MGET; legacy hash-encoded jobs are read in a follow-up pipeline."""
+    values = client.mget([_job_key(job_id) for job_id in job_ids])
+    jobs = [JobMetadata.model_validate_json(value) if value else None for value in values]
+
+    # MGET returns nil both for missing keys and for jobs still stored as hashes
+    missing = [i for i, value in enumerate(values) if value is None]
+    if missing:
+        pipe = client.pipeline(transaction=False)
+        for i in missing:
+            pipe.hgetall(_job_key(job_ids[i]))
+        for i, job_hash in zip(missing, pipe.execute()):
+            if job_hash:
+                jobs[i] = JobMetadata(**_deserialize_job_hash(job_hash))
     return jobs
 
 
+def _load_job_data(client: redis.Redis | redis.client.Pipeline, key: str) -> dict[str, Any] | None:
+    if client.type(key) == "hash":
+        job_hash = client.hgetall(key)
+        return _deserialize_job_hash(job_hash) if job_hash else None
+    value = client.get(key)
+    return orjson.loads(value) if value else None
+
+
 def _deserialize_job_hash(data: dict[str, str]) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    for key, value in data.items():
-        if key in {"created_at", "updated_at"}:
-            result[key] = datetime.fromisoformat(value)
-        elif key == "status":
-            result[key] = _deserialize_status(value)
-        elif key in _JSON_FIELDS:
-            result[key] = json.loads(value)
-        elif key == "delivered":
-            result[key] = value == "True"
-        elif key in {"stt_language", "stt_text", "stt_engine", "stt_diarization_mode", "stt_error"}:
-            # Handle special string fields that can be "None"
-            result[key] = None if value == "None" else value
-        else:
-            result[key] = value
-    return result
-
-
-def _stringify(value: Any) -> str:
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, Enum):
-        return value.value
-    if isinstance(value, (dict, list)):
-        return json.dumps(value)
-    return str(value)
-
-
-def _encode_json_fields(data: dict[str, Any]) -> None:
-    for field in _JSON_FIELDS:
-        if field not in data:
-            continue
-        value = data[field]
-        if value is None:
-            continue
-        if isinstance(value, str):
-            # already serialized
-            continue
-        if isinstance(value, Iterable) and not isinstance(value, (dict, list)) and field == "dummy_tags":
-            value = list(value)
-        data[field] = json.dumps(value)
+    """Decode a job written by the previous per-field HSET layout."""
+    return {key: _FIELD_DECODERS.get(key, _identity)(value) for key, value in data.items()}
+
+
+def _json_dumps(value: Any) -> str:
+    # Client uses decode_responses=True, so values are written as str
+    return orjson.dumps(value, option=_JSON_OPTIONS).decode()
 
 
 def _deserialize_status(value: str) -> JobStatus:
@@ -150,4 +244,27 @@ def _deserialize_status(value: str) -> JobStatus:
         if value.startswith("JobStatus."):
             stripped = value.split(".", 1)[1]
             return JobStatus(stripped)
-        raise
\ No newline at end of file
+        raise
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+def _optional_str(value: str) -> str | None:
+    # The hash layout stored None as the string "None"
+    return None if value == "None" else value
+
+
+# Legacy hash field -> decoder; fields not listed are plain strings
+_FIELD_DECODERS: dict[str, Callable[[str], Any]] = {
+    "created_at": datetime.fromisoformat,
+    "updated_at": datetime.fromisoformat,
+    "status": _deserialize_status,
+    "delivered": lambda value: value == "True",
+    **{field: orjson.loads for field in _JSON_FIELDS},
+    **{
+        field: _optional_str
+        for field in ("stt_language", "stt_text", "stt_engine", "stt_diarization_mode", "stt_error")
+    },
+}
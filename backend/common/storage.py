@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from functools import cache
 
 from backend.common.config import get_settings
 
 
-def ensure_storage_root() -> Path:
-    root = Path(get_settings().storage_dir)
-    root.mkdir(parents=True, exist_ok=True)
+@cache
+def ensure_storage_root() -> str:
+    # Created once per process; storage_dir doesn't change at runtime
+    root = get_settings().storage_dir
+    os.makedirs(root, exist_ok=True)
     return root
 
 
-def get_job_storage_dir(job_id: str) -> Path:
-    job_dir = ensure_storage_root() / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
+def get_job_storage_dir(job_id: str) -> str:
+    job_dir = os.path.join(ensure_storage_root(), job_id)
+    os.makedirs(job_dir, exist_ok=True)
     return job_dir
@@ -20,7 +20,7 @@ def upgrade() -> None:
     # 1) Agents
     op.create_table(
         "agents",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("external_agent_id", sa.String(), nullable=False, unique=True),
         sa.Column("display_name", sa.String(), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
@@ -30,7 +30,7 @@ def upgrade() -> None:
     # 2) People & organizations
     op.create_table(
         "people",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("full_name", sa.String(), nullable=True),
         sa.Column("given_name", sa.String(), nullable=True),
         sa.Column("family_name", sa.String(), nullable=True),
@@ -40,7 +40,7 @@ def upgrade() -> None:
 
     op.create_table(
         "organizations",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("name", sa.String(), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
@@ -48,7 +48,7 @@ def upgrade() -> None:
 
     op.create_table(
         "person_organizations",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("person_id", sa.BigInteger(), sa.ForeignKey("people.id", ondelete="CASCADE"), nullable=False),
         sa.Column(
             "organization_id",
@@ -70,7 +70,7 @@ def upgrade() -> None:
     # 3) Identifiers
     op.create_table(
         "identifiers",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("identifier_type", sa.String(), nullable=False),
         sa.Column("identifier_value", sa.Text(), nullable=False),
         sa.Column("normalized_value", sa.Text(), nullable=False),
@@ -95,7 +95,7 @@ def upgrade() -> None:
     # 4) Addresses & entity_addresses
     op.create_table(
         "addresses",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("line1", sa.String(), nullable=False),
         sa.Column("line2", sa.String(), nullable=True),
         sa.Column("city", sa.String(), nullable=True),
@@ -108,7 +108,7 @@ def upgrade() -> None:
 
     op.create_table(
         "entity_addresses",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column(
             "address_id",
             sa.BigInteger(),
@@ -137,7 +137,7 @@ def upgrade() -> None:
     # 5) Extractions
     op.create_table(
         "extractions",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("call_id", sa.BigInteger(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
         sa.Column("extractor_name", sa.String(), nullable=False),
         sa.Column("extractor_version", sa.String(), nullable=True),
@@ -155,7 +155,7 @@ def upgrade() -> None:
     # 6) Business objects: products, tasks, offers, call_product_mentions
     op.create_table(
         "products",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("sku", sa.String(), nullable=True, unique=True),
         sa.Column("name", sa.String(), nullable=False),
         sa.Column("category", sa.String(), nullable=True),
@@ -166,7 +166,7 @@ def upgrade() -> None:
 
     op.create_table(
         "tasks",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("call_id", sa.BigInteger(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
         sa.Column("extraction_id", sa.BigInteger(), sa.ForeignKey("extractions.id", ondelete="SET NULL"), nullable=True),
         sa.Column("fact_id", sa.BigInteger(), nullable=True),  # FK added after extracted_facts creation
@@ -194,7 +194,7 @@ def upgrade() -> None:
 
     op.create_table(
         "offers",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("call_id", sa.BigInteger(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
         sa.Column("product_id", sa.BigInteger(), sa.ForeignKey("products.id", ondelete="SET NULL"), nullable=True),
         sa.Column("extraction_id", sa.BigInteger(), sa.ForeignKey("extractions.id", ondelete="SET NULL"), nullable=True),
@@ -226,7 +226,7 @@ def upgrade() -> None:
 
     op.create_table(
         "call_product_mentions",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("call_id", sa.BigInteger(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
         sa.Column("product_id", sa.BigInteger(), sa.ForeignKey("products.id", ondelete="SET NULL"), nullable=True),
         sa.Column("extraction_id", sa.BigInteger(), sa.ForeignKey("extractions.id", ondelete="SET NULL"), nullable=True),
@@ -258,7 +258,7 @@ def upgrade() -> None:
     # 7) Extracted facts (after business tables so FKs can reference them)
     op.create_table(
         "extracted_facts",
-        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
         sa.Column("extraction_id", sa.BigInteger(), sa.ForeignKey("extractions.id", ondelete="CASCADE"), nullable=False),
         sa.Column("call_id", sa.BigInteger(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
         sa.Column("fact_type", sa.String(), nullable=False),
@@ -322,44 +322,21 @@ def upgrade() -> None:
         ondelete="SET NULL",
     )
 
-    # 9) Extend calls with nullable FKs and snapshot fields - only add if they don't exist
-    # Check if column exists before adding
-    conn = op.get_bind()
-    
-    # Check if columns exist before adding them
-    columns_to_check = [
-        "entities", "intent", "resolution", "confidence_score", 
-        "agent_fk", "person_id", "organization_id"
-    ]
-    
-    existing_columns = []
-    for col_name in columns_to_check:
-        result = conn.execute(
-            sa.text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'calls' AND column_name = :col_name
-            """),
-            {"col_name": col_name}
-        )
-        if result.fetchone():
-            existing_columns.append(col_name)
-    
-    # Add columns that don't exist
-    if "entities" not in existing_columns:
-        op.add_column("calls", sa.Column("entities", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
-    if "intent" not in existing_columns:
-        op.add_column("calls", sa.Column("intent", sa.String(), nullable=True))
-    if "resolution" not in existing_columns:
-        op.add_column("calls", sa.Column("resolution", sa.String(), nullable=True))
-    if "confidence_score" not in existing_columns:
-        op.add_column("calls", sa.Column("confidence_score", sa.Double(), nullable=True))
-    if "agent_fk" not in existing_columns:
-        op.add_column("calls", sa.Column("agent_fk", sa.BigInteger(), nullable=True))
-    if "person_id" not in existing_columns:
-        op.add_column("calls", sa.Column("person_id", sa.BigInteger(), nullable=True))
-    if "organization_id" not in existing_columns:
-        op.add_column("calls", sa.Column("organization_id", sa.BigInteger(), nullable=True))
+    # 9) Extend calls with nullable FKs and snapshot fields - only add if they don't exist.
+    # One multi-clause ALTER takes the calls table lock once instead of per column.
+    calls_columns = {
+        "entities": "JSONB",
+        "intent": "VARCHAR",
+        "resolution": "VARCHAR",
+        "confidence_score": "DOUBLE PRECISION",
+        "agent_fk": "BIGINT",
+        "person_id": "BIGINT",
+        "organization_id": "BIGINT",
+    }
+    op.execute(
+        "ALTER TABLE calls "
+        + ", ".join(f"ADD COLUMN IF NOT EXISTS {name} {type_sql}" for name, type_sql in calls_columns.items())
+    )
 
     op.create_foreign_key(
         "fk_calls_agent_fk",
@@ -386,14 +363,21 @@ def upgrade() -> None:
         ondelete="SET NULL",
     )
 
-    op.create_index("idx_calls_agent_fk", "calls", ["agent_fk"])
-    op.create_index("idx_calls_person_id", "calls", ["person_id"])
-    op.create_index("idx_calls_organization_id", "calls", ["organization_id"])
-    op.create_index(
-        "idx_calls_status_created",
-        "calls",
-        ["status", sa.text("created_at DESC")],
-    )
+    # calls already holds production data: build its indexes CONCURRENTLY so
+    # writes aren't blocked. That can't run inside the migration transaction,
+    # so this must stay the last step of upgrade().
+    with op.get_context().autocommit_block():
+        op.create_index("idx_calls_agent_fk", "calls", ["agent_fk"], postgresql_concurrently=True)
+        op.create_index("idx_calls_person_id", "calls", ["person_id"], postgresql_concurrently=True)
+        op.create_index(
+            "idx_calls_organization_id", "calls", ["organization_id"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "idx_calls_status_created",
+            "calls",
+            ["status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
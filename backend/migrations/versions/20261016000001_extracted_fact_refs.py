@@ -0,0 +1,114 @@
+"""Move sparse entity FKs off extracted_facts into extracted_fact_refs.
+
+Revision ID: 20261016000001
+Revises: 20260107000002
+Create Date: 2026-10-16 00:00:01.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000001"
+down_revision = "20260107000002"
+branch_labels = None
+depends_on = None
+
+
+# ref_type -> table its ref_id points at; mirrors models_db.FACT_REF_TYPES
+_REF_TARGETS = {
+    "person": "people",
+    "organization": "organizations",
+    "agent": "agents",
+    "task": "tasks",
+    "product": "products",
+    "product_mention": "call_product_mentions",
+    "offer": "offers",
+}
+
+# (ref_type, legacy extracted_facts column)
+_REF_COLUMNS = [
+    ("person", "person_id"),
+    ("organization", "organization_id"),
+    ("agent", "agent_id"),
+    ("task", "task_id"),
+    ("product", "product_id"),
+    ("offer", "offer_id"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "extracted_fact_refs",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
+        sa.Column(
+            "fact_id",
+            sa.BigInteger(),
+            sa.ForeignKey("extracted_facts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("ref_type", sa.String(), nullable=False),
+        sa.Column("ref_id", sa.BigInteger(), nullable=False),
+        sa.CheckConstraint(
+            "ref_type IN ({})".format(", ".join(f"'{t}'" for t in _REF_TARGETS)),
+            name="chk_extracted_fact_refs_ref_type",
+        ),
+    )
+    op.create_index("idx_extracted_fact_refs_fact_id", "extracted_fact_refs", ["fact_id"])
+    op.create_index("idx_extracted_fact_refs_ref", "extracted_fact_refs", ["ref_type", "ref_id"])
+
+    # ref_id cannot carry a FK, so replace the old ON DELETE SET NULL with
+    # per-table triggers that drop refs to deleted rows
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION delete_extracted_fact_refs() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM extracted_fact_refs
+            WHERE ref_type = TG_ARGV[0] AND ref_id = OLD.id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for ref_type, table in _REF_TARGETS.items():
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_delete_fact_refs AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION delete_extracted_fact_refs('{ref_type}')"
+        )
+
+    # Copy existing links, then drop the mostly-NULL columns
+    for ref_type, column in _REF_COLUMNS:
+        op.execute(
+            f"INSERT INTO extracted_fact_refs (fact_id, ref_type, ref_id) "
+            f"SELECT id, '{ref_type}', {column} FROM extracted_facts WHERE {column} IS NOT NULL"
+        )
+    for _, column in _REF_COLUMNS:
+        op.drop_column("extracted_facts", column)
+
+
+def downgrade() -> None:
+    for table in _REF_TARGETS.values():
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_delete_fact_refs ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS delete_extracted_fact_refs()")
+
+    for ref_type, column in _REF_COLUMNS:
+        op.add_column(
+            "extracted_facts",
+            sa.Column(
+                column,
+                sa.BigInteger(),
+                sa.ForeignKey(f"{_REF_TARGETS[ref_type]}.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+        )
+    # Only refs whose target still exists can be restored under the FKs
+    for ref_type, column in _REF_COLUMNS:
+        table = _REF_TARGETS[ref_type]
+        op.execute(
+            f"UPDATE extracted_facts f SET {column} = r.ref_id "
+            f"FROM extracted_fact_refs r JOIN {table} t ON t.id = r.ref_id "
+            f"WHERE r.fact_id = f.id AND r.ref_type = '{ref_type}'"
+        )
+    op.drop_index("idx_extracted_fact_refs_ref", table_name="extracted_fact_refs")
+    op.drop_index("idx_extracted_fact_refs_fact_id", table_name="extracted_fact_refs")
+    op.drop_table("extracted_fact_refs")
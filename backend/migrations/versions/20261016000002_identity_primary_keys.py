@@ -0,0 +1,93 @@
+"""Convert serial primary keys to GENERATED BY DEFAULT AS IDENTITY.
+
+Revision ID: 20261016000002
+Revises: 20261016000001
+Create Date: 2026-10-16 00:00:02.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000002"
+down_revision = "20261016000001"
+branch_labels = None
+depends_on = None
+
+
+_TABLES = [
+    "calls",
+    "dialogue_turns",
+    "call_summaries",
+    "agents",
+    "people",
+    "organizations",
+    "person_organizations",
+    "identifiers",
+    "addresses",
+    "entity_addresses",
+    "extractions",
+    "products",
+    "tasks",
+    "offers",
+    "call_product_mentions",
+    "extracted_facts",
+    "extracted_fact_refs",
+]
+
+# IDs reserved per backend session; avoids a nextval() round-trip per row
+# during bulk ingest of turns/facts. Gaps after restarts are expected.
+_IDENTITY_CACHE = 1000
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"""
+            DO $$
+            DECLARE
+                seq_name text := pg_get_serial_sequence('{table}', 'id');
+                next_id bigint;
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'id' AND is_identity = 'YES'
+                ) THEN
+                    RETURN;
+                END IF;
+                SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM {table};
+                ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+                IF seq_name IS NOT NULL THEN
+                    EXECUTE 'DROP SEQUENCE ' || seq_name;
+                END IF;
+                EXECUTE format(
+                    'ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY '
+                    '(START WITH %s CACHE {_IDENTITY_CACHE})',
+                    next_id
+                );
+            END $$;
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"""
+            DO $$
+            DECLARE
+                next_id bigint;
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'id' AND is_identity = 'YES'
+                ) THEN
+                    RETURN;
+                END IF;
+                SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM {table};
+                ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY;
+                CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id;
+                PERFORM setval('{table}_id_seq', next_id, false);
+                ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq');
+            END $$;
+            """
+        )
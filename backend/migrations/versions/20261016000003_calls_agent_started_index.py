@@ -0,0 +1,28 @@
+"""Add (agent_fk, started_at) index for per-agent call pagination.
+
+Revision ID: 20261016000003
+Revises: 20261016000002
+Create Date: 2026-10-16 00:00:03.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000003"
+down_revision = "20261016000002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Column order/direction must match paginate_calls_for_agent's ORDER BY
+    op.create_index(
+        "idx_calls_agent_started",
+        "calls",
+        ["agent_fk", sa.text("started_at DESC NULLS LAST"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_calls_agent_started", table_name="calls")
@@ -0,0 +1,66 @@
+"""Move cold snapshot insight columns from calls to call_insights.
+
+Revision ID: 20261016000004
+Revises: 20261016000003
+Create Date: 2026-10-16 00:00:04.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261016000004"
+down_revision = "20261016000003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "call_insights",
+        sa.Column(
+            "call_id",
+            sa.BigInteger(),
+            sa.ForeignKey("calls.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("entities", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("intent", sa.String(), nullable=True),
+        sa.Column("resolution", sa.String(), nullable=True),
+        sa.Column("confidence_score", sa.Double(), nullable=True),
+    )
+    op.execute(
+        """
+        INSERT INTO call_insights (call_id, entities, intent, resolution, confidence_score)
+        SELECT id, entities, intent, resolution, confidence_score
+        FROM calls
+        WHERE entities IS NOT NULL
+           OR intent IS NOT NULL
+           OR resolution IS NOT NULL
+           OR confidence_score IS NOT NULL
+        """
+    )
+    op.drop_column("calls", "confidence_score")
+    op.drop_column("calls", "resolution")
+    op.drop_column("calls", "intent")
+    op.drop_column("calls", "entities")
+
+
+def downgrade() -> None:
+    op.add_column("calls", sa.Column("entities", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column("calls", sa.Column("intent", sa.String(), nullable=True))
+    op.add_column("calls", sa.Column("resolution", sa.String(), nullable=True))
+    op.add_column("calls", sa.Column("confidence_score", sa.Double(), nullable=True))
+    op.execute(
+        """
+        UPDATE calls c
+        SET entities = i.entities,
+            intent = i.intent,
+            resolution = i.resolution,
+            confidence_score = i.confidence_score
+        FROM call_insights i
+        WHERE i.call_id = c.id
+        """
+    )
+    op.drop_table("call_insights")
@@ -0,0 +1,46 @@
+"""Bound enum-like string columns and add (status, started_at) index on calls.
+
+Revision ID: 20261016000005
+Revises: 20261016000004
+Create Date: 2026-10-16 00:00:05.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000005"
+down_revision = "20261016000004"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, max length); fails loudly if existing data is longer
+_BOUNDED_COLUMNS = [
+    ("calls", "direction", 32),
+    ("calls", "language", 32),
+    ("calls", "stt_model", 64),
+    ("calls", "status", 32),
+    ("call_summaries", "summary_type", 32),
+    ("identifiers", "identifier_type", 32),
+    ("entity_addresses", "address_type", 32),
+    ("extractions", "run_type", 32),
+    ("extractions", "status", 32),
+    ("extracted_facts", "fact_type", 32),
+    ("extracted_facts", "status", 32),
+    ("extracted_fact_refs", "ref_type", 32),
+    ("tasks", "status", 32),
+    ("offers", "status", 32),
+]
+
+
+def upgrade() -> None:
+    for table, column, length in _BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length), existing_type=sa.String())
+    op.create_index("idx_calls_status_started", "calls", ["status", "started_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_calls_status_started", table_name="calls")
+    for table, column, length in _BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(), existing_type=sa.String(length))
@@ -0,0 +1,39 @@
+"""Add a BRIN index on extracted_facts.created_at and leave room for HOT updates.
+
+Revision ID: 20261016000006
+Revises: 20261016000005
+Create Date: 2026-10-16 00:00:06.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000006"
+down_revision = "20261016000005"
+branch_labels = None
+depends_on = None
+
+
+# Tables whose rows get status updates after insert. Free space on each page
+# lets Postgres keep the new row version on the same page (HOT update).
+# Only pages written after this change are affected.
+_HOT_UPDATE_TABLES = ["tasks", "offers", "extracted_facts"]
+_FILLFACTOR = 90
+
+
+def upgrade() -> None:
+    for table in _HOT_UPDATE_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {_FILLFACTOR})")
+    op.create_index(
+        "idx_extracted_facts_created_brin",
+        "extracted_facts",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_extracted_facts_created_brin", table_name="extracted_facts")
+    for table in _HOT_UPDATE_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,43 @@
+"""Add jsonb_path_ops GIN indexes for containment queries on JSONB payloads.
+
+Revision ID: 20261016000007
+Revises: 20261016000006
+Create Date: 2026-10-16 00:00:07.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000007"
+down_revision = "20261016000006"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column). jsonb_path_ops supports only @> and the jsonpath
+# operators, but is much smaller than the default jsonb_ops.
+_GIN_INDEXES = [
+    ("idx_extractions_raw_payload_gin", "extractions", "raw_payload"),
+    ("idx_extracted_facts_value_gin", "extracted_facts", "value"),
+    ("idx_call_insights_entities_gin", "call_insights", "entities"),
+]
+
+
+def upgrade() -> None:
+    # Tables hold production data; build without blocking writes
+    with op.get_context().autocommit_block():
+        for name, table, column in _GIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in _GIN_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
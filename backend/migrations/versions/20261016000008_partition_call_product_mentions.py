@@ -0,0 +1,85 @@
+"""Hash-partition call_product_mentions by call_id.
+
+extracted_facts is left unpartitioned: its id is the target of FKs from
+tasks, offers, call_product_mentions and extracted_fact_refs, and a
+partitioned table can only be referenced through a key that includes the
+partition column.
+
+Revision ID: 20261016000008
+Revises: 20261016000007
+Create Date: 2026-10-16 00:00:08.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000008"
+down_revision = "20261016000007"
+branch_labels = None
+depends_on = None
+
+
+_PARTITIONS = 16
+
+# (constraint, column, referenced table, ON DELETE action)
+_FOREIGN_KEYS = [
+    ("call_product_mentions_call_id_fkey", "call_id", "calls", "CASCADE"),
+    ("call_product_mentions_product_id_fkey", "product_id", "products", "SET NULL"),
+    ("call_product_mentions_extraction_id_fkey", "extraction_id", "extractions", "SET NULL"),
+    ("fk_call_product_mentions_fact_id", "fact_id", "extracted_facts", "SET NULL"),
+    ("call_product_mentions_person_id_fkey", "person_id", "people", "SET NULL"),
+    ("call_product_mentions_organization_id_fkey", "organization_id", "organizations", "SET NULL"),
+]
+
+
+def upgrade() -> None:
+    # Every query filters on call_id, so each one touches a single partition.
+    # The primary key must include the partition column.
+    _rebuild(
+        "PRIMARY KEY (id, call_id)) PARTITION BY HASH (call_id)",
+        partitions=_PARTITIONS,
+    )
+
+
+def downgrade() -> None:
+    _rebuild("PRIMARY KEY (id))", partitions=0)
+
+
+def _rebuild(table_suffix: str, partitions: int) -> None:
+    """Copy call_product_mentions into a new table layout and swap it in."""
+    op.execute(
+        "CREATE TABLE call_product_mentions_rebuild (LIKE call_product_mentions "
+        "INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS, " + table_suffix
+    )
+    for i in range(partitions):
+        op.execute(
+            f"CREATE TABLE call_product_mentions_p{i} PARTITION OF call_product_mentions_rebuild "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {i})"
+        )
+    op.execute("INSERT INTO call_product_mentions_rebuild SELECT * FROM call_product_mentions")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('call_product_mentions_rebuild', 'id'), "
+        "COALESCE(MAX(id), 0) + 1, false) FROM call_product_mentions_rebuild"
+    )
+
+    # Drops the old indexes, FKs and fact-ref trigger along with the table
+    op.execute("DROP TABLE call_product_mentions")
+    op.execute("ALTER TABLE call_product_mentions_rebuild RENAME TO call_product_mentions")
+    op.execute(
+        "ALTER SEQUENCE call_product_mentions_rebuild_id_seq RENAME TO call_product_mentions_id_seq"
+    )
+
+    for name, column, target, on_delete in _FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE call_product_mentions ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {target}(id) ON DELETE {on_delete}"
+        )
+    op.create_index("idx_call_product_mentions_call_id", "call_product_mentions", ["call_id"])
+    op.execute(
+        "CREATE UNIQUE INDEX uq_call_product_mentions_call_stable_key "
+        "ON call_product_mentions(call_id, stable_key) WHERE stable_key IS NOT NULL"
+    )
+    op.execute(
+        "CREATE TRIGGER trg_call_product_mentions_delete_fact_refs AFTER DELETE ON call_product_mentions "
+        "FOR EACH ROW EXECUTE FUNCTION delete_extracted_fact_refs('product_mention')"
+    )
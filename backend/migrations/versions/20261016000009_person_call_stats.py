@@ -0,0 +1,47 @@
+"""Add incrementally maintained call statistics to people.
+
+Revision ID: 20261016000009
+Revises: 20261016000008
+Create Date: 2026-10-16 00:00:09.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000009"
+down_revision = "20261016000008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("people", sa.Column("call_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("people", sa.Column("first_call_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("people", sa.Column("last_call_at", sa.DateTime(timezone=True), nullable=True))
+
+    # Backfill from calls already linked; new links are counted by the worker
+    op.execute(
+        """
+        UPDATE people p
+        SET call_count = s.call_count,
+            first_call_at = s.first_call_at,
+            last_call_at = s.last_call_at
+        FROM (
+            SELECT person_id,
+                   COUNT(*) AS call_count,
+                   MIN(created_at) AS first_call_at,
+                   MAX(created_at) AS last_call_at
+            FROM calls
+            WHERE person_id IS NOT NULL
+            GROUP BY person_id
+        ) s
+        WHERE s.person_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("people", "last_call_at")
+    op.drop_column("people", "first_call_at")
+    op.drop_column("people", "call_count")
@@ -0,0 +1,33 @@
+"""Replace idx_calls_person_id with a (person_id, created_at) index.
+
+Revision ID: 20261016000010
+Revises: 20261016000009
+Create Date: 2026-10-16 00:00:10.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000010"
+down_revision = "20261016000009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # COUNT/MIN/MAX(created_at) per person becomes an index-only scan; the
+    # single-column index is a prefix of the new one and is dropped
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_calls_person_created",
+            "calls",
+            ["person_id", "created_at"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("idx_calls_person_id", table_name="calls", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("idx_calls_person_id", "calls", ["person_id"], postgresql_concurrently=True)
+        op.drop_index("idx_calls_person_created", table_name="calls", postgresql_concurrently=True)
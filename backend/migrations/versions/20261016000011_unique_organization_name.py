@@ -0,0 +1,70 @@
+"""Merge duplicate organizations and make organizations.name unique.
+
+Revision ID: 20261016000011
+Revises: 20261016000010
+Create Date: 2026-10-16 00:00:11.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000011"
+down_revision = "20261016000010"
+branch_labels = None
+depends_on = None
+
+
+# Plain FK columns pointing at organizations.id
+_ORG_REFERENCES = [
+    ("calls", "organization_id"),
+    ("identifiers", "organization_id"),
+    ("entity_addresses", "organization_id"),
+    ("tasks", "organization_id"),
+    ("offers", "organization_id"),
+    ("call_product_mentions", "organization_id"),
+]
+
+
+def upgrade() -> None:
+    # Racing workers could create the same organization twice; keep the oldest
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE organization_merges ON COMMIT DROP AS
+        SELECT id AS duplicate_id, keep_id
+        FROM (
+            SELECT id, MIN(id) OVER (PARTITION BY name) AS keep_id FROM organizations
+        ) o
+        WHERE id <> keep_id
+        """
+    )
+    for table, column in _ORG_REFERENCES:
+        op.execute(
+            f"UPDATE {table} t SET {column} = m.keep_id "
+            f"FROM organization_merges m WHERE t.{column} = m.duplicate_id"
+        )
+    # Before the delete below, whose trigger would drop these refs
+    op.execute(
+        "UPDATE extracted_fact_refs r SET ref_id = m.keep_id "
+        "FROM organization_merges m WHERE r.ref_type = 'organization' AND r.ref_id = m.duplicate_id"
+    )
+    # (person, org, role) is unique: copy memberships over, skipping ones the
+    # kept organization already has; the originals cascade with the delete
+    op.execute(
+        """
+        INSERT INTO person_organizations (person_id, organization_id, role, is_primary, created_at)
+        SELECT DISTINCT ON (po.person_id, m.keep_id, po.role)
+               po.person_id, m.keep_id, po.role, po.is_primary, po.created_at
+        FROM person_organizations po
+        JOIN organization_merges m ON po.organization_id = m.duplicate_id
+        ORDER BY po.person_id, m.keep_id, po.role, po.created_at
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute("DELETE FROM organizations WHERE id IN (SELECT duplicate_id FROM organization_merges)")
+
+    op.create_unique_constraint("uq_organizations_name", "organizations", ["name"])
+
+
+def downgrade() -> None:
+    # Merged duplicates are not restored
+    op.drop_constraint("uq_organizations_name", "organizations", type_="unique")
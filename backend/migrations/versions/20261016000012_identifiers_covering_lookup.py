@@ -0,0 +1,41 @@
+"""Make the identifier uniqueness index cover the identity lookup.
+
+Revision ID: 20261016000012
+Revises: 20261016000011
+Create Date: 2026-10-16 00:00:12.000000
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016000012"
+down_revision = "20261016000011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Identity resolution reads (id, person_id, organization_id) by
+    # (identifier_type, normalized_value); carrying them in the unique index
+    # makes that an index-only scan. It still serves as the ON CONFLICT
+    # target, so the plain unique constraint is redundant and dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_identifiers_lookup",
+            "identifiers",
+            ["identifier_type", "normalized_value"],
+            unique=True,
+            postgresql_include=["id", "person_id", "organization_id"],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint("uq_identifiers_type_normalized", "identifiers", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        "uq_identifiers_type_normalized",
+        "identifiers",
+        ["identifier_type", "normalized_value"],
+    )
+    with op.get_context().autocommit_block():
+        op.drop_index("uq_identifiers_lookup", table_name="identifiers", postgresql_concurrently=True)
@@ -0,0 +1,48 @@
+"""Add person_id_aliases for conflicting identifier matches.
+
+Revision ID: 20261016000013
+Revises: 20261016000012
+Create Date: 2026-10-16 00:00:13.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000013"
+down_revision = "20261016000012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "person_id_aliases",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False, start=1, cache=1000), primary_key=True),
+        sa.Column(
+            "person_id",
+            sa.BigInteger(),
+            sa.ForeignKey("people.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "alias_person_id",
+            sa.BigInteger(),
+            sa.ForeignKey("people.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="needs_review"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.UniqueConstraint("person_id", "alias_person_id", name="uq_person_id_aliases_pair"),
+        # One row per unordered pair: (A, B) and (B, A) would both pass the unique constraint
+        sa.CheckConstraint("person_id < alias_person_id", name="chk_person_id_aliases_ordered"),
+    )
+    op.create_index(
+        "idx_person_id_aliases_alias_person_id", "person_id_aliases", ["alias_person_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_person_id_aliases_alias_person_id", table_name="person_id_aliases")
+    op.drop_table("person_id_aliases")
@@ -0,0 +1,102 @@
+"""Re-key fact/business-object stable keys to orjson + BLAKE2b.
+
+stable_key makes postprocess reruns idempotent: tasks, offers and product
+mentions are matched on (call_id, stable_key). The worker now hashes the
+orjson encoding of the payload with blake2b(digest_size=8) instead of the
+SHA-256 of its json.dumps encoding, so existing keys are recomputed from
+each fact's stored value; otherwise reprocessing an older call would
+duplicate them. Keys whose old form does not reproduce from the stored
+value are left as is.
+
+Revision ID: 20261016000014
+Revises: 20261016000013
+Create Date: 2026-10-16 00:00:14.000000
+"""
+
+import hashlib
+import json
+
+from alembic import op
+import orjson
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = "20261016000014"
+down_revision = "20261016000013"
+branch_labels = None
+depends_on = None
+
+
+# Tables matched on (call_id, stable_key) by the postprocess worker
+_KEYED_TABLES = ["extracted_facts", "tasks", "offers", "call_product_mentions"]
+
+_facts = sa.table(
+    "extracted_facts",
+    sa.column("call_id", sa.BigInteger),
+    sa.column("fact_type", sa.String),
+    sa.column("value", JSONB),
+    sa.column("stable_key", sa.String),
+)
+
+
+# Frozen copies of the worker's _stable_key before and after this migration
+
+def _payload(call_id: int, fact_type: str, value: dict) -> dict:
+    return {"call_id": call_id, "fact_type": fact_type, "label": None, "value": value}
+
+
+def _sha256_key(call_id: int, fact_type: str, value: dict) -> str:
+    raw = json.dumps(_payload(call_id, fact_type, value), sort_keys=True, separators=(",", ":"))
+    return f"{fact_type}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _blake2b_key(call_id: int, fact_type: str, value: dict) -> str:
+    raw = orjson.dumps(_payload(call_id, fact_type, value), option=orjson.OPT_SORT_KEYS)
+    return f"{fact_type}:{hashlib.blake2b(raw, digest_size=8).hexdigest()}"
+
+
+def upgrade() -> None:
+    _rekey(_sha256_key, _blake2b_key)
+
+
+def downgrade() -> None:
+    _rekey(_blake2b_key, _sha256_key)
+
+
+def _rekey(old_key, new_key) -> None:
+    bind = op.get_bind()
+    rows = bind.execution_options(yield_per=1000).execute(
+        sa.select(_facts.c.call_id, _facts.c.fact_type, _facts.c.value, _facts.c.stable_key)
+        .where(_facts.c.stable_key.is_not(None), _facts.c.value.is_not(None))
+    )
+    mappings = {}
+    for call_id, fact_type, value, stable_key in rows:
+        if (call_id, stable_key) not in mappings and stable_key == old_key(call_id, fact_type, value):
+            mappings[call_id, stable_key] = new_key(call_id, fact_type, value)
+    if not mappings:
+        return
+
+    op.execute(
+        "CREATE TEMPORARY TABLE stable_key_rekeys "
+        "(call_id BIGINT, old_key TEXT, new_key TEXT, PRIMARY KEY (call_id, old_key)) "
+        "ON COMMIT DROP"
+    )
+    rekeys = sa.table(
+        "stable_key_rekeys",
+        sa.column("call_id", sa.BigInteger),
+        sa.column("old_key", sa.Text),
+        sa.column("new_key", sa.Text),
+    )
+    bind.execute(
+        rekeys.insert(),
+        [
+            {"call_id": call_id, "old_key": old, "new_key": new}
+            for (call_id, old), new in mappings.items()
+        ],
+    )
+    for table in _KEYED_TABLES:
+        op.execute(
+            f"UPDATE {table} t SET stable_key = r.new_key FROM stable_key_rekeys r "
+            f"WHERE t.call_id = r.call_id AND t.stable_key = r.old_key"
+        )
@@ -0,0 +1,24 @@
+"""Add calls.content_hash to skip re-persisting unchanged jobs.
+
+Revision ID: 20261016000015
+Revises: 20261016000014
+Create Date: 2026-10-16 00:00:15.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000015"
+down_revision = "20261016000014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: a metadata-only change, even on a large table
+    op.add_column("calls", sa.Column("content_hash", sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("calls", "content_hash")
@@ -0,0 +1,51 @@
+"""Make (call_id, turn_index) unique on dialogue_turns and add content_hash.
+
+The postprocess worker now merges turns with ON CONFLICT (call_id,
+turn_index) instead of deleting and re-inserting them on every run.
+
+Revision ID: 20261016000016
+Revises: 20261016000015
+Create Date: 2026-10-16 00:00:16.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016000016"
+down_revision = "20261016000015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("dialogue_turns", sa.Column("content_hash", sa.String(length=16), nullable=True))
+    # Turns were always replaced wholesale, but keep only the newest copy just in case
+    op.execute(
+        "DELETE FROM dialogue_turns a USING dialogue_turns b "
+        "WHERE a.call_id = b.call_id AND a.turn_index = b.turn_index AND a.id < b.id"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_dialogue_turns_call_turn",
+            "dialogue_turns",
+            ["call_id", "turn_index"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        # Both are prefixes of (or equal to) the unique index
+        op.drop_index("idx_dialogue_turns_call_turn", table_name="dialogue_turns", postgresql_concurrently=True)
+        op.drop_index("idx_dialogue_turns_call_id", table_name="dialogue_turns", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index("idx_dialogue_turns_call_id", "dialogue_turns", ["call_id"], postgresql_concurrently=True)
+        op.create_index(
+            "idx_dialogue_turns_call_turn",
+            "dialogue_turns",
+            ["call_id", "turn_index"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("uq_dialogue_turns_call_turn", table_name="dialogue_turns", postgresql_concurrently=True)
+    op.drop_column("dialogue_turns", "content_hash")
@@ -3,13 +3,38 @@
 import logging
 from datetime import datetime
 from typing import Optional, Tuple
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
-from backend.common.models_db import Agent, Person, Organization, Identifier, Call
+from backend.common.models_db import Agent, Person, Organization, Identifier, PersonIdAlias
+from backend.common.phone_utils import normalize_email, normalize_phone_e164
 
 logger = logging.getLogger(__name__)
 
+# Built once: the (type, value) pairs are bound per call through an expanding
+# parameter, so every lookup reuses the same statement and its cached compilation.
+# Only columns in uq_identifiers_lookup are loaded, keeping it an index-only scan.
+_IDENTIFIER_LOOKUP = (
+    select(Identifier)
+    .options(
+        load_only(
+            Identifier.identifier_type,
+            Identifier.normalized_value,
+            Identifier.person_id,
+            Identifier.organization_id,
+        ),
+        selectinload(Identifier.person),
+        selectinload(Identifier.organization),
+    )
+    .where(
+        tuple_(Identifier.identifier_type, Identifier.normalized_value).in_(
+            bindparam("identifier_pairs", expanding=True)
+        )
+    )
+)
+
 
 async def resolve_or_create_agent(
     session: AsyncSession,
@@ -19,16 +44,18 @@ async def resolve_or_create_agent(
     if not external_agent_id:
         return None
 
-    result = await session.execute(
-        select(Agent).where(Agent.external_agent_id == external_agent_id)
+    # One round-trip whether or not the agent exists; race-safe across workers.
+    # DO NOTHING would return no row for an existing agent, hence the update.
+    agent = await session.scalar(
+        pg_insert(Agent)
+        .values(external_agent_id=external_agent_id)
+        .on_conflict_do_update(
+            index_elements=["external_agent_id"],
+            set_={"updated_at": func.now()},
+        )
+        .returning(Agent),
+        execution_options={"populate_existing": True},
     )
-    agent = result.scalar_one_or_none()
-
-    if agent is None:
-        agent = Agent(external_agent_id=external_agent_id)
-        session.add(agent)
-        await session.flush()
-        logger.info("Created new agent: %s", external_agent_id)
 
     return agent
 
@@ -39,161 +66,152 @@ async def resolve_or_create_person_org(
     emails: list[str],
     person_names: list[str],
     company_names: list[str],
+    default_region: str = "US",
 ) -> Tuple[Optional[Person], Optional[Organization]]:
     """
     Resolve or create person/organization via identifiers (phone/email).
+    Phones and emails are raw values; they are normalized here, phones to
+    E.164 using ``default_region`` for numbers without a country code.
     Returns (person, organization) tuple.
     """
     person: Optional[Person] = None
     organization: Optional[Organization] = None
+    identifier_pairs = _identifier_pairs(phones, emails, default_region)
 
-    # Try to resolve by phone first
-    for phone in phones:
-        if not phone:
-            continue
+    # Look all candidates up in one round-trip; the first match in priority order wins
+    if identifier_pairs:
         result = await session.execute(
-            select(Identifier).where(
-                Identifier.identifier_type == "phone",
-                Identifier.normalized_value == phone,
-            )
+            _IDENTIFIER_LOOKUP, {"identifier_pairs": identifier_pairs}
         )
-        ident = result.scalar_one_or_none()
-        if ident is not None:
+        found = {(ident.identifier_type, ident.normalized_value): ident for ident in result.scalars()}
+
+        # Identifiers of different people: record the conflict and link nothing
+        person_ids = list(dict.fromkeys(
+            found[pair].person_id
+            for pair in identifier_pairs
+            if pair in found and found[pair].person_id is not None
+        ))
+        if len(person_ids) > 1:
+            await _flag_person_aliases(session, person_ids[0], person_ids[1:])
+            return None, None
+
+        for identifier_type, value in identifier_pairs:
+            ident = found.get((identifier_type, value))
+            if ident is None:
+                continue
             person = ident.person
             organization = ident.organization
-            logger.info("Resolved person/org by phone: %s", phone)
-            
+            logger.debug("Resolved person/org by %s: %s", identifier_type, value)
+
             # Update person name if currently missing and we have a hint
             if person and not person.full_name and person_names:
                 person.full_name = person_names[0]
-                logger.info("Updated resolved person name: %s", person.full_name)
-            
-            break
+                logger.debug("Updated resolved person name: %s", person.full_name)
 
-    # Fall back to email
-    if person is None and emails:
-        for email in emails:
-            if not email:
-                continue
-            result = await session.execute(
-                select(Identifier).where(
-                    Identifier.identifier_type == "email",
-                    Identifier.normalized_value == email,
-                )
-            )
-            ident = result.scalar_one_or_none()
-            if ident is not None:
-                person = ident.person
-                organization = ident.organization
-                logger.info("Resolved person/org by email: %s", email)
-                
-                # Update person name if currently missing and we have a hint
-                if person and not person.full_name and person_names:
-                    person.full_name = person_names[0]
-                    logger.info("Updated resolved person name: %s", person.full_name)
-                
-                break
+            break
 
     # If still unresolved, create new person (and optional org)
-    if person is None and (phones or emails):
+    if person is None and identifier_pairs:
         full_name = person_names[0] if person_names else None
-        person = Person(full_name=full_name)
-        session.add(person)
-        await session.flush()
+        # INSERT ... RETURNING gives the id without flushing the whole session
+        person = await session.scalar(
+            insert(Person).values(full_name=full_name).returning(Person)
+        )
         logger.info("Created new person: %s", full_name)
 
         if company_names:
-            org_name = company_names[0]
-            org_result = await session.execute(
-                select(Organization).where(Organization.name == org_name)
-            )
-            organization = org_result.scalar_one_or_none()
-            if organization is None:
-                organization = Organization(name=org_name)
-                session.add(organization)
-                await session.flush()
-                logger.info("Created new organization: %s", org_name)
-
-        # Create identifiers for newly created person/org
-        for phone in phones:
-            if phone:
-                # Check if identifier already exists (race condition safety)
-                existing_ident_result = await session.execute(
-                    select(Identifier).where(
-                        Identifier.identifier_type == "phone",
-                        Identifier.normalized_value == phone,
-                    )
+            # Same single round-trip upsert as agents (uq_organizations_name)
+            organization = await session.scalar(
+                pg_insert(Organization)
+                .values(name=company_names[0])
+                .on_conflict_do_update(
+                    index_elements=["name"],
+                    set_={"updated_at": func.now()},
                 )
-                existing_ident = existing_ident_result.scalar_one_or_none()
-                if existing_ident is None:
-                    session.add(
-                        Identifier(
-                            identifier_type="phone",
-                            identifier_value=phone,
-                            normalized_value=phone,
-                            person_id=person.id,
-                            organization_id=organization.id if organization else None,
-                        )
-                    )
-        for email in emails:
-            if email:
-                # Check if identifier already exists (race condition safety)
-                existing_ident_result = await session.execute(
-                    select(Identifier).where(
-                        Identifier.identifier_type == "email",
-                        Identifier.normalized_value == email,
-                    )
+                .returning(Organization),
+                execution_options={"populate_existing": True},
+            )
+
+        # Create identifiers for newly created person/org.
+        # ON CONFLICT only touches updated_at, so identifiers already claimed
+        # by another person (e.g. a concurrent worker) keep their links.
+        # The pairs must be unique: Postgres rejects a multi-row
+        # ON CONFLICT DO UPDATE that touches the same row twice.
+        identifier_rows = [
+            {
+                "identifier_type": identifier_type,
+                "identifier_value": value,
+                "normalized_value": value,
+                "person_id": person.id,
+                "organization_id": organization.id if organization else None,
+            }
+            for identifier_type, value in identifier_pairs
+        ]
+        if identifier_rows:
+            await session.execute(
+                pg_insert(Identifier)
+                .values(identifier_rows)
+                .on_conflict_do_update(
+                    index_elements=["identifier_type", "normalized_value"],
+                    set_={"updated_at": func.now()},
                 )
-                existing_ident = existing_ident_result.scalar_one_or_none()
-                if existing_ident is None:
-                    session.add(
-                        Identifier(
-                            identifier_type="email",
-                            identifier_value=email,
-                            normalized_value=email,
-                            person_id=person.id,
-                            organization_id=organization.id if organization else None,
-                        )
-                    )
+            )
     
-    # Update person statistics if person exists
-    if person:
-        await update_person_stats(session, person.id)
-
     return person, organization
 
 
-async def update_person_stats(session: AsyncSession, person_id: int) -> None:
-    """
-    Update person statistics based on linked calls.
-    Called after linking a call to a person.
+async def _flag_person_aliases(
+    session: AsyncSession, person_id: int, alias_person_ids: list[int]
+) -> None:
+    """Queue possible duplicates of ``person_id`` for review.
+
+    Pairs are stored lower id first, so the same two people are flagged
+    once whichever of them a later call's identifiers resolve to first.
     """
-    # Count calls linked to this person
-    call_count_result = await session.execute(
-        select(func.count(Call.id)).where(Call.person_id == person_id)
+    logger.warning(
+        "Identifiers resolve to multiple people %s; leaving call unlinked",
+        [person_id, *alias_person_ids],
     )
-    call_count = call_count_result.scalar() or 0
-    
-    # Get first and last call dates
-    first_call_result = await session.execute(
-        select(Call.created_at)
-        .where(Call.person_id == person_id)
-        .order_by(Call.created_at)
-        .limit(1)
+    pairs = sorted({
+        (min(person_id, alias_id), max(person_id, alias_id)) for alias_id in alias_person_ids
+    })
+    await session.execute(
+        pg_insert(PersonIdAlias)
+        .values([
+            {"person_id": low_id, "alias_person_id": high_id} for low_id, high_id in pairs
+        ])
+        .on_conflict_do_nothing(index_elements=["person_id", "alias_person_id"])
     )
-    first_call_date = first_call_result.scalar_one_or_none()
-    
-    last_call_result = await session.execute(
-        select(Call.created_at)
-        .where(Call.person_id == person_id)
-        .order_by(Call.created_at.desc())
-        .limit(1)
-    )
-    last_call_date = last_call_result.scalar_one_or_none()
-    
-    # Update person record (requires adding fields to Person model first)
-    # For now, just log - we'll add fields to model next
-    logger.info(
-        "Person %s stats: %d calls, first: %s, last: %s",
-        person_id, call_count, first_call_date, last_call_date
+
+
+def _identifier_pairs(
+    phones: list[str], emails: list[str], default_region: str
+) -> list[tuple[str, str]]:
+    """Normalized, deduplicated (type, value) pairs in priority order: phones, then emails.
+
+    The caller's own number often repeats among the LLM hints: exact copies
+    are dropped before normalizing, differently formatted ones after.
+    """
+    pairs = [
+        ("phone", normalize_phone_e164(phone, default_country=default_region))
+        for phone in dict.fromkeys(phones)
+        if phone
+    ]
+    pairs += [("email", normalize_email(email)) for email in dict.fromkeys(emails) if email]
+    return list(dict.fromkeys(pair for pair in pairs if pair[1]))
+
+
+async def update_person_stats(session: AsyncSession, person_id: int, call_at: datetime) -> None:
+    """
+    Count a newly linked call towards the person's statistics.
+    Called once per call when it is first linked to the person.
+    """
+    await session.execute(
+        update(Person)
+        .where(Person.id == person_id)
+        .values(
+            call_count=Person.call_count + 1,
+            first_call_at=func.least(func.coalesce(Person.first_call_at, call_at), call_at),
+            last_call_at=func.greatest(func.coalesce(Person.last_call_at, call_at), call_at),
+        )
     )
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import hashlib
-import json
 import logging
 import re
 import signal
+import threading
 import time
 from datetime import datetime
 from typing import Optional
 
+import orjson
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from backend.common.config import Settings, get_settings
 from backend.common.constants import QUEUE_POSTPROCESS_JOBS
 from backend.common.db import db_settings
 from backend.common.logging_utils import configure_logging
 from backend.common.models import JobStatus, JobMetadata, QueueMessage
-from backend.common.phone_utils import normalize_phone_e164, normalize_email
 from backend.common.models_db import (
     Call,
+    CallInsights,
     DialogueTurn,
     CallSummary,
     Agent,
@@ -27,19 +33,55 @@ from backend.common.models_db import (
     EntityAddress,
     Extraction,
     ExtractedFact,
+    ExtractedFactRef,
     Task,
     Offer,
     CallProductMention,
 )
-from backend.common.redis_utils import pop_message, update_job, get_job
-from backend.common.db import get_session, engine, Base
+from backend.common.redis_utils import ack_message, pop_messages, update_and_get_job, update_job
+from backend.common.db import SessionLocal, get_session, engine, Base, json_dumps
 from backend.postprocess_service.app.identity_resolver import (
     resolve_or_create_agent,
     resolve_or_create_person_org,
+    update_person_stats,
 )
 
 logger = logging.getLogger("postprocess_worker")
 
+# Business-object lists in summary entities, per speaker or flat
+_ENTITY_KINDS = ("tasks", "offers", "products")
+
+# Stereo channel -> speaker role; other channels map to "unknown"
+_CHANNEL_SPEAKERS = {0: "agent", 1: "customer"}
+
+# Column order of the records built by _copy_dialogue_turns
+_DIALOGUE_TURN_COPY_COLUMNS = (
+    "call_id",
+    "turn_index",
+    "speaker",
+    "channel",
+    "start_sec",
+    "end_sec",
+    "text",
+    "raw_json",
+    "content_hash",
+)
+
+# Turns are COPYed into a per-transaction staging table and merged from there:
+# COPY itself cannot upsert, and unchanged turns should not be rewritten
+_DIALOGUE_TURN_STAGING = "dialogue_turns_incoming"
+_CREATE_DIALOGUE_TURN_STAGING = text(
+    f"CREATE TEMPORARY TABLE {_DIALOGUE_TURN_STAGING} ON COMMIT DROP AS "
+    f"SELECT {', '.join(_DIALOGUE_TURN_COPY_COLUMNS)} FROM dialogue_turns WITH NO DATA"
+)
+_MERGE_DIALOGUE_TURNS = text(
+    f"INSERT INTO dialogue_turns ({', '.join(_DIALOGUE_TURN_COPY_COLUMNS)}) "
+    f"SELECT {', '.join(_DIALOGUE_TURN_COPY_COLUMNS)} FROM {_DIALOGUE_TURN_STAGING} "
+    f"ON CONFLICT (call_id, turn_index) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _DIALOGUE_TURN_COPY_COLUMNS[2:])
+    + " WHERE dialogue_turns.content_hash IS DISTINCT FROM excluded.content_hash"
+)
+
 
 class PostprocessWorker:
     def __init__(self, settings: Settings) -> None:
@@ -53,6 +95,15 @@ class PostprocessWorker:
         if db_settings.run_db_migrations:
             logger.info("Skipping database migrations for debugging")
             # self._run_migrations()
+
+        # One event loop for all database work, kept for the worker's lifetime:
+        # the shared engine's pooled connections are bound to the loop they
+        # were opened on, so they can only be reused from the same loop
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="postprocess-db-loop", daemon=True
+        )
+        self._loop_thread.start()
         
         logger.info("Postprocess worker initialized and waiting for jobs")
 
@@ -81,21 +132,30 @@ class PostprocessWorker:
         logger.info("Postprocess worker starting to poll for jobs")
         while not self._stopping:
             logger.debug("Polling for messages from queue: %s", QUEUE_POSTPROCESS_JOBS)
-            message = pop_message(QUEUE_POSTPROCESS_JOBS, timeout=self.settings.queue_poll_timeout)
-            if message is None:
+            messages = pop_messages(QUEUE_POSTPROCESS_JOBS, timeout=self.settings.queue_poll_timeout)
+            if not messages:
                 logger.debug("No message received from queue")
-                continue
-            logger.info("Received message from queue: %s", message.job_id)
-            self._process_message(message)
+            for message in messages:
+                logger.info("Received message from queue: %s", message.job_id)
+                self._process_message(message)
+                ack_message(QUEUE_POSTPROCESS_JOBS, message)
+        self._close()
+
+    def _close(self) -> None:
+        """Release pooled database connections and stop the database loop."""
+        asyncio.run_coroutine_threadsafe(engine.dispose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        logger.info("Postprocess worker stopped")
 
     def _process_message(self, message: QueueMessage) -> None:
         job_id = message.job_id
         logger.info("Processing postprocess job %s", job_id)
-        update_job(job_id, status=JobStatus.postprocess_in_progress)
         
         try:
-            # Get the complete job data from Redis
-            job_data = get_job(job_id)
+            # Mark in progress and get the complete job data in one Redis transaction
+            job_data = update_and_get_job(job_id, status=JobStatus.postprocess_in_progress)
             if not job_data:
                 logger.error("Job %s not found in Redis", job_id)
                 update_job(job_id, status=JobStatus.failed)
@@ -111,16 +171,6 @@ class PostprocessWorker:
             logger.error("Failed to process job %s: %s", job_id, e, exc_info=True)
             update_job(job_id, status=JobStatus.failed)
 
-    def _map_channel_to_speaker(self, channel: int) -> str:
-        """Map stereo channel to speaker role based on STT configuration."""
-        # Default mapping - can be made configurable if needed
-        if channel == 0:
-            return "agent"
-        elif channel == 1:
-            return "customer"
-        else:
-            return "unknown"
-
     def _calculate_duration_sec(self, job: JobMetadata, call_record: Call, duration_seconds: Optional[int] = None) -> Optional[int]:
         """Calculate duration in seconds from job data."""
         # Priority 1: Use explicit duration_seconds from metadata if provided
@@ -134,11 +184,7 @@ class PostprocessWorker:
         
         # Priority 3: Fallback to max dialogue turn end time
         if job.stt_segments:
-            max_end_time = 0
-            for segment in job.stt_segments:
-                end_time = segment.get("end", 0)
-                if end_time > max_end_time:
-                    max_end_time = end_time
+            max_end_time = max((segment.get("end", 0) for segment in job.stt_segments), default=0)
             return int(max_end_time) if max_end_time > 0 else None
         
         return None
@@ -154,17 +200,106 @@ class PostprocessWorker:
             "label": label,
             "value": value,
         }
-        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+        # orjson sorts keys recursively and already returns bytes. Idempotency
+        # only, no cryptographic need; existing keys were re-keyed by
+        # migration 20261016000014
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
         return f"{fact_type}:{digest}"
 
-    def _normalize_phone(self, raw: str) -> Optional[str]:
-        """Normalize phone number to E.164 format."""
-        return normalize_phone_e164(raw, default_country="US")
+    def _content_hash(self, job: JobMetadata) -> str:
+        """
+        Digest of everything in the job that ends up in the database.
+        Status, delivery flag and updated_at change on every pipeline step
+        without changing what is persisted, so they are left out.
+        """
+        payload = job.model_dump(exclude={"status", "updated_at", "delivered"})
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _entity_items(self, entities: Optional[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+        """
+        Split summary entities into (tasks, offers, products), dropping non-dict items.
+        Supports both the speaker-separated structure, whose items get a
+        ``mentioned_by`` attribution, and the legacy flat one.
+        """
+        if not isinstance(entities, dict):
+            entities = {}
+        if "agent" in entities or "customer" in entities:
+            sources = [(speaker, entities.get(speaker)) for speaker in ("agent", "customer")]
+        else:
+            # Fallback to legacy flat structure for backward compatibility
+            sources = [(None, entities)]
 
-    def _normalize_email(self, raw: str) -> Optional[str]:
-        """Normalize email for identifier matching."""
-        return normalize_email(raw)
+        items = {kind: [] for kind in _ENTITY_KINDS}
+        for speaker, data in sources:
+            if not isinstance(data, dict):
+                continue
+            for kind, kind_items in items.items():
+                for item in data.get(kind) or []:
+                    if not isinstance(item, dict):
+                        continue
+                    if speaker:
+                        item["mentioned_by"] = speaker
+                    kind_items.append(item)
+        return items["tasks"], items["offers"], items["products"]
+
+    def _add_facts(
+        self,
+        session,
+        extraction: Extraction,
+        fact_type: str,
+        items: list,
+        turn_id_map: dict[int, int],
+    ) -> list[tuple[dict, ExtractedFact]]:
+        """
+        Add an ExtractedFact per extracted item (dicts, see _entity_items) without flushing.
+        Returns (item, fact) pairs; fact ids are assigned by the caller's flush.
+        """
+        facts = []
+        for data in items:
+            turn_index = data.get("turn_index")
+            fact = ExtractedFact(
+                extraction_id=extraction.id,
+                call_id=extraction.call_id,
+                fact_type=fact_type,
+                label=data.get("mentioned_by"),  # Store speaker attribution in label
+                value=data,
+                status="proposed",
+                confidence=data.get("confidence", 0.8),
+                turn_id=turn_id_map.get(turn_index) if turn_index is not None else None,
+                start_sec=data.get("start_sec"),
+                end_sec=data.get("end_sec"),
+                raw_span_text=data.get("text") if fact_type == "task" else None,
+                stable_key=self._stable_key(
+                    call_id=extraction.call_id,
+                    fact_type=fact_type,
+                    value=data,
+                ),
+            )
+            facts.append((data, fact))
+        session.add_all(fact for _, fact in facts)
+        return facts
+
+    async def _upsert_by_stable_key(
+        self, session, model, rows: dict[str, dict], update_columns: list[str]
+    ) -> dict[str, int]:
+        """
+        Insert or update this call's ``model`` rows in one INSERT ... ON CONFLICT.
+        ``rows`` maps stable_key to column values: Postgres rejects a multi-row
+        upsert that touches the same row twice. Returns stable_key -> id.
+        """
+        if not rows:
+            return {}
+        stmt = pg_insert(model).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            # uq_<table>_call_stable_key is partial
+            index_elements=["call_id", "stable_key"],
+            index_where=model.stable_key.is_not(None),
+            set_={**{column: stmt.excluded[column] for column in update_columns}, "updated_at": func.now()},
+        ).returning(model.stable_key, model.id)
+        result = await session.execute(stmt)
+        return dict(result.all())
 
     def _parse_russian_address(self, raw: str | list[str]) -> dict:
         """
@@ -219,644 +354,498 @@ class PostprocessWorker:
         result["line1"] = raw_clean
         return result
 
+    async def _copy_dialogue_turns(
+        self, session, call_id: int, segments: list[dict]
+    ) -> dict[int, int]:
+        """
+        Bulk-load dialogue turns for a call and return turn_index -> turn id.
+        
+        Uses binary COPY on the session's own asyncpg connection, so the rows
+        are written inside the session's transaction. Reruns only rewrite
+        turns whose content changed, and drop turns past the new last one.
+        """
+        turn_records = []
+        for idx, segment_data in enumerate(segments):
+            channel = segment_data.get("channel")
+            if channel is not None:
+                speaker = _CHANNEL_SPEAKERS.get(channel, "unknown")
+            else:
+                speaker = segment_data.get("speaker", "unknown")
+            
+            raw_json = json_dumps(segment_data)
+            turn_records.append((
+                call_id,
+                idx,
+                speaker,
+                channel,
+                segment_data.get("start"),
+                segment_data.get("end"),
+                segment_data.get("text", ""),
+                raw_json,
+                hashlib.blake2b(raw_json.encode("utf-8"), digest_size=8).hexdigest(),
+            ))
+        
+        await session.execute(
+            delete(DialogueTurn).where(
+                DialogueTurn.call_id == call_id,
+                DialogueTurn.turn_index >= len(turn_records),
+            )
+        )
+        if not turn_records:
+            return {}
+        
+        await session.execute(_CREATE_DIALOGUE_TURN_STAGING)
+        session_conn = await session.connection()
+        raw_conn = await session_conn.get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            _DIALOGUE_TURN_STAGING,
+            records=turn_records,
+            columns=list(_DIALOGUE_TURN_COPY_COLUMNS),
+        )
+        await session.execute(_MERGE_DIALOGUE_TURNS)
+        
+        # Neither COPY nor a skipped ON CONFLICT update returns the ids
+        turn_result = await session.execute(
+            select(DialogueTurn.turn_index, DialogueTurn.id).where(
+                DialogueTurn.call_id == call_id
+            )
+        )
+        return dict(turn_result.all())
+
     def _persist_to_database(self, job: JobMetadata) -> None:
         """Persist job data to PostgreSQL database with identity resolution and entity promotion."""
+        # Runs on the worker's long-lived loop so the shared engine's pool is reused
+        future = asyncio.run_coroutine_threadsafe(self._persist_job(job), self._loop)
         try:
-            import asyncio
+            future.result(timeout=30)  # Wait max 30 seconds
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.error("Failed to persist job %s to database: timed out", job.job_id)
+            raise TimeoutError("Database persistence took too long")
+        except Exception as e:
+            logger.error("Failed to persist job %s to database: %s", job.job_id, e, exc_info=True)
+            raise
+
+    async def _persist_job(self, job: JobMetadata) -> None:
+        """Write one job's call, identities, turns, summary and facts in a single transaction."""
+        session = SessionLocal()
+        try:
+            # Check if call already exists
+            existing_call = await session.scalar(
+                select(Call).where(Call.external_job_id == job.job_id)
+            )
+
+            # Retries of an already persisted payload have nothing to write
+            content_hash = self._content_hash(job)
+            if existing_call and existing_call.content_hash == content_hash:
+                logger.info("Job %s unchanged since last persisted; skipping", job.job_id)
+                return
             
-            # Run the async database operation in a synchronous context
-            async def _async_persist():
-                # Import inside to create fresh engine in this thread's event loop
-                from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-                from backend.common.db import db_settings
-                from sqlalchemy import select, delete
-                
-                # Create a fresh engine for this thread to avoid loop conflicts
-                local_engine = create_async_engine(
-                    db_settings.postgres_dsn,
-                    echo=False,
-                    pool_pre_ping=True,
+            # Extract metadata
+            agent_id_raw = None
+            customer_number = None
+            direction = None
+            provider_call_id = None
+            duration_seconds = None
+            
+            if job.extra_meta:
+                agent_id_raw = job.extra_meta.get("agent_id")
+                customer_number = job.extra_meta.get("customer_number")
+                direction = job.extra_meta.get("direction")
+                provider_call_id = job.extra_meta.get("call_id")
+                # Extract duration from metadata if available
+                metadata = job.extra_meta.get("metadata", {})
+                if isinstance(metadata, dict):
+                    duration_seconds = metadata.get("duration_seconds")
+            
+            # Create or update call record
+            if existing_call:
+                existing_call.agent_id = agent_id_raw
+                existing_call.customer_number = customer_number
+                existing_call.direction = direction
+                existing_call.provider_call_id = provider_call_id
+                existing_call.audio_path = job.audio_path
+                existing_call.language = job.stt_language
+                existing_call.stt_model = job.stt_engine
+                existing_call.status = "completed"
+                existing_call.content_hash = content_hash
+                call_record = existing_call
+            else:
+                call_record = Call(
+                    external_job_id=job.job_id,
+                    agent_id=agent_id_raw,
+                    customer_number=customer_number,
+                    direction=direction,
+                    provider_call_id=provider_call_id,
+                    audio_path=job.audio_path,
+                    language=job.stt_language,
+                    stt_model=job.stt_engine,
+                    status="completed",
+                    content_hash=content_hash,
                 )
+                session.add(call_record)
+            
+            await session.flush()
+
+            # -------- Identity resolution (agent + person/org via identifiers) --------
+            # 1) Agent
+            agent = None
+            if agent_id_raw:
+                agent = await resolve_or_create_agent(session, agent_id_raw)
+                if agent:
+                    call_record.agent_fk = agent.id
+
+            # 2) Person / organization via identifiers (phone/email)
+            # Support both speaker-separated and flat entity structures
+            entities = job.entities or {}
+            if not isinstance(entities, dict):
+                entities = {}
+
+            # Extract identity hints from both agent and customer if they are structured
+            # or from the flat structure if it's an old job
+            agent_entities = entities.get("agent", {}) if "agent" in entities else {}
+            customer_entities = entities.get("customer", {}) if "customer" in entities else {}
+            
+            # For backward compatibility, if entities is flat, treat it as general hints
+            if not agent_entities and not customer_entities and entities:
+                identity_hints = entities.get("identity_hints") or entities
+            else:
+                # Prioritize customer entities for identity resolution (customer-provided info)
+                identity_hints = customer_entities
+            
+            phones: list[str] = []
+            emails: list[str] = []
+            person_names: list[str] = []
+            company_names: list[str] = []
+
+            if customer_number:
+                phones.append(customer_number)
+            def _ensure_list(val):
+                if val is None: return []
+                if isinstance(val, list): return val
+                return [val]
+
+            if isinstance(identity_hints, dict):
+                # Legacy structured hints (if present)
+                phones.extend(_ensure_list(identity_hints.get("phones")))
+                emails.extend(_ensure_list(identity_hints.get("emails")))
+                person_names.extend(_ensure_list(identity_hints.get("person_names")))
+                company_names.extend(_ensure_list(identity_hints.get("company_names")))
+
+                # New NER-style buckets from the LLM:
+                #   PERSON        → customer name(s)
+                #   EMAIL         → customer email(s)
+                #   ORGANIZATION  → company name(s)
+                person_names.extend(_ensure_list(identity_hints.get("PERSON")))
+                emails.extend(_ensure_list(identity_hints.get("EMAIL")))
+                company_names.extend(_ensure_list(identity_hints.get("ORGANIZATION")))
                 
-                LocalSession = async_sessionmaker(
-                    bind=local_engine,
-                    class_=AsyncSession,
-                    expire_on_commit=False,
-                )
+                # Handle Russian labels and alternative keys
+                if identity_hints.get("ФИО"): person_names.extend(_ensure_list(identity_hints.get("ФИО")))
+                if identity_hints.get("ИМЯ"): person_names.extend(_ensure_list(identity_hints.get("ИМЯ")))
+                if identity_hints.get("КОМПАНИЯ"): company_names.extend(_ensure_list(identity_hints.get("КОМПАНИЯ")))
+                if identity_hints.get("АДРЕС"): identity_hints["address"] = identity_hints.get("АДРЕС")
+                if identity_hints.get("LOCATION"): identity_hints["address"] = identity_hints.get("LOCATION")
+                if identity_hints.get("PASSPORT"): identity_hints["id_number"] = identity_hints.get("PASSPORT")
+                if identity_hints.get("ПАСПОРТ"): identity_hints["id_number"] = identity_hints.get("ПАСПОРТ")
+                if identity_hints.get("DATE_OF_BIRTH"): identity_hints["date_of_birth"] = identity_hints.get("DATE_OF_BIRTH")
+                if identity_hints.get("ДАТА_РОЖДЕНИЯ"): identity_hints["date_of_birth"] = identity_hints.get("ДАТА_РОЖДЕНИЯ")
+
+            person, organization = await resolve_or_create_person_org(
+                session,
+                phones,
+                emails,
+                person_names,
+                company_names,
+                default_region=self.settings.phone_default_region,
+            )
+
+            if person:
+                # Reprocessed calls are already counted for their person
+                if call_record.person_id != person.id:
+                    await update_person_stats(session, person.id, call_record.created_at)
+                call_record.person_id = person.id
                 
-                session = LocalSession()
-                try:
-                    # Check if call already exists
-                    result = await session.execute(
-                        select(Call).where(Call.external_job_id == job.job_id)
-                    )
-                    existing_call = result.scalar_one_or_none()
-                    
-                    # Extract metadata
-                    agent_id_raw = None
-                    customer_number = None
-                    direction = None
-                    provider_call_id = None
-                    duration_seconds = None
-                    
-                    if job.extra_meta:
-                        agent_id_raw = job.extra_meta.get("agent_id")
-                        customer_number = job.extra_meta.get("customer_number")
-                        direction = job.extra_meta.get("direction")
-                        provider_call_id = job.extra_meta.get("call_id")
-                        # Extract duration from metadata if available
-                        metadata = job.extra_meta.get("metadata", {})
-                        if isinstance(metadata, dict):
-                            duration_seconds = metadata.get("duration_seconds")
-                    
-                    # Create or update call record
-                    if existing_call:
-                        existing_call.agent_id = agent_id_raw
-                        existing_call.customer_number = customer_number
-                        existing_call.direction = direction
-                        existing_call.provider_call_id = provider_call_id
-                        existing_call.audio_path = job.audio_path
-                        existing_call.language = job.stt_language
-                        existing_call.stt_model = job.stt_engine
-                        existing_call.status = "completed"
-                        call_record = existing_call
-                    else:
-                        call_record = Call(
-                            external_job_id=job.job_id,
-                            agent_id=agent_id_raw,
-                            customer_number=customer_number,
-                            direction=direction,
-                            provider_call_id=provider_call_id,
-                            audio_path=job.audio_path,
-                            language=job.stt_language,
-                            stt_model=job.stt_engine,
-                            status="completed",
-                        )
-                        session.add(call_record)
-                    
-                    await session.flush()
-
-                    # -------- Identity resolution (agent + person/org via identifiers) --------
-                    # 1) Agent
-                    if agent_id_raw:
-                        agent = await resolve_or_create_agent(session, agent_id_raw)
-                        if agent:
-                            call_record.agent_fk = agent.id
-
-                    # 2) Person / organization via identifiers (phone/email)
-                    # Support both speaker-separated and flat entity structures
-                    entities = job.entities or {}
-                    if not isinstance(entities, dict):
-                        entities = {}
-
-                    # Extract identity hints from both agent and customer if they are structured
-                    # or from the flat structure if it's an old job
-                    agent_entities = entities.get("agent", {}) if "agent" in entities else {}
-                    customer_entities = entities.get("customer", {}) if "customer" in entities else {}
-                    
-                    # For backward compatibility, if entities is flat, treat it as general hints
-                    if not agent_entities and not customer_entities and entities:
-                        identity_hints = entities.get("identity_hints") or entities
-                    else:
-                        # Prioritize customer entities for identity resolution (customer-provided info)
-                        identity_hints = customer_entities
-                    
-                    phones: list[str] = []
-                    emails: list[str] = []
-                    person_names: list[str] = []
-                    company_names: list[str] = []
-
-                    if customer_number:
-                        phones.append(customer_number)
-                    def _ensure_list(val):
-                        if val is None: return []
-                        if isinstance(val, list): return val
-                        return [val]
-
-                    if isinstance(identity_hints, dict):
-                        # Legacy structured hints (if present)
-                        phones.extend(_ensure_list(identity_hints.get("phones")))
-                        emails.extend(_ensure_list(identity_hints.get("emails")))
-                        person_names.extend(_ensure_list(identity_hints.get("person_names")))
-                        company_names.extend(_ensure_list(identity_hints.get("company_names")))
-
-                        # New NER-style buckets from the LLM:
-                        #   PERSON        → customer name(s)
-                        #   EMAIL         → customer email(s)
-                        #   ORGANIZATION  → company name(s)
-                        person_names.extend(_ensure_list(identity_hints.get("PERSON")))
-                        emails.extend(_ensure_list(identity_hints.get("EMAIL")))
-                        company_names.extend(_ensure_list(identity_hints.get("ORGANIZATION")))
-                        
-                        # Handle Russian labels and alternative keys
-                        if identity_hints.get("ФИО"): person_names.extend(_ensure_list(identity_hints.get("ФИО")))
-                        if identity_hints.get("ИМЯ"): person_names.extend(_ensure_list(identity_hints.get("ИМЯ")))
-                        if identity_hints.get("КОМПАНИЯ"): company_names.extend(_ensure_list(identity_hints.get("КОМПАНИЯ")))
-                        if identity_hints.get("АДРЕС"): identity_hints["address"] = identity_hints.get("АДРЕС")
-                        if identity_hints.get("LOCATION"): identity_hints["address"] = identity_hints.get("LOCATION")
-                        if identity_hints.get("PASSPORT"): identity_hints["id_number"] = identity_hints.get("PASSPORT")
-                        if identity_hints.get("ПАСПОРТ"): identity_hints["id_number"] = identity_hints.get("ПАСПОРТ")
-                        if identity_hints.get("DATE_OF_BIRTH"): identity_hints["date_of_birth"] = identity_hints.get("DATE_OF_BIRTH")
-                        if identity_hints.get("ДАТА_РОЖДЕНИЯ"): identity_hints["date_of_birth"] = identity_hints.get("ДАТА_РОЖДЕНИЯ")
-
-                    normalized_phones = [
-                        self._normalize_phone(p) for p in phones if self._normalize_phone(p)
-                    ]
-                    normalized_emails = [
-                        self._normalize_email(e) for e in emails if self._normalize_email(e)
-                    ]
-
-                    person, organization = await resolve_or_create_person_org(
-                        session,
-                        normalized_phones,
-                        normalized_emails,
-                        person_names,
-                        company_names,
-                    )
-
-                    if person:
-                        call_record.person_id = person.id
-                        
-                        # Update person with extra PII from identity_hints
-                        if isinstance(identity_hints, dict):
-                            # Update DoB if provided
-                            dob_raw = identity_hints.get("date_of_birth")
-                            if dob_raw and not person.date_of_birth:
+                # Update person with extra PII from identity_hints
+                if isinstance(identity_hints, dict):
+                    # Update DoB if provided
+                    dob_raw = identity_hints.get("date_of_birth")
+                    if dob_raw and not person.date_of_birth:
+                        try:
+                            if isinstance(dob_raw, str):
+                                # Try ISO format first
                                 try:
-                                    if isinstance(dob_raw, str):
-                                        # Try ISO format first
-                                        try:
-                                            person.date_of_birth = datetime.fromisoformat(dob_raw.replace('Z', '+00:00'))
-                                        except ValueError:
-                                            # Try Russian date parsing (very basic)
-                                            # "15 августа 1985 года" or "15.08.1985"
-                                            months_ru = {
-                                                'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-                                                'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-                                                'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
-                                            }
-                                            parts = dob_raw.lower().split()
-                                            if len(parts) >= 3:
-                                                day = int(parts[0])
-                                                month = months_ru.get(parts[1])
-                                                year = int(parts[2].strip('года').strip(','))
-                                                if month:
-                                                    person.date_of_birth = datetime(year, month, day)
-                                                else:
-                                                    logger.warning("Unknown Russian month in dob: %s", parts[1])
-                                            else:
-                                                # Try DD.MM.YYYY
-                                                if '.' in dob_raw:
-                                                    d, m, y = map(int, dob_raw.split('.')[:3])
-                                                    person.date_of_birth = datetime(y, m, d)
-                                except (ValueError, TypeError, IndexError) as e:
-                                    logger.warning("Failed to parse date_of_birth '%s': %s", dob_raw, e)
-                            
-                            # Update ID number if provided
-                            id_number = identity_hints.get("id_number")
-                            if id_number and not person.id_number:
-                                if isinstance(id_number, list) and len(id_number) > 0:
-                                    person.id_number = str(id_number[0])
-                                else:
-                                    person.id_number = str(id_number)
-                            
-                            # Update Address if provided
-                            address_info = identity_hints.get("address")
-                            if address_info:
-                                # Use sophisticated parser for Russian addresses
-                                parsed = self._parse_russian_address(address_info)
-                                
-                                address_data = {
-                                    "line1": parsed.get("line1"),
-                                    "city": parsed.get("city"),
-                                    "postal_code": parsed.get("postal_code"),
-                                    "country": parsed.get("country", "Russia"),
-                                    "type": "home"
-                                }
-                                
-                                # If it was already a dict, merge existing fields
-                                if isinstance(address_info, dict):
-                                    for k in ["line1", "city", "state", "postal_code", "country", "type"]:
-                                        if address_info.get(k):
-                                            address_data[k] = address_info.get(k)
-
-                                if address_data.get("line1"):
-                                    # Check if address already exists for this person
-                                    addr_stmt = select(Address).join(EntityAddress).where(
-                                        EntityAddress.person_id == person.id,
-                                        Address.line1 == address_data.get("line1")
-                                    )
-                                    addr_result = await session.execute(addr_stmt)
-                                    existing_addr = addr_result.scalar_one_or_none()
-                                    
-                                    if not existing_addr:
-                                        new_addr = Address(
-                                            line1=address_data.get("line1"),
-                                            line2=address_data.get("line2"),
-                                            city=address_data.get("city"),
-                                            state=address_data.get("state"),
-                                            postal_code=address_data.get("postal_code"),
-                                            country=address_data.get("country"),
-                                        )
-                                        session.add(new_addr)
-                                        await session.flush()
-                                        
-                                        entity_addr = EntityAddress(
-                                            address_id=new_addr.id,
-                                            person_id=person.id,
-                                            address_type=address_data.get("type", "home"),
-                                            is_primary=True
-                                        )
-                                        session.add(entity_addr)
-
-                    if organization:
-                        call_record.organization_id = organization.id
-
-                    await session.flush()
-
-                    # -------- Existing pipeline: dialogue turns & call summaries --------
-                    
-                    # Clear existing dialogue turns for this call (if any)
-                    await session.execute(
-                        delete(DialogueTurn).where(DialogueTurn.call_id == call_record.id)
-                    )
-                    
-                    # Build turn_index -> turn_id mapping for extracted facts
-                    turn_id_map = {}
-                    if job.stt_segments:
-                        for idx, segment_data in enumerate(job.stt_segments):
-                            speaker = segment_data.get("speaker", "unknown")
-                            channel = segment_data.get("channel")
-                            if channel is not None:
-                                speaker = self._map_channel_to_speaker(channel)
-                            
-                            dialogue_turn = DialogueTurn(
-                                call_id=call_record.id,
-                                turn_index=idx,
-                                speaker=speaker,
-                                channel=channel,
-                                start_sec=segment_data.get("start"),
-                                end_sec=segment_data.get("end"),
-                                text=segment_data.get("text", ""),
-                                raw_json=segment_data,
-                            )
-                            session.add(dialogue_turn)
-                            await session.flush()
-                            turn_id_map[idx] = dialogue_turn.id
+                                    person.date_of_birth = datetime.fromisoformat(dob_raw.replace('Z', '+00:00'))
+                                except ValueError:
+                                    # Try Russian date parsing (very basic)
+                                    # "15 августа 1985 года" or "15.08.1985"
+                                    months_ru = {
+                                        'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+                                        'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+                                        'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+                                    }
+                                    parts = dob_raw.lower().split()
+                                    if len(parts) >= 3:
+                                        day = int(parts[0])
+                                        month = months_ru.get(parts[1])
+                                        year = int(parts[2].strip('года').strip(','))
+                                        if month:
+                                            person.date_of_birth = datetime(year, month, day)
+                                        else:
+                                            logger.warning("Unknown Russian month in dob: %s", parts[1])
+                                    else:
+                                        # Try DD.MM.YYYY
+                                        if '.' in dob_raw:
+                                            d, m, y = map(int, dob_raw.split('.')[:3])
+                                            person.date_of_birth = datetime(y, m, d)
+                        except (ValueError, TypeError, IndexError) as e:
+                            logger.warning("Failed to parse date_of_birth '%s': %s", dob_raw, e)
                     
-                    # Clear existing summaries for this call (if any)
-                    await session.execute(
-                        delete(CallSummary).where(CallSummary.call_id == call_record.id)
-                    )
+                    # Update ID number if provided
+                    id_number = identity_hints.get("id_number")
+                    if id_number and not person.id_number:
+                        if isinstance(id_number, list) and len(id_number) > 0:
+                            person.id_number = str(id_number[0])
+                        else:
+                            person.id_number = str(id_number)
                     
-                    # Add summaries if available and populate materialized fields
-                    if job.dummy_summary:
-                        summary_payload = {
-                            "text": job.dummy_summary,
-                            "headline": job.dummy_headline or "",
-                            "tags": job.dummy_tags or [],
-                            "sentiment_label": job.sentiment_label or "neutral",
-                            "sentiment_score": job.sentiment_score or 0.0,
-                            "entities": job.entities or {},
-                        }
-                        call_summary = CallSummary(
-                            call_id=call_record.id,
-                            summary_type="llm_generated",
-                            payload=summary_payload,
-                            model="openai_gpt",
-                        )
-                        session.add(call_summary)
+                    # Update Address if provided
+                    address_info = identity_hints.get("address")
+                    if address_info:
+                        # Use sophisticated parser for Russian addresses
+                        parsed = self._parse_russian_address(address_info)
                         
-                        # Materialize dashboard fields
-                        if summary_payload.get("headline"):
-                            call_record.headline = summary_payload["headline"]
-                        call_record.sentiment_label = summary_payload.get("sentiment_label")
-                        call_record.sentiment_score = summary_payload.get("sentiment_score")
-                        call_record.duration_sec = self._calculate_duration_sec(job, call_record, duration_seconds)
+                        address_data = {
+                            "line1": parsed.get("line1"),
+                            "city": parsed.get("city"),
+                            "postal_code": parsed.get("postal_code"),
+                            "country": parsed.get("country", "Russia"),
+                            "type": "home"
+                        }
                         
-                        # Store snapshot-style entities for backward compatibility
-                        call_record.entities = job.entities
-
-                        # -------- New: provenance-first extraction + facts + tasks/offers --------
-                        extraction = Extraction(
-                            call_id=call_record.id,
-                            extractor_name="summary_service",
-                            extractor_version="v1",
-                            run_type="llm_summary",
-                            status="succeeded",
-                            raw_payload={
-                                "summary": summary_payload,
-                                "language": job.stt_language,
-                                "entities": job.entities or {},
-                            },
-                        )
-                        session.add(extraction)
-                        await session.flush()
-
-                        entities_struct = job.entities or {}
-                        if not isinstance(entities_struct, dict):
-                            entities_struct = {}
-
-                        # Prepare task/offer/product lists with speaker attribution
-                        # Support both new speaker-separated and legacy flat entity structures
-                        all_tasks = []
-                        all_offers = []
-                        all_products = []
-
-                        if "agent" in entities_struct or "customer" in entities_struct:
-                            # New speaker-separated entity structure
-                            # Process agent-mentioned items
-                            agent_data = entities_struct.get("agent", {})
-                            for t in agent_data.get("tasks", []):
-                                if isinstance(t, dict): 
-                                    t["mentioned_by"] = "agent"
-                                    all_tasks.append(t)
-                            for o in agent_data.get("offers", []):
-                                if isinstance(o, dict):
-                                    o["mentioned_by"] = "agent"
-                                    all_offers.append(o)
-                            for p in agent_data.get("products", []):
-                                if isinstance(p, dict):
-                                    p["mentioned_by"] = "agent"
-                                    all_products.append(p)
-
-                            # Process customer-mentioned items
-                            customer_data = entities_struct.get("customer", {})
-                            for t in customer_data.get("tasks", []):
-                                if isinstance(t, dict):
-                                    t["mentioned_by"] = "customer"
-                                    all_tasks.append(t)
-                            for o in customer_data.get("offers", []):
-                                if isinstance(o, dict):
-                                    o["mentioned_by"] = "customer"
-                                    all_offers.append(o)
-                            for p in customer_data.get("products", []):
-                                if isinstance(p, dict):
-                                    p["mentioned_by"] = "customer"
-                                    all_products.append(p)
-                        else:
-                            # Fallback to legacy flat structure for backward compatibility
-                            all_tasks = entities_struct.get("tasks") or []
-                            all_offers = entities_struct.get("offers") or []
-                            all_products = entities_struct.get("products") or []
-
-                        # Process tasks
-                        for task_data in all_tasks:
-                            if not isinstance(task_data, dict):
-                                continue
-
-                            stable_key = self._stable_key(
-                                call_id=call_record.id,
-                                fact_type="task",
-                                value=task_data,
+                        # If it was already a dict, merge existing fields
+                        if isinstance(address_info, dict):
+                            for k in ["line1", "city", "state", "postal_code", "country", "type"]:
+                                if address_info.get(k):
+                                    address_data[k] = address_info.get(k)
+
+                        if address_data.get("line1"):
+                            # Check if address already exists for this person
+                            addr_stmt = select(Address).join(EntityAddress).where(
+                                EntityAddress.person_id == person.id,
+                                Address.line1 == address_data.get("line1")
                             )
-
-                            # Create extracted fact
-                            turn_index = task_data.get("turn_index")
-                            turn_id = turn_id_map.get(turn_index) if turn_index is not None else None
+                            existing_addr = await session.scalar(addr_stmt)
                             
-                            fact = ExtractedFact(
-                                extraction_id=extraction.id,
-                                call_id=call_record.id,
-                                fact_type="task",
-                                label=task_data.get("mentioned_by"),  # Store speaker attribution in label
-                                value=task_data,
-                                status="proposed",
-                                confidence=task_data.get("confidence", 0.8),
-                                turn_id=turn_id,
-                                start_sec=task_data.get("start_sec"),
-                                end_sec=task_data.get("end_sec"),
-                                raw_span_text=task_data.get("text"),
-                                stable_key=stable_key,
-                            )
-                            session.add(fact)
-                            await session.flush()
-
-                            # Upsert task (idempotent via stable_key)
-                            task_result = await session.execute(
-                                select(Task).where(
-                                    Task.call_id == call_record.id,
-                                    Task.stable_key == stable_key,
+                            if not existing_addr:
+                                new_addr = Address(
+                                    line1=address_data.get("line1"),
+                                    line2=address_data.get("line2"),
+                                    city=address_data.get("city"),
+                                    state=address_data.get("state"),
+                                    postal_code=address_data.get("postal_code"),
+                                    country=address_data.get("country"),
                                 )
-                            )
-                            existing_task = task_result.scalar_one_or_none()
-
-                            title = task_data.get("title", "Untitled task")
-                            description = task_data.get("description")
-                            owner_info = task_data.get("owner") or {}
-                            owner_agent_id = None
-                            if isinstance(owner_info, dict) and owner_info.get("role") == "agent":
-                                # Try to resolve agent by external_agent_id if provided
-                                if agent and owner_info.get("agent_id") == agent_id_raw:
-                                    owner_agent_id = agent.id
-
-                            if existing_task:
-                                # Update if needed
-                                existing_task.title = title
-                                existing_task.description = description
-                                existing_task.owner_agent_id = owner_agent_id
-                                existing_task.person_id = person.id if person else None
-                                existing_task.organization_id = organization.id if organization else None
-                                existing_task.fact_id = fact.id
-                                task_obj = existing_task
-                            else:
-                                task_obj = Task(
-                                    call_id=call_record.id,
-                                    extraction_id=extraction.id,
-                                    fact_id=fact.id,
-                                    title=title,
-                                    description=description,
-                                    status="open",
-                                    owner_agent_id=owner_agent_id,
-                                    person_id=person.id if person else None,
-                                    organization_id=organization.id if organization else None,
-                                    stable_key=stable_key,
+                                session.add(new_addr)
+                                await session.flush()
+                                
+                                entity_addr = EntityAddress(
+                                    address_id=new_addr.id,
+                                    person_id=person.id,
+                                    address_type=address_data.get("type", "home"),
+                                    is_primary=True
                                 )
-                                session.add(task_obj)
-                            await session.flush()
-                            # Link fact back to task
-                            fact.task_id = task_obj.id
-
-                        # Process offers
-                        for offer_data in all_offers:
-                            if not isinstance(offer_data, dict):
-                                continue
-
-                            stable_key = self._stable_key(
-                                call_id=call_record.id,
-                                fact_type="offer",
-                                value=offer_data,
-                            )
+                                session.add(entity_addr)
 
-                            turn_index = offer_data.get("turn_index")
-                            turn_id = turn_id_map.get(turn_index) if turn_index is not None else None
-
-                            fact = ExtractedFact(
-                                extraction_id=extraction.id,
-                                call_id=call_record.id,
-                                fact_type="offer",
-                                label=offer_data.get("mentioned_by"),  # Store speaker attribution in label
-                                value=offer_data,
-                                status="proposed",
-                                confidence=offer_data.get("confidence", 0.8),
-                                turn_id=turn_id,
-                                start_sec=offer_data.get("start_sec"),
-                                end_sec=offer_data.get("end_sec"),
-                                stable_key=stable_key,
-                            )
-                            session.add(fact)
-                            await session.flush()
-
-                            # Upsert offer
-                            offer_result = await session.execute(
-                                select(Offer).where(
-                                    Offer.call_id == call_record.id,
-                                    Offer.stable_key == stable_key,
-                                )
-                            )
-                            existing_offer = offer_result.scalar_one_or_none()
-
-                            description = offer_data.get("description", "Untitled offer")
-                            discount_info = offer_data.get("discount") or {}
-
-                            if existing_offer:
-                                existing_offer.description = description
-                                existing_offer.discount_amount = discount_info.get("amount")
-                                existing_offer.discount_percent = discount_info.get("percent")
-                                existing_offer.person_id = person.id if person else None
-                                existing_offer.organization_id = organization.id if organization else None
-                                existing_offer.fact_id = fact.id
-                                offer_obj = existing_offer
-                            else:
-                                offer_obj = Offer(
-                                    call_id=call_record.id,
-                                    extraction_id=extraction.id,
-                                    fact_id=fact.id,
-                                    description=description,
-                                    status=offer_data.get("status", "promised"),
-                                    discount_amount=discount_info.get("amount"),
-                                    discount_percent=discount_info.get("percent"),
-                                    person_id=person.id if person else None,
-                                    organization_id=organization.id if organization else None,
-                                    stable_key=stable_key,
-                                )
-                                session.add(offer_obj)
-                            await session.flush()
-                            fact.offer_id = offer_obj.id
-
-                        # Process product mentions
-                        for product_data in all_products:
-                            if not isinstance(product_data, dict):
-                                continue
-
-                            stable_key = self._stable_key(
-                                call_id=call_record.id,
-                                fact_type="product_mention",
-                                value=product_data,
-                            )
+            if organization:
+                call_record.organization_id = organization.id
 
-                            turn_index = product_data.get("turn_index")
-                            turn_id = turn_id_map.get(turn_index) if turn_index is not None else None
-
-                            fact = ExtractedFact(
-                                extraction_id=extraction.id,
-                                call_id=call_record.id,
-                                fact_type="product_mention",
-                                label=product_data.get("mentioned_by"),  # Store speaker attribution in label
-                                value=product_data,
-                                status="proposed",
-                                confidence=product_data.get("confidence", 0.8),
-                                turn_id=turn_id,
-                                start_sec=product_data.get("start_sec"),
-                                end_sec=product_data.get("end_sec"),
-                                stable_key=stable_key,
-                            )
-                            session.add(fact)
-                            await session.flush()
-
-                            # Upsert product mention
-                            mention_result = await session.execute(
-                                select(CallProductMention).where(
-                                    CallProductMention.call_id == call_record.id,
-                                    CallProductMention.stable_key == stable_key,
-                                )
-                            )
-                            existing_mention = mention_result.scalar_one_or_none()
-
-                            mentioned_name = product_data.get("name", "Unknown product")
-                            price_info = product_data.get("price") or {}
-
-                            if existing_mention:
-                                existing_mention.mentioned_name = mentioned_name
-                                existing_mention.quantity = product_data.get("quantity")
-                                existing_mention.quantity_unit = product_data.get("unit")
-                                existing_mention.price_amount = price_info.get("amount")
-                                existing_mention.price_currency = price_info.get("currency")
-                                existing_mention.context = product_data.get("context")
-                                existing_mention.person_id = person.id if person else None
-                                existing_mention.organization_id = organization.id if organization else None
-                                existing_mention.fact_id = fact.id
-                                mention_obj = existing_mention
-                            else:
-                                mention_obj = CallProductMention(
-                                    call_id=call_record.id,
-                                    extraction_id=extraction.id,
-                                    fact_id=fact.id,
-                                    mentioned_name=mentioned_name,
-                                    quantity=product_data.get("quantity"),
-                                    quantity_unit=product_data.get("unit"),
-                                    price_amount=price_info.get("amount"),
-                                    price_currency=price_info.get("currency"),
-                                    context=product_data.get("context"),
-                                    start_sec=product_data.get("start_sec"),
-                                    end_sec=product_data.get("end_sec"),
-                                    person_id=person.id if person else None,
-                                    organization_id=organization.id if organization else None,
-                                    stable_key=stable_key,
-                                )
-                                session.add(mention_obj)
-                            await session.flush()
-                            fact.product_id = mention_obj.id
-                    
-                    await session.commit()
-                    logger.info("Successfully persisted job %s to database with identity resolution", job.job_id)
-                finally:
-                    await session.close()
-                    await local_engine.dispose()  # Close the engine connections
-            
-            # Run the async function in a separate thread with its own event loop
-            import concurrent.futures
-            import threading
-            
-            result_container = []
-            error_container = []
-            
-            def run_in_thread():
-                try:
-                    # Create a new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(_async_persist())
-                        result_container.append(True)
-                    finally:
-                        loop.close()
-                except Exception as e:
-                    error_container.append(e)
+            await session.flush()
+
+            # -------- Existing pipeline: dialogue turns & call summaries --------
             
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join(timeout=30)  # Wait max 30 seconds
+            # Merge dialogue turns and build turn_index -> turn_id mapping for extracted facts
+            turn_id_map = await self._copy_dialogue_turns(
+                session, call_record.id, job.stt_segments or []
+            )
             
-            if thread.is_alive():
-                raise TimeoutError("Database persistence took too long")
+            # Clear existing summaries for this call (if any)
+            await session.execute(
+                delete(CallSummary).where(CallSummary.call_id == call_record.id)
+            )
             
-            if error_container:
-                raise error_container[0]
+            # Add summaries if available and populate materialized fields
+            if job.dummy_summary:
+                summary_payload = {
+                    "text": job.dummy_summary,
+                    "headline": job.dummy_headline or "",
+                    "tags": job.dummy_tags or [],
+                    "sentiment_label": job.sentiment_label or "neutral",
+                    "sentiment_score": job.sentiment_score or 0.0,
+                    "entities": job.entities or {},
+                }
+                call_summary = CallSummary(
+                    call_id=call_record.id,
+                    summary_type="llm_generated",
+                    payload=summary_payload,
+                    model="openai_gpt",
+                )
+                session.add(call_summary)
+                
+                # Materialize dashboard fields
+                if summary_payload.get("headline"):
+                    call_record.headline = summary_payload["headline"]
+                call_record.sentiment_label = summary_payload.get("sentiment_label")
+                call_record.sentiment_score = summary_payload.get("sentiment_score")
+                call_record.duration_sec = self._calculate_duration_sec(job, call_record, duration_seconds)
+                
+                # Store snapshot-style entities for backward compatibility
+                insights_stmt = pg_insert(CallInsights).values(
+                    call_id=call_record.id,
+                    entities=job.entities,
+                )
+                await session.execute(
+                    insights_stmt.on_conflict_do_update(
+                        index_elements=["call_id"],
+                        set_={"entities": insights_stmt.excluded.entities},
+                    )
+                )
+
+                # -------- New: provenance-first extraction + facts + tasks/offers --------
+                extraction = Extraction(
+                    call_id=call_record.id,
+                    extractor_name="summary_service",
+                    extractor_version="v1",
+                    run_type="llm_summary",
+                    status="succeeded",
+                    raw_payload={
+                        "summary": summary_payload,
+                        "language": job.stt_language,
+                        "entities": job.entities or {},
+                    },
+                )
+                session.add(extraction)
+                await session.flush()
+
+                all_tasks, all_offers, all_products = self._entity_items(job.entities)
+
+                # Resolved once for every task/offer/mention row below
+                agent_pk = agent.id if agent else None
+                person_id = person.id if person else None
+                organization_id = organization.id if organization else None
+
+                # Facts for every item first, so one flush assigns all their ids
+                task_facts = self._add_facts(
+                    session, extraction, "task", all_tasks, turn_id_map
+                )
+                offer_facts = self._add_facts(
+                    session, extraction, "offer", all_offers, turn_id_map
+                )
+                product_facts = self._add_facts(
+                    session, extraction, "product_mention", all_products, turn_id_map
+                )
+                await session.flush()
+
+                # (fact, ref_type, business object id) for the fact refs
+                fact_links = []
+
+                # Upsert tasks (idempotent via stable_key)
+                task_rows = {}
+                for task_data, fact in task_facts:
+                    owner_info = task_data.get("owner") or {}
+                    owner_agent_id = None
+                    if isinstance(owner_info, dict) and owner_info.get("role") == "agent":
+                        # Try to resolve agent by external_agent_id if provided
+                        if agent_pk and owner_info.get("agent_id") == agent_id_raw:
+                            owner_agent_id = agent_pk
+
+                    # Repeated items share a key; the last one wins
+                    task_rows[fact.stable_key] = {
+                        "call_id": call_record.id,
+                        "extraction_id": extraction.id,
+                        "fact_id": fact.id,
+                        "title": task_data.get("title", "Untitled task"),
+                        "description": task_data.get("description"),
+                        "status": "open",
+                        "owner_agent_id": owner_agent_id,
+                        "person_id": person_id,
+                        "organization_id": organization_id,
+                        "stable_key": fact.stable_key,
+                    }
+                task_ids = await self._upsert_by_stable_key(
+                    session,
+                    Task,
+                    task_rows,
+                    ["fact_id", "title", "description", "owner_agent_id", "person_id", "organization_id"],
+                )
+                fact_links.extend((fact, "task", task_ids[fact.stable_key]) for _, fact in task_facts)
+
+                # Upsert offers
+                offer_rows = {}
+                for offer_data, fact in offer_facts:
+                    discount_info = offer_data.get("discount") or {}
+                    offer_rows[fact.stable_key] = {
+                        "call_id": call_record.id,
+                        "extraction_id": extraction.id,
+                        "fact_id": fact.id,
+                        "description": offer_data.get("description", "Untitled offer"),
+                        "status": offer_data.get("status", "promised"),
+                        "discount_amount": discount_info.get("amount"),
+                        "discount_percent": discount_info.get("percent"),
+                        "person_id": person_id,
+                        "organization_id": organization_id,
+                        "stable_key": fact.stable_key,
+                    }
+                offer_ids = await self._upsert_by_stable_key(
+                    session,
+                    Offer,
+                    offer_rows,
+                    ["fact_id", "description", "discount_amount", "discount_percent", "person_id", "organization_id"],
+                )
+                fact_links.extend((fact, "offer", offer_ids[fact.stable_key]) for _, fact in offer_facts)
+
+                # Upsert product mentions
+                mention_rows = {}
+                for product_data, fact in product_facts:
+                    price_info = product_data.get("price") or {}
+                    mention_rows[fact.stable_key] = {
+                        "call_id": call_record.id,
+                        "extraction_id": extraction.id,
+                        "fact_id": fact.id,
+                        "mentioned_name": product_data.get("name", "Unknown product"),
+                        "quantity": product_data.get("quantity"),
+                        "quantity_unit": product_data.get("unit"),
+                        "price_amount": price_info.get("amount"),
+                        "price_currency": price_info.get("currency"),
+                        "context": product_data.get("context"),
+                        "start_sec": product_data.get("start_sec"),
+                        "end_sec": product_data.get("end_sec"),
+                        "person_id": person_id,
+                        "organization_id": organization_id,
+                        "stable_key": fact.stable_key,
+                    }
+                mention_ids = await self._upsert_by_stable_key(
+                    session,
+                    CallProductMention,
+                    mention_rows,
+                    [
+                        "fact_id", "mentioned_name", "quantity", "quantity_unit", "price_amount",
+                        "price_currency", "context", "person_id", "organization_id",
+                    ],
+                )
+                fact_links.extend(
+                    (fact, "product_mention", mention_ids[fact.stable_key]) for _, fact in product_facts
+                )
+
+                session.add_all(
+                    ExtractedFactRef(fact_id=fact.id, ref_type=ref_type, ref_id=ref_id)
+                    for fact, ref_type, ref_id in fact_links
+                )
             
-        except Exception as e:
-            logger.error("Failed to persist job %s to database: %s", job.job_id, e, exc_info=True)
-            raise
+            await session.commit()
+            logger.info("Successfully persisted job %s to database with identity resolution", job.job_id)
+        finally:
+            await session.close()
 
 
 def start_worker() -> None:
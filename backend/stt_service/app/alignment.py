@@ -7,44 +7,56 @@ background noise, breaths, or other non-speech audio.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from itertools import pairwise
+from typing import Dict, List, Optional, Set, Tuple, TypeVar
 
-from pydantic import BaseModel, Field
+import numpy as np
 
 logger = logging.getLogger("stt.alignment")
 
+_T = TypeVar("_T", "Word", "CleanedSegment")
 
-class Word(BaseModel):
+
+@dataclass(slots=True)
+class Word:
     """A single recognized word with timestamps."""
-    start: float = Field(description="Start time in seconds")
-    end: float = Field(description="End time in seconds")
-    text: str = Field(description="Recognized word text")
-    probability: Optional[float] = Field(default=None, description="Word probability/confidence")
-    channel: Optional[int] = Field(default=None, description="Audio channel (for stereo mode)")
+    start: float  # Start time in seconds
+    end: float    # End time in seconds
+    text: str     # Recognized word text
+    probability: Optional[float] = None  # Word probability/confidence
+    channel: Optional[int] = None        # Audio channel (for stereo mode)
 
 
-class DiarizationSegment(BaseModel):
+@dataclass(slots=True)
+class DiarizationSegment:
     """A speaker segment from diarization (before alignment)."""
-    start: float = Field(description="Start time in seconds")
-    end: float = Field(description="End time in seconds")
-    speaker: str = Field(description="Speaker label")
-    channel: Optional[int] = Field(default=None, description="Audio channel (for stereo mode)")
+    start: float  # Start time in seconds
+    end: float    # End time in seconds
+    speaker: str  # Speaker label
+    channel: Optional[int] = None  # Audio channel (for stereo mode)
 
 
-class CleanedSegment(BaseModel):
+@dataclass(slots=True)
+class CleanedSegment:
     """A speaker segment aligned with actual word timestamps."""
-    speaker: str = Field(description="Speaker label")
-    start: float = Field(description="Aligned start time in seconds")
-    end: float = Field(description="Aligned end time in seconds")
-    text: str = Field(description="Concatenated text from words in this segment")
-    channel: Optional[int] = Field(default=None, description="Audio channel (for stereo mode)")
-    confidence: Optional[float] = Field(default=None, description="Average confidence of words")
-    words: List[Word] = Field(default_factory=list, description="Individual words in this segment")
+    speaker: str  # Speaker label
+    start: float  # Aligned start time in seconds
+    end: float    # Aligned end time in seconds
+    text: str     # Concatenated text from words in this segment
+    channel: Optional[int] = None        # Audio channel (for stereo mode)
+    confidence: Optional[float] = None   # Average confidence of words
+    words: List[Word] = field(default_factory=list)  # Individual words in this segment
+    _word_duration: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def total_word_duration(self) -> float:
-        """Compute the total duration of actual words (excluding silence)."""
-        return sum(w.end - w.start for w in self.words)
+        """Compute the total duration of actual words (excluding silence).
+        
+        Computed once per segment; ``words`` is not expected to change after.
+        """
+        if self._word_duration is None:
+            self._word_duration = sum(w.end - w.start for w in self.words)
+        return self._word_duration
 
 
 @dataclass
@@ -93,25 +105,39 @@ def align_diarization_with_words(
         config = AlignmentConfig()
     
     cleaned_segments: List[CleanedSegment] = []
-    
-    for diar_seg in diar_segments:
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    # Sort once so each segment can binary-search its candidate words
+    sorted_words = _sorted_by_start(words)
+    max_word_duration = max((w.end - w.start for w in sorted_words), default=0.0)
+    words_by_channel = _bucket_words_by_channel(
+        sorted_words, {seg.channel for seg in diar_segments}
+    )
+    candidate_ranges = _candidate_ranges(
+        diar_segments, words_by_channel, max_word_duration, config.overlap_eps
+    )
+    
+    for diar_seg, (lo, hi) in zip(diar_segments, candidate_ranges):
         # Find words that overlap with this diarization segment
         # CRITICAL: For stereo mode, only match words from the same channel
+        channel_words, _, ends = words_by_channel[diar_seg.channel]
         overlapping_words = _find_overlapping_words(
-            words=words,
+            words=channel_words,
+            ends=ends,
+            lo=lo,
+            hi=hi,
             seg_start=diar_seg.start,
-            seg_end=diar_seg.end,
-            seg_channel=diar_seg.channel,
             overlap_eps=config.overlap_eps,
         )
         
         if not overlapping_words:
-            logger.debug(
-                "Discarding diarization segment [%.2f-%.2f] %s: no words found (likely noise)",
-                diar_seg.start,
-                diar_seg.end,
-                diar_seg.speaker,
-            )
+            if debug:
+                logger.debug(
+                    "Discarding diarization segment [%.2f-%.2f] %s: no words found (likely noise)",
+                    diar_seg.start,
+                    diar_seg.end,
+                    diar_seg.speaker,
+                )
             continue
         
         # Split into continuous speech segments based on gaps
@@ -120,38 +146,123 @@ def align_diarization_with_words(
         # Add all speech segments to our collection
         cleaned_segments.extend(speech_segments)
         
-        for speech_seg in speech_segments:
-            logger.debug(
-                "Aligned segment: %s [%.2f-%.2f] → [%.2f-%.2f] (%d words, %.2fs speech)",
-                diar_seg.speaker,
-                diar_seg.start,
-                diar_seg.end,
-                speech_seg.start,
-                speech_seg.end,
-                len(speech_seg.words),
-                sum(w.end - w.start for w in speech_seg.words),
-            )
+        if debug:
+            for speech_seg in speech_segments:
+                logger.debug(
+                    "Aligned segment: %s [%.2f-%.2f] → [%.2f-%.2f] (%d words, %.2fs speech)",
+                    diar_seg.speaker,
+                    diar_seg.start,
+                    diar_seg.end,
+                    speech_seg.start,
+                    speech_seg.end,
+                    len(speech_seg.words),
+                    speech_seg.total_word_duration(),
+                )
     
     # Deduplicate words across all segments to prevent overlaps
     if cleaned_segments:
-        logger.debug(f"Calling deduplication on {len(cleaned_segments)} segments")
+        logger.debug("Calling deduplication on %d segments", len(cleaned_segments))
         cleaned_segments = _deduplicate_segments(cleaned_segments, config)
-        logger.debug(f"Deduplication result: {len(cleaned_segments)} segments")
+        logger.debug("Deduplication result: %d segments", len(cleaned_segments))
     
     # Merge consecutive segments from the same speaker
     if cleaned_segments:
-        logger.debug(f"Calling merging on {len(cleaned_segments)} segments")
+        logger.debug("Calling merging on %d segments", len(cleaned_segments))
         cleaned_segments = _merge_consecutive_segments(cleaned_segments, config)
-        logger.debug(f"Merging result: {len(cleaned_segments)} segments")
+        logger.debug("Merging result: %d segments", len(cleaned_segments))
     
     return cleaned_segments
 
 
+def _sorted_by_start(items: List[_T]) -> List[_T]:
+    """Return items ordered by start time, skipping the sort if they already are.
+    
+    Whisper emits words in order and each alignment stage preserves it, so
+    the common case is a single comparison pass.
+    """
+    if all(a.start <= b.start for a, b in pairwise(items)):
+        return items
+    return sorted(items, key=lambda item: item.start)
+
+
+def _bucket_words_by_channel(
+    sorted_words: List[Word],
+    channels: Set[Optional[int]],
+) -> Dict[Optional[int], Tuple[List[Word], np.ndarray, np.ndarray]]:
+    """Group sorted words by the segment channel they may be matched to.
+    
+    A segment without a channel (mono) sees every word; a stereo segment
+    sees its own channel's words plus any words without a channel.
+    
+    Args:
+        sorted_words: List of all words, sorted by start time
+        channels: Channels of the diarization segments to be aligned
+        
+    Returns:
+        Mapping of segment channel to its (words, start times, end times),
+        all in chronological order
+    """
+    buckets = {}
+    for channel in channels:
+        if channel is None:
+            bucket = sorted_words
+        else:
+            bucket = [w for w in sorted_words if w.channel in (channel, None)]
+        buckets[channel] = (
+            bucket,
+            np.fromiter((w.start for w in bucket), dtype=np.float64, count=len(bucket)),
+            np.fromiter((w.end for w in bucket), dtype=np.float64, count=len(bucket)),
+        )
+    return buckets
+
+
+def _candidate_ranges(
+    diar_segments: List[DiarizationSegment],
+    words_by_channel: Dict[Optional[int], Tuple[List[Word], np.ndarray, np.ndarray]],
+    max_word_duration: float,
+    overlap_eps: float,
+) -> List[Tuple[int, int]]:
+    """Locate the candidate words of every diarization segment at once.
+    
+    Only words starting within ``max_word_duration`` of a segment can reach
+    into it, so each segment's candidates are a contiguous slice of its
+    channel bucket. The slice bounds for all segments of a channel come
+    from one vectorized binary search over the bucket's start times.
+    
+    Args:
+        diar_segments: Diarization segments to be aligned
+        words_by_channel: Word buckets from ``_bucket_words_by_channel``
+        max_word_duration: Longest ``end - start`` among all words
+        overlap_eps: Tolerance for overlap detection
+        
+    Returns:
+        (lo, hi) slice bounds into the segment's channel bucket, per segment
+    """
+    seg_starts = np.fromiter((s.start for s in diar_segments), dtype=np.float64, count=len(diar_segments))
+    seg_ends = np.fromiter((s.end for s in diar_segments), dtype=np.float64, count=len(diar_segments))
+    los = np.empty(len(diar_segments), dtype=np.intp)
+    his = np.empty(len(diar_segments), dtype=np.intp)
+    
+    segments_by_channel: Dict[Optional[int], List[int]] = {}
+    for i, seg in enumerate(diar_segments):
+        segments_by_channel.setdefault(seg.channel, []).append(i)
+    
+    for channel, indices in segments_by_channel.items():
+        _, starts, _ = words_by_channel[channel]
+        los[indices] = np.searchsorted(
+            starts, seg_starts[indices] - overlap_eps - max_word_duration, side="left"
+        )
+        his[indices] = np.searchsorted(starts, seg_ends[indices] + overlap_eps, side="right")
+    
+    return list(zip(los.tolist(), his.tolist()))
+
+
 def _find_overlapping_words(
     words: List[Word],
+    ends: np.ndarray,
+    lo: int,
+    hi: int,
     seg_start: float,
-    seg_end: float,
-    seg_channel: Optional[int],
     overlap_eps: float,
 ) -> List[Word]:
     """Find words that overlap with a time segment.
@@ -159,34 +270,27 @@ def _find_overlapping_words(
     A word is considered overlapping if it is not completely outside
     the segment (with epsilon tolerance for boundary effects).
     
-    For stereo mode, only words from the same channel are considered.
+    For stereo mode, callers pass only the words of the segment's channel
+    (see ``_bucket_words_by_channel``), and ``words[lo:hi]`` holds every
+    word that does not start after the segment and could reach into it
+    (see ``_candidate_ranges``). The slice is filtered with one array
+    comparison instead of a Python loop over every word.
     
     Args:
-        words: List of all words
+        words: Candidate words, sorted by start time
+        ends: End time of each word in ``words``
+        lo: First candidate index
+        hi: End of the candidate slice
         seg_start: Segment start time
-        seg_end: Segment end time
-        seg_channel: Channel number (None for mono, int for stereo)
         overlap_eps: Tolerance for overlap detection
         
     Returns:
         List of overlapping words in chronological order
     """
-    overlapping = []
-    for w in words:
-        # CRITICAL: For stereo mode, only match words from the same channel
-        if seg_channel is not None and w.channel is not None:
-            if w.channel != seg_channel:
-                continue  # Skip words from different channels
-        
-        # Word overlaps if it's not completely before or after the segment
-        # Allow small epsilon for floating-point and boundary effects
-        word_ends_before = w.end < seg_start - overlap_eps
-        word_starts_after = w.start > seg_end + overlap_eps
-        
-        if not (word_ends_before or word_starts_after):
-            overlapping.append(w)
-    
-    return overlapping
+    # Drop candidates that end before the segment. Allow small epsilon for
+    # floating-point and boundary effects
+    hits = np.flatnonzero(ends[lo:hi] >= seg_start - overlap_eps)
+    return [words[lo + i] for i in hits]
 
 
 def _split_on_gaps(
@@ -211,7 +315,7 @@ def _split_on_gaps(
         return []
     
     # Sort words by start time to ensure proper ordering
-    sorted_words = sorted(words, key=lambda w: w.start)
+    sorted_words = _sorted_by_start(words)
     
     segments: List[CleanedSegment] = []
     current_segment_words: List[Word] = [sorted_words[0]]
@@ -226,27 +330,7 @@ def _split_on_gaps(
         
         # If gap is significant, split into a new segment
         if gap > config.gap_threshold:
-            # Finalize current segment
-            text = " ".join(w.text for w in current_segment_words).strip()
-            confidences = [w.probability for w in current_segment_words if w.probability is not None]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else None
-            
-            # Calculate padded boundaries
-            first_word = current_segment_words[0]
-            last_word = current_segment_words[-1]
-            padded_start = max(0.0, first_word.start - config.pad_left)
-            padded_end = last_word.end + config.pad_right
-            
-            segment = CleanedSegment(
-                speaker=diar_seg.speaker,
-                start=padded_start,
-                end=padded_end,
-                text=text,
-                channel=diar_seg.channel,
-                confidence=avg_confidence,
-                words=current_segment_words,
-            )
-            segments.append(segment)
+            segments.append(_finalize_segment(current_segment_words, diar_seg, config))
             
             # Start new segment with current word
             current_segment_words = [curr_word]
@@ -256,30 +340,51 @@ def _split_on_gaps(
     
     # Don't forget the last segment
     if current_segment_words:
-        text = " ".join(w.text for w in current_segment_words).strip()
-        confidences = [w.probability for w in current_segment_words if w.probability is not None]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else None
-        
-        # Calculate padded boundaries
-        first_word = current_segment_words[0]
-        last_word = current_segment_words[-1]
-        padded_start = max(0.0, first_word.start - config.pad_left)
-        padded_end = last_word.end + config.pad_right
-        
-        segment = CleanedSegment(
-            speaker=diar_seg.speaker,
-            start=padded_start,
-            end=padded_end,
-            text=text,
-            channel=diar_seg.channel,
-            confidence=avg_confidence,
-            words=current_segment_words,
-        )
-        segments.append(segment)
+        segments.append(_finalize_segment(current_segment_words, diar_seg, config))
     
     return segments
 
 
+def _finalize_segment(
+    words: List[Word],
+    source: DiarizationSegment | CleanedSegment,
+    config: AlignmentConfig,
+) -> CleanedSegment:
+    """Build a cleaned segment from its words in a single pass.
+    
+    Args:
+        words: Words of the segment (sorted by start time, non-empty)
+        source: Segment supplying the speaker and channel
+        config: Alignment configuration
+        
+    Returns:
+        CleanedSegment with padded boundaries, joined text, average confidence
+        and its total word duration already computed
+    """
+    parts = []
+    word_duration = 0.0
+    conf_sum = 0.0
+    conf_count = 0
+    for w in words:
+        parts.append(w.text)
+        word_duration += w.end - w.start
+        if w.probability is not None:
+            conf_sum += w.probability
+            conf_count += 1
+    
+    segment = CleanedSegment(
+        speaker=source.speaker,
+        start=max(0.0, words[0].start - config.pad_left),
+        end=words[-1].end + config.pad_right,
+        text=" ".join(parts).strip(),
+        channel=source.channel,
+        confidence=conf_sum / conf_count if conf_count else None,
+        words=words,
+    )
+    segment._word_duration = word_duration
+    return segment
+
+
 def _deduplicate_segments(
     segments: List[CleanedSegment],
     config: AlignmentConfig
@@ -302,83 +407,79 @@ def _deduplicate_segments(
         return segments
     
     # Sort segments by start time to process in order
-    sorted_segments = sorted(segments, key=lambda s: s.start)
+    sorted_segments = _sorted_by_start(segments)
     
-    # Keep track of words we've already seen by their exact timestamps and channel
+    # Keep track of words we've already seen by their timestamps and channel.
+    # Timestamps are rounded to whole milliseconds, so copies of a word that
+    # differ by float drift still match (1 ms tolerance)
     # Include channel to avoid deduplicating across different audio channels
-    seen_words: List[tuple[float, float, str, Optional[int]]] = []  # (start, end, text, channel) tuples
+    seen_words: Set[Tuple[int, int, str, Optional[int]]] = set()  # (start_ms, end_ms, text, channel) tuples
     
     deduplicated_segments: List[CleanedSegment] = []
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for segment in sorted_segments:
-        # Filter out words that have already been seen
+        # Filter out words that have already been seen, summing the duration
+        # of the ones kept
         unique_words = []
+        total_word_dur = 0.0
         for word in segment.words:
-            # Check if this exact word (same start, end, text, and channel) has been seen
-            word_signature = (word.start, word.end, word.text, word.channel)
-            is_duplicate = word_signature in seen_words
+            # Check if this word (same start, end, text, and channel) has been seen
+            word_signature = (round(word.start * 1000), round(word.end * 1000), word.text, word.channel)
             
-            if not is_duplicate:
+            if word_signature not in seen_words:
                 unique_words.append(word)
-                seen_words.append(word_signature)
+                total_word_dur += word.end - word.start
+                seen_words.add(word_signature)
         
         # Only keep segments that still have words after deduplication
-        if unique_words:
-            # Recalculate segment text and confidence with unique words
-            text = " ".join(w.text for w in unique_words).strip()
-            confidences = [w.probability for w in unique_words if w.probability is not None]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else None
-            
-            # Recalculate boundaries if needed
-            if len(unique_words) != len(segment.words):
-                first_word = unique_words[0]
-                last_word = unique_words[-1]
-                padded_start = max(0.0, first_word.start - config.pad_left)
-                padded_end = last_word.end + config.pad_right
-                
-                deduplicated_segment = CleanedSegment(
-                    speaker=segment.speaker,
-                    start=padded_start,
-                    end=padded_end,
-                    text=text,
-                    channel=segment.channel,
-                    confidence=avg_confidence,
-                    words=unique_words,
-                )
-            else:
-                # No words were removed, keep original segment
-                deduplicated_segment = segment
-                
-            # Apply final filtering based on word duration and segment duration
-            total_word_dur = sum(w.end - w.start for w in unique_words)
-            segment_duration = deduplicated_segment.end - deduplicated_segment.start
-            
+        if not unique_words:
+            if debug:
+                logger.debug("Segment %s has no unique words after deduplication", segment.speaker)
+            continue
+        
+        # Boundaries move only if words were removed
+        words_removed = len(unique_words) != len(segment.words)
+        if words_removed:
+            start = max(0.0, unique_words[0].start - config.pad_left)
+            end = unique_words[-1].end + config.pad_right
+        else:
+            start, end = segment.start, segment.end
+        
+        # Apply final filtering based on word duration and segment duration,
+        # before building anything for segments that are dropped
+        segment_duration = end - start
+        keep = total_word_dur >= config.min_word_duration and segment_duration >= config.min_segment_duration
+        
+        if debug:
             logger.debug(
                 "Segment %s [%.2f-%.2f]: word_dur=%.3fs, seg_dur=%.3fs, min_word=%.3fs, min_seg=%.3fs", 
-                deduplicated_segment.speaker,
-                deduplicated_segment.start,
-                deduplicated_segment.end,
+                segment.speaker,
+                start,
+                end,
                 total_word_dur,
                 segment_duration,
                 config.min_word_duration,
                 config.min_segment_duration
             )
-            
-            if total_word_dur >= config.min_word_duration and segment_duration >= config.min_segment_duration:
-                deduplicated_segments.append(deduplicated_segment)
-            else:
+            if not keep:
                 logger.debug(
                     "Discarding segment %s [%.2f-%.2f]: word_dur=%.3fs < %.3fs or seg_dur=%.3fs < %.3fs", 
-                    deduplicated_segment.speaker,
-                    deduplicated_segment.start,
-                    deduplicated_segment.end,
+                    segment.speaker,
+                    start,
+                    end,
                     total_word_dur, config.min_word_duration,
                     segment_duration, config.min_segment_duration
                 )
-        else:
-            logger.debug(f"Segment {segment.speaker} has no unique words after deduplication")
+        
+        if keep:
+            # Recalculate text and confidence only if words were removed;
+            # otherwise keep the original segment
+            deduplicated_segments.append(
+                _finalize_segment(unique_words, segment, config) if words_removed else segment
+            )
     
-    logger.debug(f"Deduplication returning {len(deduplicated_segments)} segments")
+    logger.debug("Deduplication returning %d segments", len(deduplicated_segments))
     return deduplicated_segments
 
 
@@ -393,6 +494,10 @@ def _merge_consecutive_segments(
     Segments are merged if the gap between them is less than or equal to merge_threshold.
     Negative gaps (overlapping segments) are always merged.
     
+    A run of mergeable segments is accumulated in running state and built
+    into one CleanedSegment when the run ends, instead of rebuilding the
+    merged segment after every step.
+    
     Args:
         segments: List of cleaned segments (sorted by start time)
         config: Alignment configuration
@@ -404,117 +509,123 @@ def _merge_consecutive_segments(
         return segments
     
     # Sort segments by start time to process in order
-    sorted_segments = sorted(segments, key=lambda s: s.start)
+    sorted_segments = _sorted_by_start(segments)
     
-    logger.debug(f"Starting merge process with {len(sorted_segments)} segments")
-    for i, seg in enumerate(sorted_segments):
-        logger.debug(f"Segment {i}: {seg.speaker} [{seg.start:.2f}-{seg.end:.2f}] channel={seg.channel}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Starting merge process with %d segments", len(sorted_segments))
+        for i, seg in enumerate(sorted_segments):
+            logger.debug(
+                "Segment %d: %s [%.2f-%.2f] channel=%s", i, seg.speaker, seg.start, seg.end, seg.channel
+            )
     
     merged_segments: List[CleanedSegment] = []
-    current_segment = sorted_segments[0]
+    
+    # Running state of the current run; run_words is None until a merge happens
+    run_first = sorted_segments[0]
+    run_words: Optional[List[Word]] = None
+    run_texts: List[str] = []
+    run_end = run_first.end
+    run_confidence = run_first.confidence
+    run_word_dur = run_first.total_word_duration()
+    
+    def close_run() -> CleanedSegment:
+        if run_words is None:
+            # Nothing was merged into the first segment, keep it as is
+            return run_first
+        merged = CleanedSegment(
+            speaker=run_first.speaker,
+            start=run_first.start,
+            end=run_end,
+            text=" ".join(run_texts).strip(),
+            channel=run_first.channel,
+            confidence=run_confidence,
+            words=run_words,
+        )
+        merged._word_duration = run_word_dur
+        return merged
     
     # Process each subsequent segment
     for next_segment in sorted_segments[1:]:
         # Check if we can merge: same speaker and channel, and small gap
-        if (current_segment.speaker == next_segment.speaker and 
-            current_segment.channel == next_segment.channel):
+        if (run_first.speaker == next_segment.speaker and 
+            run_first.channel == next_segment.channel):
             
-            # Calculate gap between current segment end and next segment start
-            gap = next_segment.start - current_segment.end
+            # Calculate gap between current run end and next segment start
+            gap = next_segment.start - run_end
             
             # If segments overlap or have a small gap, merge the segments
             # Overlapping segments have negative gaps
             if gap <= config.merge_threshold:
-                # Merge the segments
-                merged_words = current_segment.words + next_segment.words
-                merged_text = f"{current_segment.text} {next_segment.text}".strip()
+                if run_words is None:
+                    run_words = list(run_first.words)
+                    run_texts = [run_first.text]
+                run_words.extend(next_segment.words)
+                run_texts.append(next_segment.text)
                 
                 # Recalculate confidence as weighted average
-                current_word_dur = sum(w.end - w.start for w in current_segment.words)
-                next_word_dur = sum(w.end - w.start for w in next_segment.words)
-                total_word_dur = current_word_dur + next_word_dur
+                next_word_dur = next_segment.total_word_duration()
+                total_word_dur = run_word_dur + next_word_dur
                 
-                if total_word_dur > 0:
-                    # Weighted average by word duration
-                    current_weight = current_word_dur / total_word_dur
-                    next_weight = next_word_dur / total_word_dur
-                    
-                    if current_segment.confidence is not None and next_segment.confidence is not None:
-                        merged_confidence = (
-                            current_weight * current_segment.confidence + 
-                            next_weight * next_segment.confidence
-                        )
-                    elif current_segment.confidence is not None:
-                        merged_confidence = current_segment.confidence
-                    elif next_segment.confidence is not None:
-                        merged_confidence = next_segment.confidence
+                if run_confidence is not None and next_segment.confidence is not None:
+                    if total_word_dur > 0:
+                        # Weighted average by word duration
+                        run_confidence = (
+                            run_word_dur * run_confidence + 
+                            next_word_dur * next_segment.confidence
+                        ) / total_word_dur
                     else:
-                        merged_confidence = None
-                else:
-                    # Simple average if no word durations
-                    if current_segment.confidence is not None and next_segment.confidence is not None:
-                        merged_confidence = (current_segment.confidence + next_segment.confidence) / 2
-                    elif current_segment.confidence is not None:
-                        merged_confidence = current_segment.confidence
-                    elif next_segment.confidence is not None:
-                        merged_confidence = next_segment.confidence
-                    else:
-                        merged_confidence = None
-                
-                # Calculate new boundaries
-                first_word = merged_words[0]
-                last_word = merged_words[-1]
-                merged_start = max(0.0, first_word.start - config.pad_left)
-                merged_end = last_word.end + config.pad_right
+                        # Simple average if no word durations
+                        run_confidence = (run_confidence + next_segment.confidence) / 2
+                elif run_confidence is None:
+                    run_confidence = next_segment.confidence
+                run_word_dur = total_word_dur
                 
-                # Create merged segment
-                current_segment = CleanedSegment(
-                    speaker=current_segment.speaker,
-                    start=merged_start,
-                    end=merged_end,
-                    text=merged_text,
-                    channel=current_segment.channel,
-                    confidence=merged_confidence,
-                    words=merged_words,
-                )
+                # The run now ends at the last word of the merged segment
+                run_end = run_words[-1].end + config.pad_right
                 
-                logger.debug(
-                    "Merged segments: %s [%.2f-%.2f] + [%.2f-%.2f] (gap=%.3fs, threshold=%.3fs)",
-                    current_segment.speaker,
-                    current_segment.start,
-                    current_segment.end,
-                    next_segment.start,
-                    next_segment.end,
-                    gap,
-                    config.merge_threshold
-                )
+                if debug:
+                    logger.debug(
+                        "Merged segments: %s [%.2f-%.2f] + [%.2f-%.2f] (gap=%.3fs, threshold=%.3fs)",
+                        run_first.speaker,
+                        run_first.start,
+                        run_end,
+                        next_segment.start,
+                        next_segment.end,
+                        gap,
+                        config.merge_threshold
+                    )
                 continue  # Continue to check if we can merge with the next segment
-            else:
+            elif debug:
                 logger.debug(
                     "Not merging segments: %s [%.2f-%.2f] + [%.2f-%.2f] (gap=%.3fs > threshold=%.3fs)",
-                    current_segment.speaker,
-                    current_segment.start,
-                    current_segment.end,
+                    run_first.speaker,
+                    run_first.start,
+                    run_end,
                     next_segment.start,
                     next_segment.end,
                     gap,
                     config.merge_threshold
                 )
-        else:
+        elif debug:
             logger.debug(
                 "Not merging segments: different speaker/channel %s/%s vs %s/%s",
-                current_segment.speaker,
-                current_segment.channel,
+                run_first.speaker,
+                run_first.channel,
                 next_segment.speaker,
                 next_segment.channel
             )
         
-        # Can't merge, so add current segment to results and move to next
-        merged_segments.append(current_segment)
-        current_segment = next_segment
-    
-    # Don't forget the last segment
-    merged_segments.append(current_segment)
-    
-    logger.debug(f"Merging returning {len(merged_segments)} segments")
+        # Can't merge, so close the current run and start a new one
+        merged_segments.append(close_run())
+        run_first = next_segment
+        run_words = None
+        run_end = next_segment.end
+        run_confidence = next_segment.confidence
+        run_word_dur = next_segment.total_word_duration()
+    
+    # Don't forget the last run
+    merged_segments.append(close_run())
+    
+    logger.debug("Merging returning %d segments", len(merged_segments))
     return merged_segments
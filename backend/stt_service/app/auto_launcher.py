@@ -1,5 +1,6 @@
 """Auto-launcher for STT service that detects GPU availability and configures Whisper accordingly."""
 
+import functools
 import logging
 import os
 from typing import Dict
@@ -7,9 +8,13 @@ from typing import Dict
 logger = logging.getLogger("stt_auto_launcher")
 
 
+@functools.lru_cache(maxsize=1)
 def detect_gpu() -> bool:
     """Detect GPU availability.
     
+    The result is cached for the life of the process; call
+    ``detect_gpu.cache_clear()`` after changing the GPU environment variables.
+    
     Returns:
         bool: True if GPU is available, False otherwise
     """
@@ -28,7 +33,12 @@ def detect_gpu() -> bool:
         # Still need to verify GPU is actually available
         pass  # Continue with normal detection
         
-    # Prefer PyTorch if it's already a dependency
+    # The NVIDIA device file is authoritative in containers and needs no import
+    if os.path.exists("/dev/nvidia0"):
+        logger.info("GPU detected via /dev/nvidia0")
+        return True
+
+    # Otherwise ask PyTorch if it's installed (slow to import, so checked last)
     try:
         import torch
         if torch.cuda.is_available():
@@ -38,15 +48,9 @@ def detect_gpu() -> bool:
             logger.info("No GPU detected via PyTorch")
     except Exception:
         logger.debug("PyTorch not available for GPU detection")
-        pass
 
-    # Fallback: check for NVIDIA device files
-    gpu_available = os.path.exists("/dev/nvidia0")
-    if gpu_available:
-        logger.info("GPU detected via /dev/nvidia0")
-    else:
-        logger.info("No GPU detected via /dev/nvidia0")
-    return gpu_available
+    logger.info("No GPU detected via /dev/nvidia0 or PyTorch")
+    return False
 
 def configure_whisper_from_env() -> None:
     """Configure Whisper environment variables based on GPU availability.
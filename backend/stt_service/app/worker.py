@@ -10,7 +10,7 @@ from backend.common.config import Settings, get_settings
 from backend.common.constants import QUEUE_STT_JOBS
 from backend.common.logging_utils import configure_logging
 from backend.common.models import JobStatus, QueueMessage
-from backend.common.redis_utils import enqueue_summary_job, get_job, pop_message, update_job
+from backend.common.redis_utils import ack_message, enqueue_summary_job, get_job, pop_messages, update_job
 from backend.stt_service.app.config import STTServiceSettings, get_stt_settings
 from backend.stt_service.app.stt_engine import BaseSTTEngine, FasterWhisperEngine
 
@@ -44,10 +44,9 @@ class STTWorker:
 
     def run(self) -> None:
         while not self._stopping:
-            message = pop_message(QUEUE_STT_JOBS, timeout=self.settings.queue_poll_timeout)
-            if message is None:
-                continue
-            self._process_message(message)
+            for message in pop_messages(QUEUE_STT_JOBS, timeout=self.settings.queue_poll_timeout):
+                self._process_message(message)
+                ack_message(QUEUE_STT_JOBS, message)
 
     def _process_message(self, message: QueueMessage) -> None:
         job_id = message.job_id
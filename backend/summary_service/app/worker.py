@@ -9,9 +9,10 @@ from backend.common.config import Settings, get_settings
 from backend.common.constants import QUEUE_SUMMARY_JOBS
 from backend.common.models import JobStatus, QueueMessage
 from backend.common.redis_utils import (
+    ack_message,
     enqueue_postprocess_job,
-    get_job,
-    pop_message,
+    pop_messages,
+    update_and_get_job,
     update_job,
 )
 from backend.common.logging_utils import configure_logging
@@ -36,18 +37,16 @@ class SummaryWorker:
 
     def run(self) -> None:
         while not self._stopping:
-            message = pop_message(QUEUE_SUMMARY_JOBS, timeout=self.settings.queue_poll_timeout)
-            if message is None:
-                continue
-            self._process_message(message)
+            for message in pop_messages(QUEUE_SUMMARY_JOBS, timeout=self.settings.queue_poll_timeout):
+                self._process_message(message)
+                ack_message(QUEUE_SUMMARY_JOBS, message)
 
     def _process_message(self, message: QueueMessage) -> None:
         job_id = message.job_id
         logger.info("Processing summary job %s", job_id)
         
         try:
-            update_job(job_id, status=JobStatus.summary_in_progress)
-            job = get_job(job_id)
+            job = update_and_get_job(job_id, status=JobStatus.summary_in_progress)
             transcript = None
             if job:
                 transcript = job.stt_text or job.dummy_transcript
@@ -7,6 +7,7 @@ from backend.stt_service.app.alignment import (
     CleanedSegment,
     DiarizationSegment,
     Word,
+    _deduplicate_segments,
     align_diarization_with_words,
 )
 
@@ -150,6 +151,22 @@ class TestWordLevelAlignment:
         assert len(cleaned) == 1
         assert "test" in cleaned[0].text
 
+    def test_unsorted_and_long_words_are_found(self):
+        """Test that lookup handles unordered words and a long word starting well before the segment."""
+        words = [
+            Word(start=9.0, end=9.4, text="later"),
+            Word(start=1.0, end=6.0, text="long"),
+            Word(start=2.0, end=2.3, text="early"),
+        ]
+        diar_segments = [
+            DiarizationSegment(start=5.5, end=7.0, speaker="agent"),
+        ]
+
+        cleaned = align_diarization_with_words(words, diar_segments)
+
+        assert len(cleaned) == 1
+        assert [w.text for w in cleaned[0].words] == ["long"]
+
     def test_zero_padding_at_start(self):
         """Test that start timestamp doesn't go below zero."""
         words = [
@@ -243,6 +260,26 @@ class TestWordLevelAlignment:
         assert "goodbye" in client_segment.text
         assert "everyone" in client_segment.text
 
+    def test_words_without_channel_match_any_segment(self):
+        """Test that channel-less words are shared by stereo and mono segments."""
+        words = [
+            Word(start=1.0, end=1.4, text="shared"),
+            Word(start=1.5, end=1.9, text="left", channel=0),
+        ]
+        diar_segments = [
+            DiarizationSegment(start=0.5, end=2.0, speaker="client", channel=1),
+        ]
+
+        cleaned = align_diarization_with_words(words, diar_segments)
+
+        assert [w.text for w in cleaned[0].words] == ["shared"]
+
+        cleaned = align_diarization_with_words(
+            words, [DiarizationSegment(start=0.5, end=2.0, speaker="agent")]
+        )
+
+        assert [w.text for w in cleaned[0].words] == ["shared", "left"]
+
     def test_gap_splitting(self):
         """Test that segments are split when there are gaps indicating another speaker."""
         # Simulate a customer speaking with a gap where manager speaks
@@ -349,6 +386,27 @@ class TestWordLevelAlignment:
         assert "указывает" in all_words_in_first
         assert "подключения" in all_words_in_second
 
+    def test_deduplication_tolerates_sub_millisecond_drift(self):
+        """Test that word copies whose timestamps differ by float drift are deduplicated."""
+        first = CleanedSegment(
+            speaker="agent", start=0.8, end=1.7, text="hello world", channel=0,
+            words=[
+                Word(start=1.0, end=1.3, text="hello", channel=0),
+                Word(start=1.2, end=1.5, text="world", channel=0),
+            ],
+        )
+        second = CleanedSegment(
+            speaker="agent", start=1.0, end=2.0, text="world again", channel=0,
+            words=[
+                Word(start=1.2 + 1e-9, end=1.5 - 1e-9, text="world", channel=0),
+                Word(start=1.5, end=1.8, text="again", channel=0),
+            ],
+        )
+
+        cleaned = _deduplicate_segments([first, second], AlignmentConfig())
+
+        assert [w.text for w in cleaned[1].words] == ["again"]
+
     def test_merge_consecutive_segments(self):
         """Test that consecutive segments from the same speaker are merged."""
         # Simulate consecutive segments from the same speaker with a small gap
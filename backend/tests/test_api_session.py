@@ -0,0 +1,46 @@
+"""Tests for the call analytics API's status-filtered sessions."""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from backend.call_analytics_api.app.db import ApiSession, INCLUDE_ALL_CALLS
+from backend.common.models_db import Call
+
+
+@pytest.fixture
+def engine():
+    """In-memory database holding one call per status."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        # Table only: the Postgres-specific indexes don't exist in SQLite
+        conn.execute(CreateTable(Call.__table__))
+    with Session(engine) as session:
+        for call_id, status in enumerate(["completed", "processing", "failed", "queued"], start=1):
+            session.add(Call(id=call_id, external_job_id=f"job-{call_id}", status=status))
+        session.commit()
+    return engine
+
+
+def test_api_session_hides_failed_and_queued_calls(engine):
+    """Test that ORM selects only see completed/processing calls."""
+    with ApiSession(bind=engine) as session:
+        assert sorted(session.scalars(select(Call.status)).all()) == ["completed", "processing"]
+        assert session.scalar(select(func.count(Call.id))) == 2
+        assert session.get(Call, 3) is None
+
+
+def test_include_all_calls_bypasses_filter(engine):
+    """Test that the include_all_calls execution option disables the filter."""
+    with ApiSession(bind=engine) as session:
+        statuses = session.scalars(
+            select(Call.status).execution_options(**{INCLUDE_ALL_CALLS: True})
+        ).all()
+    assert sorted(statuses) == ["completed", "failed", "processing", "queued"]
+
+
+def test_plain_session_is_unfiltered(engine):
+    """Test that sessions outside the API (e.g. the worker's) are not filtered."""
+    with Session(engine) as session:
+        assert session.scalar(select(func.count(Call.id))) == 4
@@ -4,10 +4,21 @@ import os
 import sys
 from unittest.mock import patch, MagicMock
 
-# Add the app directory to the path so we can import the module
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+import pytest
 
-from auto_launcher import detect_gpu, configure_whisper_from_env
+from backend.stt_service.app.auto_launcher import detect_gpu, configure_whisper_from_env
+
+
+def _torch(cuda_available: bool) -> MagicMock:
+    torch = MagicMock()
+    torch.cuda.is_available.return_value = cuda_available
+    return torch
+
+
+@pytest.fixture(autouse=True)
+def clear_gpu_cache():
+    """detect_gpu caches its result; start each test from a clean slate."""
+    detect_gpu.cache_clear()
 
 
 def test_detect_gpu_with_force_cpu():
@@ -19,32 +30,51 @@ def test_detect_gpu_with_force_cpu():
 def test_detect_gpu_with_torch_cuda_available():
     """Test that detect_gpu returns True when PyTorch CUDA is available."""
     with patch.dict(os.environ, {}, clear=True):
-        with patch('torch.cuda.is_available', return_value=True):
-            # Mock the torch import
-            mock_torch = MagicMock()
-            mock_torch.cuda.is_available.return_value = True
-            with patch('builtins.__import__', return_value=mock_torch):
+        with patch('os.path.exists', return_value=False):
+            with patch.dict(sys.modules, {"torch": _torch(cuda_available=True)}):
                 assert detect_gpu() is True
 
 
 def test_detect_gpu_with_nvidia_device_file():
     """Test that detect_gpu returns True when NVIDIA device file exists."""
     with patch.dict(os.environ, {}, clear=True):
-        with patch('torch.cuda.is_available', return_value=False):
-            with patch('os.path.exists', return_value=True):
-                # Mock the torch import to raise an exception
-                with patch('builtins.__import__', side_effect=ImportError):
-                    assert detect_gpu() is True
+        with patch('os.path.exists', return_value=True):
+            # A None entry makes ``import torch`` raise ImportError
+            with patch.dict(sys.modules, {"torch": None}):
+                assert detect_gpu() is True
 
 
 def test_detect_gpu_without_gpu():
     """Test that detect_gpu returns False when no GPU is available."""
     with patch.dict(os.environ, {}, clear=True):
-        with patch('torch.cuda.is_available', return_value=False):
-            with patch('os.path.exists', return_value=False):
-                # Mock the torch import to raise an exception
-                with patch('builtins.__import__', side_effect=ImportError):
-                    assert detect_gpu() is False
+        with patch('os.path.exists', return_value=False):
+            with patch.dict(sys.modules, {"torch": None}):
+                assert detect_gpu() is False
+
+
+def test_detect_gpu_device_file_skips_torch_import():
+    """Test that an existing /dev/nvidia0 answers without importing torch."""
+    torch = _torch(cuda_available=False)
+    with patch.dict(os.environ, {}, clear=True):
+        with patch('os.path.exists', return_value=True) as exists:
+            with patch.dict(sys.modules, {"torch": torch}):
+                assert detect_gpu() is True
+
+    exists.assert_called_once_with("/dev/nvidia0")
+    torch.cuda.is_available.assert_not_called()
+
+
+def test_detect_gpu_result_is_cached():
+    """Test that a second call returns the cached result without probing again."""
+    torch = _torch(cuda_available=True)
+    with patch.dict(os.environ, {}, clear=True):
+        with patch('os.path.exists', return_value=False) as exists:
+            with patch.dict(sys.modules, {"torch": torch}):
+                assert detect_gpu() is True
+                assert detect_gpu() is True
+
+    exists.assert_called_once()
+    torch.cuda.is_available.assert_called_once()
 
 
 def test_configure_whisper_from_env_with_gpu():
@@ -54,7 +84,7 @@ def test_configure_whisper_from_env_with_gpu():
         if var in os.environ:
             del os.environ[var]
     
-    with patch('auto_launcher.detect_gpu', return_value=True):
+    with patch('backend.stt_service.app.auto_launcher.detect_gpu', return_value=True):
         configure_whisper_from_env()
         
         assert os.environ.get('WHISPER_DEVICE') == 'cuda'
@@ -70,7 +100,7 @@ def test_configure_whisper_from_env_with_cpu():
         if var in os.environ:
             del os.environ[var]
     
-    with patch('auto_launcher.detect_gpu', return_value=False):
+    with patch('backend.stt_service.app.auto_launcher.detect_gpu', return_value=False):
         configure_whisper_from_env()
         
         assert os.environ.get('WHISPER_DEVICE') == 'cpu'
@@ -88,7 +118,7 @@ def test_configure_whisper_from_env_preserves_existing_values():
         'STT_MODEL_NAME': 'custom/model',
         'WHISPER_MODEL_DIR': '/custom/model/dir'
     }):
-        with patch('auto_launcher.detect_gpu', return_value=True):
+        with patch('backend.stt_service.app.auto_launcher.detect_gpu', return_value=True):
             configure_whisper_from_env()
             
             assert os.environ.get('WHISPER_DEVICE') == 'custom_device'
@@ -0,0 +1,214 @@
+"""Tests for postprocess identity resolution."""
+
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+
+from backend.common.models_db import Agent, Identifier, Organization, Person
+from backend.postprocess_service.app.identity_resolver import (
+    _IDENTIFIER_LOOKUP,
+    resolve_or_create_agent,
+    resolve_or_create_person_org,
+    update_person_stats,
+)
+
+
+def _mock_session():
+    """Session where no identifier exists yet and INSERT ... RETURNING assigns ids."""
+    session = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    result.scalar.return_value = 0
+    session.execute = AsyncMock(return_value=result)
+
+    async def scalar(stmt, **kwargs):
+        model = {"people": Person, "organizations": Organization}[stmt.table.name]
+        values = {col.key: param.value for col, param in stmt._values.items()}
+        return model(id=len(session.scalar.await_args_list), **values)
+
+    session.scalar = AsyncMock(side_effect=scalar)
+    return session
+
+
+def _identifier_inserts(session):
+    return [
+        call.args[0]
+        for call in session.execute.call_args_list
+        if isinstance(call.args[0], Insert)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_new_person_identifiers_are_deduplicated():
+    """Test that a repeated phone/email yields one row per (type, value) in the upsert."""
+    session = _mock_session()
+
+    person, organization = await resolve_or_create_person_org(
+        session,
+        phones=["+79123456789", "+79123456789", "+74951234567"],
+        emails=["a@example.com", "a@example.com"],
+        person_names=["Ivan"],
+        company_names=["Acme"],
+    )
+
+    assert isinstance(person, Person) and person.full_name == "Ivan"
+    assert (person.id, organization.id) == (1, 2)
+    assert organization.name == "Acme"
+    session.flush.assert_not_called()
+    org_upsert = str(session.scalar.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (name) DO UPDATE" in org_upsert
+
+    inserts = _identifier_inserts(session)
+    assert len(inserts) == 1
+    params = inserts[0].compile(dialect=postgresql.dialect()).params
+    pairs = [
+        (params[f"identifier_type_m{i}"], params[f"normalized_value_m{i}"])
+        for i in range(len(params))
+        if f"identifier_type_m{i}" in params
+    ]
+    assert pairs == [
+        ("phone", "+79123456789"),
+        ("phone", "+74951234567"),
+        ("email", "a@example.com"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_existing_identifiers_resolved_in_one_query_by_priority():
+    """Test that all identifiers are looked up at once and phones win over emails."""
+    session = _mock_session()
+    phone_person = Person(id=1, full_name=None)
+    matches = [
+        Identifier(
+            identifier_type="email",
+            normalized_value="a@example.com",
+            person_id=1,
+            person=phone_person,
+            organization=Organization(id=3, name="Email Org"),
+        ),
+        Identifier(
+            identifier_type="phone",
+            normalized_value="+74951234567",
+            person_id=1,
+            person=phone_person,
+            organization=None,
+        ),
+    ]
+    session.execute.return_value.scalars.return_value = matches
+
+    person, organization = await resolve_or_create_person_org(
+        session,
+        phones=["+79123456789", "+74951234567"],
+        emails=["a@example.com"],
+        person_names=["Ivan"],
+        company_names=[],
+    )
+
+    assert person is phone_person
+    assert person.full_name == "Ivan"
+    assert organization is None
+    session.add.assert_not_called()
+
+    lookup, params = session.execute.call_args_list[0].args
+    assert lookup is _IDENTIFIER_LOOKUP
+    assert {opt.path[1].key for opt in lookup._with_options if len(opt.path) > 1} == {
+        "person", "organization"
+    }
+    # Only columns carried by uq_identifiers_lookup, so the scan is index-only
+    assert str(lookup.compile(dialect=postgresql.dialect())).startswith(
+        "SELECT identifiers.id, identifiers.identifier_type, identifiers.normalized_value, "
+        "identifiers.person_id, identifiers.organization_id \nFROM identifiers"
+    )
+    assert params == {
+        "identifier_pairs": [
+            ("phone", "+79123456789"), ("phone", "+74951234567"), ("email", "a@example.com")
+        ]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("phone_person_id, email_person_id", [(1, 2), (2, 1)])
+async def test_identifiers_of_different_people_are_flagged_not_linked(phone_person_id, email_person_id):
+    """Test that a phone and email of two people queue one alias pair, lower id first."""
+    session = _mock_session()
+    session.execute.return_value.scalars.return_value = [
+        Identifier(identifier_type="email", normalized_value="a@example.com", person_id=email_person_id),
+        Identifier(identifier_type="phone", normalized_value="+74951234567", person_id=phone_person_id),
+    ]
+
+    assert await resolve_or_create_person_org(
+        session, ["+74951234567"], ["a@example.com"], ["Ivan"], ["Acme"]
+    ) == (None, None)
+
+    session.scalar.assert_not_called()
+    alias_insert = session.execute.call_args.args[0]
+    assert alias_insert.table.name == "person_id_aliases"
+    sql = str(alias_insert.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (person_id, alias_person_id) DO NOTHING" in sql
+    params = alias_insert.compile(dialect=postgresql.dialect()).params
+    assert (params["person_id_m0"], params["alias_person_id_m0"]) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_update_person_stats_is_one_incremental_update():
+    """Test that linking a call bumps the counters in a single UPDATE."""
+    session = _mock_session()
+    call_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    await update_person_stats(session, 7, call_at)
+
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE people SET call_count=(people.call_count + ")
+    assert "least(coalesce(people.first_call_at" in sql
+    assert "greatest(coalesce(people.last_call_at" in sql
+
+
+@pytest.mark.asyncio
+async def test_resolve_agent_is_a_single_upsert_returning_the_row():
+    """Test that agents are resolved with one INSERT ... ON CONFLICT ... RETURNING."""
+    session = MagicMock()
+    agent = Agent(id=5, external_agent_id="agent-1")
+    session.scalar = AsyncMock(return_value=agent)
+
+    assert await resolve_or_create_agent(session, "agent-1") is agent
+
+    session.scalar.assert_awaited_once()
+    sql = str(session.scalar.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO agents")
+    assert "ON CONFLICT (external_agent_id) DO UPDATE SET updated_at = now()" in sql
+    assert "RETURNING agents.id" in sql
+    assert await resolve_or_create_agent(session, "") is None
+
+
+@pytest.mark.asyncio
+async def test_raw_identifiers_are_normalized_before_dedup():
+    """Test that differently formatted copies of one phone/email collapse to one pair."""
+    session = _mock_session()
+
+    await resolve_or_create_person_org(
+        session,
+        phones=["+7 (912) 345-67-89", "8 912 345 67 89", "not a phone"],
+        emails=[" Ivan@Example.com", "ivan@example.com", "nope"],
+        person_names=[],
+        company_names=[],
+        default_region="RU",
+    )
+
+    _, params = session.execute.call_args_list[0].args
+    assert params == {"identifier_pairs": [("phone", "+79123456789"), ("email", "ivan@example.com")]}
+
+
+@pytest.mark.asyncio
+async def test_no_person_created_without_valid_identifiers():
+    """Test that only invalid phones/emails neither query nor create anything."""
+    session = _mock_session()
+
+    assert await resolve_or_create_person_org(session, ["123"], ["x"], ["Ivan"], []) == (None, None)
+
+    session.execute.assert_not_called()
+    session.scalar.assert_not_called()
@@ -0,0 +1,69 @@
+"""Tests for phone/email normalization utilities."""
+
+import pytest
+
+from backend.common.phone_utils import normalize_email, normalize_phone_e164
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("+1 (415) 555-2671", "+14155552671"),
+        ("415.555.2671", "+14155552671"),
+        ("1-415-555-2671", "+14155552671"),
+        ("  ++44 20 7946 0958 ", "+442079460958"),
+        ("(+7) 912 345-67-89", "+79123456789"),
+    ],
+)
+def test_normalize_phone_e164_formats(raw, expected):
+    """Test that common formatting variants normalize to E.164."""
+    assert normalize_phone_e164(raw) == expected
+
+
+def test_normalize_phone_e164_uses_default_country():
+    """Test that national-format numbers are resolved against the default region."""
+    assert normalize_phone_e164("8 (912) 345-67-89", default_country="RU") == "+79123456789"
+    # Same digits are not a valid US number and must not be guessed into E.164
+    assert normalize_phone_e164("89123456789") is None
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("79123456789", "+79123456789"),
+        ("442079460958", "+442079460958"),
+        ("4155552671", "+14155552671"),
+    ],
+)
+def test_normalize_phone_e164_without_plus(raw, expected):
+    """Test that international numbers missing their + are not dropped."""
+    assert normalize_phone_e164(raw) == expected
+
+
+def test_normalize_phone_e164_keeps_unknown_international_numbers():
+    """Test that +-prefixed numbers outside libphonenumber's metadata are kept as digits."""
+    assert normalize_phone_e164("+1234567890") == "+1234567890"
+    assert normalize_phone_e164("+1 234-567-890") == "+1234567890"
+    assert normalize_phone_e164("+12") is None
+
+
+@pytest.mark.parametrize("raw", ["", "   ", "+", "12345", "abc"])
+def test_normalize_phone_e164_invalid(raw):
+    """Test that empty, too-short and non-numeric input is rejected."""
+    assert normalize_phone_e164(raw) is None
+
+
+def test_normalize_email():
+    """Test email trimming, lowercasing and basic validation."""
+    assert normalize_email("  John.Doe@Example.COM ") == "john.doe@example.com"
+    assert normalize_email("not-an-email") is None
+    assert normalize_email("") is None
+
+
+def test_normalizers_log_rejections_on_cache_hits(caplog):
+    """Test that memoized rejections are still logged on every call."""
+    with caplog.at_level("WARNING", logger="backend.common.phone_utils"):
+        for _ in range(2):
+            assert normalize_phone_e164("12345") is None
+            assert normalize_email("not-an-email") is None
+    assert len(caplog.records) == 4
@@ -0,0 +1,225 @@
+"""Tests for Redis job storage helpers."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+import redis
+
+from backend.common import redis_utils
+from backend.common.models import JobMetadata, JobStatus, QueueMessage
+
+
+def _sample_job() -> JobMetadata:
+    return JobMetadata(
+        job_id="job-1",
+        audio_path="/data/job-1.wav",
+        status=JobStatus.stt_done,
+        created_at=datetime(2026, 1, 1, 12, 0, 0),
+        updated_at=datetime(2026, 1, 1, 12, 5, 0),
+        dummy_tags=["billing", "refund"],
+        delivered=True,
+        extra_meta={"source": "upload", "priority": 2},
+        stt_language="ru",
+        stt_segments=[{"start": 0.0, "end": 1.5, "text": "Привет", "speaker": "agent"}],
+        entities={"phones": ["+79123456789"]},
+    )
+
+
+def _legacy_hash() -> dict[str, str]:
+    """A job as written by the old per-field HSET layout."""
+    return {
+        "job_id": "job-2",
+        "audio_path": "/data/job-2.wav",
+        "status": "JobStatus.queued",
+        "created_at": "2026-01-01T12:00:00",
+        "updated_at": "2026-01-01T12:00:00",
+        "delivered": "False",
+        "stt_text": "None",
+        "dummy_tags": '["legacy"]',
+    }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = MagicMock()
+    monkeypatch.setattr(redis_utils, "_redis_client", client)
+    return client
+
+
+def test_create_job_and_get_round_trip(client):
+    """Test that a job written by create_job reads back unchanged via MGET."""
+    job = _sample_job()
+    redis_utils.create_job(job)
+
+    pipe = client.pipeline.return_value
+    key, blob = pipe.set.call_args.args
+    assert key == "job:job-1"
+    pipe.lpush.assert_called_once_with("jobs:list", "job-1")
+
+    client.mget.return_value = [blob]
+    assert redis_utils.get_job("job-1") == job
+    client.pipeline.return_value.hgetall.assert_not_called()
+
+
+def test_get_jobs_falls_back_to_legacy_hashes(client):
+    """Test that jobs still stored as hashes are decoded after MGET misses."""
+    job = _sample_job()
+    client.mget.return_value = [job.model_dump_json(), None, None]
+    client.pipeline.return_value.execute.return_value = [_legacy_hash(), {}]
+
+    jobs = redis_utils._get_jobs(client, ["job-1", "job-2", "missing"])
+
+    assert jobs[0] == job
+    assert jobs[1].job_id == "job-2"
+    assert jobs[1].status == JobStatus.queued
+    assert jobs[1].dummy_tags == ["legacy"]
+    assert jobs[1].stt_text is None
+    assert jobs[2] is None
+
+
+def _run_transaction(pipe):
+    def transaction(func, *watches):
+        func(pipe)
+    return transaction
+
+
+def test_update_job_merges_into_existing_blob(client):
+    """Test that update_job reads under WATCH, merges fields and rewrites the blob."""
+    job = _sample_job()
+    pipe = MagicMock()
+    pipe.mget.return_value = [job.model_dump_json()]
+    client.transaction.side_effect = _run_transaction(pipe)
+
+    redis_utils.update_job("job-1", status=JobStatus.done, delivered=False)
+
+    assert client.transaction.call_args.args[1] == "job:job-1"
+    pipe.multi.assert_called_once()
+    key, blob = pipe.set.call_args.args
+    assert key == "job:job-1"
+    updated = JobMetadata.model_validate_json(blob)
+    assert updated.status == JobStatus.done
+    assert updated.delivered is False
+    assert updated.stt_segments == job.stt_segments
+    assert updated.updated_at > job.updated_at
+
+
+def test_update_job_rewrites_legacy_hash_as_blob(client):
+    """Test that updating a hash-encoded job migrates it to the blob layout."""
+    pipe = MagicMock()
+    pipe.mget.return_value = [None]
+    pipe.type.return_value = "hash"
+    pipe.hgetall.return_value = _legacy_hash()
+    client.transaction.side_effect = _run_transaction(pipe)
+
+    redis_utils.update_job("job-2", stt_text="Привет")
+
+    pipe.get.assert_not_called()
+    data = orjson.loads(pipe.set.call_args.args[1])
+    assert data["stt_text"] == "Привет"
+    assert JobMetadata(**data).dummy_tags == ["legacy"]
+
+
+def test_update_jobs_bulk_writes_all_jobs_in_one_transaction(client):
+    """Test that bulk updates share one transaction and one updated_at timestamp."""
+    first, second = _sample_job(), _sample_job().model_copy(update={"job_id": "job-2"})
+    pipe = MagicMock()
+    pipe.mget.return_value = [first.model_dump_json(), second.model_dump_json()]
+    client.transaction.side_effect = _run_transaction(pipe)
+
+    redis_utils.update_jobs_bulk(
+        {"job-1": {"status": JobStatus.done}, "job-2": {"stt_error": "timeout"}}
+    )
+
+    client.transaction.assert_called_once()
+    assert client.transaction.call_args.args[1:] == ("job:job-1", "job:job-2")
+    pipe.mget.assert_called_once_with(["job:job-1", "job:job-2"])
+    written = [JobMetadata.model_validate_json(c.args[1]) for c in pipe.set.call_args_list]
+    assert [job.job_id for job in written] == ["job-1", "job-2"]
+    assert written[0].status == JobStatus.done
+    assert written[1].stt_error == "timeout"
+    assert written[0].updated_at == written[1].updated_at
+
+
+def test_update_and_get_job_returns_merged_job_without_extra_read(client):
+    """Test that the updated job comes back from the update's own WATCH read."""
+    job = _sample_job()
+    pipe = MagicMock()
+    pipe.mget.return_value = [job.model_dump_json()]
+    pipe.type.return_value = "none"
+    pipe.get.return_value = None
+    client.transaction.side_effect = _run_transaction(pipe)
+
+    updated = redis_utils.update_and_get_job("job-1", status=JobStatus.postprocess_in_progress)
+
+    assert updated.status == JobStatus.postprocess_in_progress
+    assert updated.stt_segments == job.stt_segments
+    client.mget.assert_not_called()
+    pipe.mget.return_value = [None]
+    assert redis_utils.update_and_get_job("missing", status=JobStatus.failed) is None
+
+
+@pytest.fixture
+def queue_client(client, monkeypatch):
+    monkeypatch.setattr(redis_utils, "_ready_queues", set())
+    client.type.return_value = "stream"
+    client.xautoclaim.return_value = ["0-0", [], []]
+    return client
+
+
+def test_enqueue_message_adds_to_stream_and_creates_group_once(queue_client):
+    """Test that enqueue_message XADDs the message and sets up the group only once."""
+    redis_utils.enqueue_message("queue:test", QueueMessage(job_id="job-1"))
+    redis_utils.enqueue_message("queue:test", QueueMessage(job_id="job-2"))
+
+    queue_client.xgroup_create.assert_called_once_with(
+        "queue:test", "workers", id="0", mkstream=True
+    )
+    fields = queue_client.xadd.call_args.args[1]
+    assert orjson.loads(fields["m"]) == {"job_id": "job-2", "audio_path": None}
+
+
+def test_ensure_queue_moves_legacy_list_into_stream(queue_client):
+    """Test that messages left in a pre-streams list are re-added to the stream."""
+    queue_client.type.return_value = "list"
+    legacy = QueueMessage(job_id="old").model_dump_json()
+    queue_client.pipeline.return_value.execute.return_value = [[legacy], 1]
+    queue_client.xgroup_create.side_effect = redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+
+    redis_utils._ensure_queue(queue_client, "queue:test")
+
+    queue_client.pipeline.return_value.delete.assert_called_once_with("queue:test")
+    queue_client.xadd.assert_called_once_with("queue:test", {"m": legacy})
+
+
+def test_pop_messages_reads_new_entries_with_delivery_ids(queue_client):
+    """Test that new stream entries are decoded and tagged for acknowledgement."""
+    queue_client.xreadgroup.return_value = [
+        ["queue:test", [("1-0", {"m": '{"job_id": "job-1"}'}), ("1-1", {"m": '{"job_id": "job-2"}'})]]
+    ]
+
+    messages = redis_utils.pop_messages("queue:test", timeout=5, count=2)
+
+    assert [(m.job_id, m.delivery_id) for m in messages] == [("job-1", "1-0"), ("job-2", "1-1")]
+    assert queue_client.xreadgroup.call_args.kwargs == {"count": 2, "block": 5000}
+    assert "delivery_id" not in messages[0].model_dump_json()
+
+
+def test_pop_messages_redelivers_stale_pending_entries_first(queue_client):
+    """Test that entries claimed from a dead consumer are returned without a new read."""
+    queue_client.xautoclaim.return_value = ["0-0", [("1-0", {"m": '{"job_id": "job-1"}'}), (None, None)], []]
+
+    messages = redis_utils.pop_messages("queue:test", timeout=5)
+
+    assert [m.delivery_id for m in messages] == ["1-0"]
+    queue_client.xreadgroup.assert_not_called()
+
+
+def test_ack_message_acks_and_deletes_entry(queue_client):
+    """Test that ack_message removes the entry from the PEL and the stream."""
+    redis_utils.ack_message("queue:test", QueueMessage(job_id="job-1", delivery_id="1-0"))
+
+    pipe = queue_client.pipeline.return_value
+    pipe.xack.assert_called_once_with("queue:test", "workers", "1-0")
+    pipe.xdel.assert_called_once_with("queue:test", "1-0")
@@ -1,8 +1,16 @@
 """Tests for the calls repository layer."""
 
 import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
-from backend.call_analytics_api.app.repos.calls import list_calls, get_call_details
+from backend.call_analytics_api.app.repos.calls import (
+    list_calls,
+    get_call_details,
+    paginate_calls_for_agent,
+)
 from backend.common.models_db import Call, DialogueTurn, CallSummary
 
 
@@ -108,4 +116,95 @@ async def test_get_call_details(async_db_session, sample_call, sample_dialogue_t
 async def test_get_call_details_not_found(async_db_session):
     """Test that get_call_details returns None for non-existent call."""
     result = await get_call_details(async_db_session, 999999)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def _paginate_db(*results):
+    """Mock session whose execute() returns the given results in order."""
+    db = AsyncMock()
+    db.execute.side_effect = list(results)
+    return db
+
+
+def _scalars_result(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+def _cursor_result(row):
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    return result
+
+
+def _sql(db, call_index):
+    statement = db.execute.call_args_list[call_index].args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_paginate_calls_for_agent_first_page_tops_up_with_undated():
+    """Test that dated calls come first and undated calls fill the rest of the page."""
+    dated, undated = [Call(id=5), Call(id=4)], [Call(id=9)]
+    db = _paginate_db(_scalars_result(dated), _scalars_result(undated))
+
+    page = await paginate_calls_for_agent(db, agent_id=1, limit=3)
+
+    assert [c.id for c in page] == [5, 4, 9]
+    dated_sql = _sql(db, 0)
+    assert "calls.started_at IS NOT NULL" in dated_sql
+    assert "ORDER BY calls.started_at DESC, calls.id DESC" in dated_sql
+    undated_sql = _sql(db, 1)
+    assert "calls.started_at IS NULL" in undated_sql
+    assert "ORDER BY calls.id DESC" in undated_sql
+
+
+@pytest.mark.asyncio
+async def test_paginate_calls_for_agent_full_page_skips_undated():
+    """Test that no undated query is issued when dated calls fill the page."""
+    db = _paginate_db(_scalars_result([Call(id=5), Call(id=4)]))
+
+    page = await paginate_calls_for_agent(db, agent_id=1, limit=2)
+
+    assert len(page) == 2
+    assert db.execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_paginate_calls_for_agent_dated_cursor_uses_row_comparison():
+    """Test that a dated cursor seeks with (started_at, id) < (cursor values)."""
+    cursor = SimpleNamespace(started_at=datetime(2026, 1, 1))
+    db = _paginate_db(_cursor_result(cursor), _scalars_result([Call(id=3)]))
+
+    page = await paginate_calls_for_agent(db, agent_id=1, before_id=4, limit=1)
+
+    assert [c.id for c in page] == [3]
+    cursor_sql = _sql(db, 0)
+    assert "calls.id = " in cursor_sql and "calls.agent_fk = " in cursor_sql
+    assert "(calls.started_at, calls.id) < (" in _sql(db, 1)
+
+
+@pytest.mark.asyncio
+async def test_paginate_calls_for_agent_undated_cursor_only_reads_undated():
+    """Test that a cursor without started_at continues within undated calls."""
+    db = _paginate_db(
+        _cursor_result(SimpleNamespace(started_at=None)),
+        _scalars_result([Call(id=2)]),
+    )
+
+    page = await paginate_calls_for_agent(db, agent_id=1, before_id=3, limit=5)
+
+    assert [c.id for c in page] == [2]
+    assert db.execute.call_count == 2
+    undated_sql = _sql(db, 1)
+    assert "calls.started_at IS NULL" in undated_sql
+    assert "calls.id < " in undated_sql
+
+
+@pytest.mark.asyncio
+async def test_paginate_calls_for_agent_unknown_cursor_returns_none():
+    """Test that a before_id from another agent (or missing) is not treated as undated."""
+    db = _paginate_db(_cursor_result(None))
+
+    assert await paginate_calls_for_agent(db, agent_id=1, before_id=99) is None
+    assert db.execute.call_count == 1
@@ -152,4 +152,183 @@ async def test_persist_to_database_materializes_fields(
     
     # Check that dashboard fields were materialized
     assert call_record.headline == "Product Inquiry"
-    assert call_record.duration_sec == 12  # Max end time from STT segments (12.3) rounded down
\ No newline at end of file
+    assert call_record.duration_sec == 12  # Max end time from STT segments (12.3) rounded down
+
+@pytest.mark.asyncio
+async def test_copy_dialogue_turns_uses_binary_copy(worker):
+    """Test that turns are COPYed in column order and the turn_index -> id map is rebuilt."""
+    import json
+    from unittest.mock import AsyncMock, MagicMock
+
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock()
+    session_conn = MagicMock()
+    session_conn.get_raw_connection = AsyncMock(
+        return_value=MagicMock(driver_connection=driver_connection)
+    )
+    id_result = MagicMock()
+    id_result.all.return_value = [(0, 101), (1, 102)]
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=session_conn)
+    session.execute = AsyncMock(return_value=id_result)
+
+    segments = [
+        {"start": 0.0, "end": 1.2, "text": "Здравствуйте", "channel": 0},
+        {"start": 1.3, "end": 2.0, "text": "Hi", "speaker": "customer"},
+    ]
+    turn_id_map = await worker._copy_dialogue_turns(session, 7, segments)
+
+    assert turn_id_map == {0: 101, 1: 102}
+    driver_connection.copy_records_to_table.assert_awaited_once()
+    call = driver_connection.copy_records_to_table.await_args
+    assert call.args == ("dialogue_turns_incoming",)
+    assert call.kwargs["columns"] == [
+        "call_id", "turn_index", "speaker", "channel",
+        "start_sec", "end_sec", "text", "raw_json", "content_hash",
+    ]
+    records = call.kwargs["records"]
+    assert records[0][:7] == (7, 0, "agent", 0, 0.0, 1.2, "Здравствуйте")
+    assert records[1][:7] == (7, 1, "customer", None, 1.3, 2.0, "Hi")
+    assert json.loads(records[0][7]) == segments[0]
+    assert len(records[0][8]) == 16 and records[0][8] != records[1][8]
+
+    statements = [str(c.args[0]) for c in session.execute.await_args_list]
+    assert statements[0].startswith("DELETE FROM dialogue_turns")
+    assert "dialogue_turns.turn_index >= " in statements[0]
+    assert statements[1].startswith("CREATE TEMPORARY TABLE dialogue_turns_incoming ON COMMIT DROP")
+    assert statements[2].startswith("INSERT INTO dialogue_turns (call_id, turn_index, ")
+    assert statements[2].endswith(
+        "WHERE dialogue_turns.content_hash IS DISTINCT FROM excluded.content_hash"
+    )
+    assert "dialogue_turns.turn_index, dialogue_turns.id" in statements[3]
+    assert "dialogue_turns.call_id = " in statements[3]
+
+
+@pytest.mark.asyncio
+async def test_copy_dialogue_turns_without_segments_only_clears_turns(worker):
+    """Test that an empty transcript deletes the call's turns and skips the COPY."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.connection = AsyncMock()
+
+    assert await worker._copy_dialogue_turns(session, 7, []) == {}
+    session.execute.assert_awaited_once()
+    session.connection.assert_not_called()
+
+
+def test_facts_are_added_without_a_flush(worker):
+    """Test that facts for all items are queued together and keyed for the upserts."""
+    from unittest.mock import MagicMock
+    from backend.common.models_db import Extraction
+
+    session = MagicMock()
+    extraction = Extraction(id=3, call_id=7)
+    items = [{"title": "Call back", "turn_index": 1, "text": "I'll call you"}, {"title": "Send invoice"}]
+
+    facts = worker._add_facts(session, extraction, "task", items, {1: 101})
+
+    assert [data for data, _ in facts] == items
+    session.add_all.assert_called_once()
+    session.flush.assert_not_called()
+    first = facts[0][1]
+    assert (first.call_id, first.extraction_id, first.turn_id) == (7, 3, 101)
+    assert first.raw_span_text == "I'll call you"
+    assert first.stable_key == worker._stable_key(call_id=7, fact_type="task", value=items[0])
+
+
+@pytest.mark.asyncio
+async def test_upsert_by_stable_key_is_one_insert_on_conflict(worker):
+    """Test that business objects are upserted per table in one statement returning ids."""
+    from unittest.mock import AsyncMock, MagicMock
+    from sqlalchemy.dialects import postgresql
+    from backend.common.models_db import Task
+
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(all=lambda: [("task:a", 11), ("task:b", 12)]))
+    rows = {
+        key: {"call_id": 7, "title": title, "status": "open", "stable_key": key}
+        for key, title in [("task:a", "Call back"), ("task:b", "Send invoice")]
+    }
+
+    ids = await worker._upsert_by_stable_key(session, Task, rows, ["title"])
+
+    assert ids == {"task:a": 11, "task:b": 12}
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO tasks")
+    assert (
+        "ON CONFLICT (call_id, stable_key) WHERE stable_key IS NOT NULL "
+        "DO UPDATE SET title = excluded.title, updated_at = now()"
+    ) in sql
+    assert sql.endswith("RETURNING tasks.stable_key, tasks.id")
+    assert await worker._upsert_by_stable_key(session, Task, {}, ["title"]) == {}
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_timestamp_defaults_bind_as_timestamptz_under_asyncpg(worker):
+    """Test that aware created_at/updated_at defaults bind as timestamptz, which asyncpg accepts."""
+    from unittest.mock import AsyncMock, MagicMock
+    from sqlalchemy import DateTime, insert
+    from sqlalchemy.dialects.postgresql import asyncpg
+    from backend.common.db import Base
+    from backend.common.models_db import Task
+
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(all=lambda: []))
+    rows = {"task:a": {"call_id": 7, "title": "Call back", "status": "open", "stable_key": "task:a"}}
+    await worker._upsert_by_stable_key(session, Task, rows, ["title"])
+
+    for stmt in (session.execute.await_args.args[0], insert(Call).values(external_job_id="job-1")):
+        sql = str(stmt.compile(dialect=asyncpg.dialect()))
+        assert "::TIMESTAMP WITH TIME ZONE" in sql
+        assert "WITHOUT TIME ZONE" not in sql
+
+    naive = [
+        f"{table.name}.{column.name}"
+        for table in Base.metadata.tables.values()
+        for column in table.columns
+        if isinstance(column.type, DateTime) and not column.type.timezone
+    ]
+    # date_of_birth is the only column migrated as plain timestamp
+    assert naive == ["people.date_of_birth"]
+
+
+def test_content_hash_ignores_pipeline_bookkeeping(worker):
+    """Test that status/updated_at changes keep the hash while payload changes alter it."""
+    from datetime import datetime
+
+    job = JobMetadata(
+        job_id="job-1",
+        status=JobStatus.summary_done,
+        audio_path="/test/audio.wav",
+        dummy_summary="Customer asked about billing.",
+        entities={"phones": ["+79123456789"]},
+    )
+    retried = job.model_copy(
+        update={"status": JobStatus.postprocess_in_progress, "updated_at": datetime(2030, 1, 1)}
+    )
+    changed = job.model_copy(update={"dummy_summary": "Customer asked about refunds."})
+
+    assert len(worker._content_hash(job)) == 32
+    assert worker._content_hash(retried) == worker._content_hash(job)
+    assert worker._content_hash(changed) != worker._content_hash(job)
+
+
+def test_entity_items_split_by_speaker_and_flat(worker):
+    """Test that both entity layouts yield dict items only, speaker-tagged when separated."""
+    separated = {
+        "agent": {"tasks": [{"title": "Call back"}, "junk"], "offers": None},
+        "customer": {"products": [{"name": "Router"}]},
+    }
+    tasks, offers, products = worker._entity_items(separated)
+    assert tasks == [{"title": "Call back", "mentioned_by": "agent"}]
+    assert offers == []
+    assert products == [{"name": "Router", "mentioned_by": "customer"}]
+
+    tasks, offers, products = worker._entity_items({"tasks": [{"title": "Send invoice"}, 3], "offers": None})
+    assert tasks == [{"title": "Send invoice"}]
+    assert (offers, products) == ([], [])
+    assert worker._entity_items(["not", "a", "dict"]) == ([], [], [])